@@ -79,6 +79,13 @@ uv add --dev pyinstaller
 print_info "Installing dependencies..."
 uv sync
 
+# The frozen app loads the precomputed kana tables, so they must match their source
+print_info "Checking generated kana tables..."
+if ! uv run python -m translation.generate_kana_tables --check; then
+    print_error "translation/kana_tables.py is out of date"
+    exit 1
+fi
+
 # Create PyInstaller spec file
 print_config "Creating PyInstaller configuration..."
 
@@ -1,13 +1,38 @@
+import importlib
 import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
+import threading
+from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QWidget
+from PyQt6.QtCore import QTimer
 
 from frontend.widgets.main_menu import MainMenuWidget
-from frontend.widgets.study_menu import StudyMenuWidget
-from frontend.widgets.progress import ProgressWidget
-from frontend.widgets.study_session import StudySessionWidget
-from frontend.widgets.progress_menu import ProgressMenuWidget
+
+# Imported on a background thread once the main menu is up, so the first visit to
+# a screen does not wait for NumPy or the kana tables.
+WARM_UP_MODULES = (
+    "numpy",
+    "translation.romaji_to_kana",
+    "frontend.widgets.study_menu",
+    "frontend.widgets.progress_menu",
+    "frontend.widgets.study_session",
+    "frontend.widgets.progress",
+)
+
+
+def warm_up(modules=WARM_UP_MODULES) -> None:
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass # The screen reports it when it is opened
+
 
 class MainWindow(QMainWindow):
+    """The app window: the main menu, plus each other screen once it is first shown.
+
+    Only the main menu is built up front. The other screens, and the modules they
+    import, are created on first navigation and kept in the stack afterwards.
+    """
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Benkyou")
@@ -15,21 +40,52 @@ class MainWindow(QMainWindow):
 
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
+        self._screens: dict[str, QWidget] = {}
 
         self.main_menu = MainMenuWidget(self.show_study_menu, self.show_progress_menu, self.close)
-        self.study_menu = StudyMenuWidget(self.show_main_menu, self.show_study_session)
-        self.progress_menu = ProgressMenuWidget(self.show_main_menu, self.show_progress_for_deck)
-        self.progress_screen = ProgressWidget(self.show_main_menu)
-        self.study_session = StudySessionWidget(self.show_study_menu)
-
         self.stacked_widget.addWidget(self.main_menu)
-        self.stacked_widget.addWidget(self.study_menu)
-        self.stacked_widget.addWidget(self.progress_menu)
-        self.stacked_widget.addWidget(self.progress_screen)
-        self.stacked_widget.addWidget(self.study_session)
 
         self.show_main_menu()
 
+    def _screen(self, name: str) -> QWidget:
+        if name not in self._screens:
+            screen = getattr(self, f"_build_{name}")()
+            self.stacked_widget.addWidget(screen)
+            self._screens[name] = screen
+        return self._screens[name]
+
+    def _build_study_menu(self) -> QWidget:
+        from frontend.widgets.study_menu import StudyMenuWidget
+        return StudyMenuWidget(self.show_main_menu, self.show_study_session, self.show_multi_deck_session)
+
+    def _build_progress_menu(self) -> QWidget:
+        from frontend.widgets.progress_menu import ProgressMenuWidget
+        return ProgressMenuWidget(self.show_main_menu, self.show_progress_for_deck)
+
+    def _build_progress_screen(self) -> QWidget:
+        from frontend.widgets.progress import ProgressWidget
+        return ProgressWidget(self.show_main_menu)
+
+    def _build_study_session(self) -> QWidget:
+        from frontend.widgets.study_session import StudySessionWidget
+        return StudySessionWidget(self.show_study_menu)
+
+    @property
+    def study_menu(self):
+        return self._screen("study_menu")
+
+    @property
+    def progress_menu(self):
+        return self._screen("progress_menu")
+
+    @property
+    def progress_screen(self):
+        return self._screen("progress_screen")
+
+    @property
+    def study_session(self):
+        return self._screen("study_session")
+
     def show_main_menu(self):
         self.stacked_widget.setCurrentWidget(self.main_menu)
 
@@ -47,14 +103,23 @@ class MainWindow(QMainWindow):
         self.study_session.start_study_session(deck_path, mode)
         self.stacked_widget.setCurrentWidget(self.study_session)
 
+    def show_multi_deck_session(self, deck_paths, mode):
+        self.study_session.start_multi_deck_session(deck_paths, mode)
+        self.stacked_widget.setCurrentWidget(self.study_session)
 
     def closeEvent(self, event):
-        if self.study_session.deck_manager is not None:
-            self.study_session.save_progress()
+        # Screens that were never opened have nothing to stop
+        for name in ("progress_screen", "study_session"):
+            if name in self._screens:
+                self._screens[name].deck_loader.cancel(wait=True)
+        if "study_session" in self._screens:
+            self._screens["study_session"].stop_autosave()
         event.accept()
 
 def run():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    # Runs once the event loop has painted the main menu
+    QTimer.singleShot(0, lambda: threading.Thread(target=warm_up, name="warm-up", daemon=True).start())
+    sys.exit(app.exec())
@@ -0,0 +1,155 @@
+import io
+import platform
+import queue
+import threading
+import wave
+from functools import lru_cache
+from typing import Optional, Protocol
+
+import numpy as np
+
+if platform.system().lower() == "windows":
+    import winsound
+
+SAMPLE_RATE = 44100
+# An ascending jingle: C4, E4, G4, A4
+JINGLE_FREQUENCIES = (262, 330, 392, 440)
+NOTE_DURATION = 0.15 # Seconds
+FADE_DURATION = 0.005 # Seconds of fade in and out per note, so notes start and end without a click
+
+
+def render_tone(frequency: float, duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """A sine tone with short linear fades at both ends."""
+    samples = int(sample_rate * duration)
+    tone = np.sin(2 * np.pi * frequency * np.arange(samples) / sample_rate)
+    fade = min(int(sample_rate * FADE_DURATION), samples // 2)
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade, endpoint=False)
+        tone[:fade] *= ramp
+        tone[samples - fade:] *= ramp[::-1]
+    return tone
+
+
+@lru_cache(maxsize=None)
+def jingle(sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """The reward jingle as one mono float32 buffer, rendered on first use."""
+    buffer = np.concatenate([render_tone(frequency, NOTE_DURATION, sample_rate) for frequency in JINGLE_FREQUENCIES])
+    buffer = (0.5 * buffer).astype(np.float32)
+    buffer.flags.writeable = False # Shared by every caller
+    return buffer
+
+
+def wav_bytes(buffer: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """A float buffer as an in-memory 16-bit mono WAV file."""
+    output = io.BytesIO()
+    with wave.open(output, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((np.clip(buffer, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+    return output.getvalue()
+
+
+class AudioSink(Protocol):
+    def play(self, buffer: np.ndarray) -> None: ... # Returns once the buffer has played
+
+
+class NullSink:
+    """Plays nothing; used when there is no audio device. Counts what it was given."""
+
+    def __init__(self):
+        self.played = 0
+
+    def play(self, buffer: np.ndarray) -> None:
+        self.played += 1
+
+
+class SoundDeviceSink:
+    """Writes buffers to one output stream that stays open for the life of the sink.
+
+    sounddevice is imported here rather than with this module, as importing it
+    initializes PortAudio; ``default_sink`` does that on the audio thread.
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE):
+        import sounddevice as sd
+        self.stream = sd.OutputStream(samplerate=sample_rate, channels=1, dtype="float32")
+        self.stream.start()
+
+    def play(self, buffer: np.ndarray) -> None:
+        self.stream.write(buffer.reshape(-1, 1))
+
+
+class WinsoundSink:
+    """Plays buffers with winsound, from WAV data converted once per buffer."""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._wav: dict[int, bytes] = {} # id of each buffer played to its WAV data
+
+    def play(self, buffer: np.ndarray) -> None:
+        if id(buffer) not in self._wav:
+            self._wav[id(buffer)] = wav_bytes(buffer, self.sample_rate)
+        winsound.PlaySound(self._wav[id(buffer)], winsound.SND_MEMORY)
+
+
+def default_sink() -> AudioSink:
+    """The best sink this machine supports, falling back to ``NullSink``."""
+    try:
+        if platform.system().lower() == "windows":
+            return WinsoundSink()
+        return SoundDeviceSink()
+    except Exception:
+        pass # sounddevice is not installed, or there is no output device
+    return NullSink()
+
+
+class AudioPlayer:
+    """Plays sounds on one long-lived worker thread, fed by a queue.
+
+    ``play`` returns immediately. At most one sound waits behind the one playing, so
+    a burst of requests plays each sound at most twice instead of queueing them all.
+    The sink is opened on the worker thread, so creating a player never blocks.
+    """
+
+    def __init__(self, sink: Optional[AudioSink] = None):
+        self.sink = sink
+        self._queue: queue.Queue[Optional[np.ndarray]] = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self._thread.start()
+
+    def play(self, buffer: np.ndarray) -> bool:
+        """Queue a buffer; returns False if it was dropped because one is already waiting."""
+        try:
+            self._queue.put_nowait(buffer)
+        except queue.Full:
+            return False
+        return True
+
+    def play_jingle(self) -> bool:
+        return self.play(jingle())
+
+    def close(self) -> None:
+        """Play what is queued, then stop the worker thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        if self.sink is None:
+            self.sink = default_sink()
+        while (buffer := self._queue.get()) is not None:
+            try:
+                self.sink.play(buffer)
+            except Exception:
+                pass # A sound failing to play never interrupts the session
+
+
+_shared_player: Optional[AudioPlayer] = None
+
+
+def shared_player() -> AudioPlayer:
+    """The app's audio player, started on first use."""
+    global _shared_player
+    if _shared_player is None:
+        _shared_player = AudioPlayer()
+    return _shared_player
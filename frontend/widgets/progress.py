@@ -1,18 +1,147 @@
-import os
-import csv
-import time
-import json
-from datetime import datetime, timedelta
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget, QPushButton, QScrollArea, QHBoxLayout, QLineEdit, QApplication
-from PyQt6.QtGui import QFont, QColor
-from PyQt6.QtCore import Qt, QTimer
-
-from spaced_repetition.card import Card
+from bisect import bisect_left
+from typing import Optional
+import numpy as np
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget, QPushButton, QLineEdit, QListView, QStyledItemDelegate
+from PyQt6.QtGui import QFont, QColor, QFontMetrics, QPainter, QPen
+from PyQt6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, QRectF, QSize, QAbstractProxyModel
+
 from spaced_repetition.card_data import CardData
-from utils.fuzzy_match import fuzzy_match
-import translation.romaji_to_kana as romkan
+from frontend.workers import DeckLoader
+from spaced_repetition.card_store import MAX_LEVEL, CardStore
+from spaced_repetition.clock import Clock, SystemClock
+from spaced_repetition.forecast import DueForecast
+from storage.deck_loader import deck_forecast
+from utils.search_index import SearchIndex
+
+CARD_ROLE = Qt.ItemDataRole.UserRole
+DUE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class WordListModel(QAbstractListModel):
+    """The cards of a deck, one row each, with whether each card is due."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cards: list[CardData] = []
+        self.due: list[bool] = []
+
+    def set_cards(self, cards: list[CardData], due: list[bool]):
+        self.beginResetModel()
+        self.cards = list(cards)
+        self.due = list(due)
+        self.endResetModel()
+
+    def append_cards(self, cards: list[CardData], due: list[bool]):
+        if not cards:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.cards), len(self.cards) + len(cards) - 1)
+        self.cards.extend(cards)
+        self.due.extend(due)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.cards)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cards[index.row()].japanese
+        if role == CARD_ROLE:
+            return self.cards[index.row()]
+        if role == DUE_ROLE:
+            return self.due[index.row()]
+        return None
+
+
+class WordFilterProxyModel(QAbstractProxyModel):
+    """Shows the source rows the search index returned, in deck order.
+
+    The rows are handed over as a sorted list, so filtering costs no per-row
+    callbacks and mapping an index is a list lookup or a bisection.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: list[int] | None = None # None shows every row
+        self.row_count = 0
+
+    def setSourceModel(self, source_model):
+        super().setSourceModel(source_model)
+        source_model.modelReset.connect(lambda: self.set_rows(None))
+        source_model.rowsAboutToBeInserted.connect(self._source_rows_about_to_be_inserted)
+        source_model.rowsInserted.connect(self._source_rows_inserted)
+
+    def set_rows(self, rows: list[int] | None):
+        self.beginResetModel()
+        self.rows = rows
+        if rows is not None:
+            self.row_count = len(rows)
+        elif self.sourceModel() is not None:
+            self.row_count = self.sourceModel().rowCount()
+        else:
+            self.row_count = 0
+        self.endResetModel()
+
+    def append_rows(self, rows: list[int]):
+        """Show more source rows, all after the ones already shown, without a reset."""
+        if self.rows is None or not rows:
+            return
+        self.beginInsertRows(QModelIndex(), self.row_count, self.row_count + len(rows) - 1)
+        self.rows = self.rows + rows
+        self.row_count = len(self.rows)
+        self.endInsertRows()
+
+    def _source_rows_about_to_be_inserted(self, parent, first, last):
+        # Unfiltered, source rows are shown as they arrive; filtered, the screen
+        # appends the new rows that match once it has searched them.
+        if self.rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _source_rows_inserted(self, parent, first, last):
+        if self.rows is None:
+            self.row_count += last - first + 1
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < self.row_count or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        return self.sourceModel().index(row if self.rows is None else self.rows[row], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self.rows is not None:
+            position = bisect_left(self.rows, row)
+            if position == len(self.rows) or self.rows[position] != row:
+                return QModelIndex()
+            row = position
+        return self.createIndex(row, 0)
+
+
+class WordDelegate(QStyledItemDelegate):
+    """Paints a card row: japanese, reading, english and the level indicators.
+
+    Rows of due cards alternate between white and a highlight color while the shared
+    pulse timer of the progress screen flips ``pulse_state``.
+    """
 
-class WordDisplayWidget(QWidget):
     LEVEL_COLORS = {
         0: "#808080",  # Gray
         1: "#ADAD85",  # Yellow-Gray
@@ -27,78 +156,116 @@ class WordDisplayWidget(QWidget):
         3: "Skilled",
         4: "Master",
     }
-
-    def __init__(self, word_data):
-        super().__init__()
-        self.word_data = word_data
-        self.is_pulsing = False
-        self.pulse_timer = QTimer(self)
-        self.pulse_timer.timeout.connect(self._toggle_pulse)
+    PULSE_COLOR = "#FFFACD" # Lemon Chiffon
+    MARGIN = 5
+    PADDING = 5
+    SPACING = 2
+    INDICATOR_SIZE = 15
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.pulse_state = False
-
-        self.setContentsMargins(5, 5, 5, 5)
-        self.setStyleSheet("border: 1px solid lightgray; border-radius: 5px; background-color: white; color: black;")
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(2)
-
-        japanese_label = QLabel(word_data.japanese)
-        japanese_font = QFont("Times New Roman", 18, QFont.Weight.Bold)
-        japanese_label.setFont(japanese_font)
-        layout.addWidget(japanese_label)
-
-        reading_label = QLabel(word_data.reading)
-        reading_font = QFont("Times New Roman", 14)
-        reading_label.setFont(reading_font)
-        layout.addWidget(reading_label)
-
-        english_label = QLabel(word_data.english)
-        english_font = QFont("Times New Roman", 14)
-        english_label.setFont(english_font)
-        layout.addWidget(english_label)
+        self.japanese_font = QFont("Times New Roman", 18, QFont.Weight.Bold)
+        self.reading_font = QFont("Times New Roman", 14)
+        self.english_font = QFont("Times New Roman", 14)
+        self.level_font = QFont("Times New Roman", 12)
+        self.line_heights = [QFontMetrics(font).height() for font in (self.japanese_font, self.reading_font, self.english_font)]
+        level_line_height = max(self.INDICATOR_SIZE, QFontMetrics(self.level_font).height())
+        self.row_height = 2 * (self.MARGIN + self.PADDING) + sum(self.line_heights) + level_line_height + 3 * self.SPACING
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height)
+
+    def paint(self, painter, option, index):
+        word_data = index.data(CARD_ROLE)
+        is_due = index.data(DUE_ROLE)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        box = QRectF(option.rect).adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        painter.setPen(QPen(QColor("lightgray"), 1))
+        painter.setBrush(QColor(self.PULSE_COLOR if is_due and self.pulse_state else "white"))
+        painter.drawRoundedRect(box, 5, 5)
+
+        painter.setPen(QColor("black"))
+        x = box.left() + self.PADDING
+        y = box.top() + self.PADDING
+        width = box.width() - 2 * self.PADDING
+        for text, font, height in zip((word_data.japanese, word_data.reading, word_data.english),
+                                      (self.japanese_font, self.reading_font, self.english_font),
+                                      self.line_heights):
+            painter.setFont(font)
+            painter.drawText(QRectF(x, y, width, height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+            y += height + self.SPACING
 
         # Level display
-        level_layout = QHBoxLayout()
-        level_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
         level = word_data.level
+        painter.setPen(QPen(QColor("gray"), 1))
         for i in range(4):
-            level_indicator = QLabel()
-            level_indicator.setFixedSize(15, 15)
             if i <= level:
-                color = self.LEVEL_COLORS.get(level, "#FFFFFF") # Use the actual level's color
-                level_indicator.setStyleSheet(f"background-color: {color}; border: 1px solid gray; border-radius: 7px;")
+                painter.setBrush(QColor(self.LEVEL_COLORS.get(level, "#FFFFFF"))) # Use the actual level's color
             else:
-                level_indicator.setStyleSheet("background-color: lightgray; border: 1px solid gray; border-radius: 7px;")
-            level_layout.addWidget(level_indicator)
-        
-        level_text_label = QLabel(self.LEVEL_TEXTS.get(level, "Unknown"))
-        level_text_label.setFont(QFont("Times New Roman", 12))
-        level_layout.addWidget(level_text_label)
-
-        layout.addLayout(level_layout)
-
-    def set_pulsing(self, enable):
-        if enable and not self.is_pulsing:
-            self.is_pulsing = True
-            self.pulse_timer.start(500) # Toggle every 500ms
-        elif not enable and self.is_pulsing:
-            self.is_pulsing = False
-            self.pulse_timer.stop()
-            self.setStyleSheet("border: 1px solid lightgray; border-radius: 5px; background-color: white; color: black;")
-
-    def _toggle_pulse(self):
-        if self.pulse_state:
-            self.setStyleSheet("border: 1px solid lightgray; border-radius: 5px; background-color: white; color: black;")
-        else:
-            self.setStyleSheet("border: 1px solid lightgray; border-radius: 5px; background-color: #FFFACD; color: black;") # Lemon Chiffon
-        self.pulse_state = not self.pulse_state
+                painter.setBrush(QColor("lightgray"))
+            painter.drawEllipse(QRectF(x, y, self.INDICATOR_SIZE, self.INDICATOR_SIZE))
+            x += self.INDICATOR_SIZE + self.SPACING
+
+        painter.setPen(QColor("black"))
+        painter.setFont(self.level_font)
+        painter.drawText(QRectF(x + self.SPACING, y, width, self.INDICATOR_SIZE),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         self.LEVEL_TEXTS.get(level, "Unknown"))
+        painter.restore()
+
+class ForecastHistogram(QWidget):
+    """Bar chart of how many cards fall due on each of the coming days."""
+
+    BAR_COLOR = "#6495ED" # Cornflower Blue
+    MARGIN = 5
+    LABEL_HEIGHT = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.counts = np.zeros(0, dtype=int)
+        self.label_font = QFont("Times New Roman", 10)
+        self.setMinimumHeight(100)
+
+    def set_counts(self, counts):
+        self.counts = np.asarray(counts)
+        self.update()
+
+    def paintEvent(self, event):
+        if not len(self.counts):
+            return
+        painter = QPainter(self)
+        painter.setFont(self.label_font)
+        area = QRectF(self.rect()).adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        bar_width = area.width() / len(self.counts)
+        chart_height = area.height() - 2 * self.LABEL_HEIGHT
+        peak = max(int(self.counts.max()), 1)
+
+        for day, count in enumerate(self.counts):
+            x = area.left() + day * bar_width
+            height = chart_height * int(count) / peak
+            bar_top = area.top() + self.LABEL_HEIGHT + chart_height - height
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(self.BAR_COLOR))
+            painter.drawRect(QRectF(x + 1, bar_top, bar_width - 2, height))
+
+            painter.setPen(QColor("black"))
+            painter.drawText(QRectF(x, bar_top - self.LABEL_HEIGHT, bar_width, self.LABEL_HEIGHT),
+                             Qt.AlignmentFlag.AlignCenter, str(int(count)))
+            painter.drawText(QRectF(x, area.bottom() - self.LABEL_HEIGHT, bar_width, self.LABEL_HEIGHT),
+                             Qt.AlignmentFlag.AlignCenter, "Today" if day == 0 else f"+{day}")
+        painter.end()
 
 class ProgressWidget(QWidget):
-    def __init__(self, back_callback):
+    FORECAST_DAYS = 14
+
+    def __init__(self, back_callback, clock: Optional[Clock] = None):
         super().__init__()
         self.back_callback = back_callback
+        self.clock = clock if clock is not None else SystemClock()
 
         main_layout = QVBoxLayout(self)
         main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -128,131 +295,97 @@ class ProgressWidget(QWidget):
         self.stats_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         main_layout.addWidget(self.stats_label)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        content_widget = QWidget()
-        self.words_layout = QVBoxLayout(content_widget)
-        self.words_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scroll_area.setWidget(content_widget)
-        main_layout.addWidget(self.scroll_area)
+        # Reviews falling due on each of the next days
+        self.forecast_histogram = ForecastHistogram(self)
+        main_layout.addWidget(self.forecast_histogram)
+
+        # Only the rows in view are painted, so decks of any size load quickly
+        self.word_model = WordListModel(self)
+        self.proxy_model = WordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.word_model)
+        self.word_delegate = WordDelegate(self)
+        self.word_view = QListView()
+        self.word_view.setModel(self.proxy_model)
+        self.word_view.setItemDelegate(self.word_delegate)
+        self.word_view.setUniformItemSizes(True)
+        self.word_view.setLayoutMode(QListView.LayoutMode.Batched) # Lay out big decks between events
+        self.word_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.word_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        main_layout.addWidget(self.word_view)
+
+        # One timer pulses every due card
+        self.pulse_timer = QTimer(self)
+        self.pulse_timer.timeout.connect(self._toggle_pulse)
 
         back_button = QPushButton("Back")
         back_button.setObjectName('back_button')
-        back_button.clicked.connect(back_callback)
+        back_button.clicked.connect(self._go_back)
         main_layout.addWidget(back_button)
 
-        self.all_loaded_word_data = [] # Store all loaded word data
-        self.all_word_widgets = [] # Store all WordDisplayWidget instances
+        self.search_index = SearchIndex([])
+        self.level_histogram = np.zeros(MAX_LEVEL + 1, dtype=int)
+        self.due_cards = 0
+        self.forecast = DueForecast()
+
+        # Decks are parsed on a worker thread and shown batch by batch
+        self.deck_loader = DeckLoader(self)
+        self.deck_loader.batch_loaded.connect(self._add_cards)
+        self.deck_loader.finished.connect(self.loading_label.hide)
 
     def load_deck(self, deck_path):
-        # Show loading indicator
-        self.loading_label.show()
-        self.search_input.hide()
-        self.stats_label.hide()
-        self.scroll_area.hide()
-        QApplication.processEvents() # Process events to update UI
-
-        # Clear existing widgets
-        for widget in self.all_word_widgets:
-            widget.deleteLater()
-        self.all_word_widgets = []
-        self.all_loaded_word_data = []
-
-        deck_name = os.path.splitext(os.path.basename(deck_path))[0]
-        progress_files_path = os.path.join(os.path.dirname(__file__), '..', '..', 'progress_files')
-        deck_json_path = os.path.join(progress_files_path, f"{deck_name}.json")
-
-        all_cards = []
-        progress_data = {}
-        if os.path.exists(deck_json_path):
-            with open(deck_json_path, 'r', encoding='utf-8') as f:
-                progress_list = json.load(f)
-                progress_data = {item['japanese']: item for item in progress_list}
-
-        with open(deck_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 3:
-                    japanese, reading, english = row
-                    card_data_from_progress = progress_data.get(japanese)
-                    if card_data_from_progress:
-                        card = Card.from_dict(card_data_from_progress["card"])
-                        level = card.level
-                        last_reviewed = card_data_from_progress.get("last_reviewed_time")
-                    else:
-                        card = Card()
-                        level = 0
-                        last_reviewed = None
-                    
-                    word_data = CardData(card=card, japanese=japanese, english=english, reading=reading, level=level, last_reviewed_time=last_reviewed)
-                    all_cards.append(word_data)
-        
-        current_timestamp = time.time()
-        
-        total_cards = len(all_cards)
-        learned_cards = 0
-        due_cards = 0
-        level_distribution = {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}
-
-        for word_data in all_cards:
-            word_display_widget = WordDisplayWidget(word_data)
-            
-            card = word_data.card
-            last_reviewed = word_data.last_reviewed_time
-
-            is_due = False
-            if card.status == "learning" and card.step == 0: # New card, unlearned
-                is_due = True
-            elif last_reviewed is not None and card.interval is not None:
-                due_time = last_reviewed + card.interval.total_seconds()
-                if current_timestamp >= due_time:
-                    is_due = True
-            
-            if is_due:
-                word_display_widget.set_pulsing(True)
-                due_cards += 1
-            
-            self.all_loaded_word_data.append(word_data)
-            self.all_word_widgets.append(word_display_widget)
-            self.words_layout.addWidget(word_display_widget)
-
-            # Update statistics
-            level = word_data.level
-            if level > 3 or level < 0:
-                learned_cards += 1
-            if level == -1:
-                level = max(level_distribution.keys())
-            level_distribution[level] += 1
-        
+        """Show the first batch of the deck now and the rest as the loader streams it in."""
+        self.word_model.set_cards([], [])
+        self.search_index = SearchIndex([])
+        self._filter_cards(self.search_input.text())
+        self.level_histogram = np.zeros(MAX_LEVEL + 1, dtype=int)
+        self.due_cards = 0
+        self.pulse_timer.stop()
+
+        first_batch = self.deck_loader.load(deck_path)
+        self.forecast = deck_forecast(deck_path) # Filled by the loader as it parses
+        self._add_cards(first_batch)
+        # The loading label stays up until the last batch has arrived
+        self.loading_label.setVisible(self.deck_loader.is_loading())
+
+    def _add_cards(self, cards):
+        current_timestamp = self.clock.now()
+        card_store = CardStore.from_card_data(cards)
+        due_mask = card_store.due_mask(current_timestamp)
+
+        self.word_model.append_cards(cards, due_mask.tolist())
+        # Only the new cards are searched; the rows already shown stay put
+        self.proxy_model.append_rows(self.search_index.add_cards(cards))
+        self.level_histogram += card_store.level_histogram()
+        self.due_cards += int(due_mask.sum())
+        self.forecast_histogram.set_counts(self.forecast.histogram(current_timestamp, self.FORECAST_DAYS))
+        if self.due_cards and not self.pulse_timer.isActive():
+            self.pulse_timer.start(500) # Toggle every 500ms
+
+        self._update_stats()
+
+    def _update_stats(self):
+        total_cards = self.word_model.rowCount()
+        learned_cards = int(self.level_histogram[4:].sum())
+        level_distribution = {level: int(count) for level, count in enumerate(self.level_histogram)}
+
         stats_text = f"Total Cards: {total_cards}\n"
         stats_text += f"Learned Cards: {learned_cards}\n"
-        stats_text += f"Cards Due: {due_cards}\n"
+        stats_text += f"Cards Due: {self.due_cards}\n"
         stats_text += "Level Distribution:\n"
         for level, count in level_distribution.items():
-            stats_text += f"  Level {level} ({WordDisplayWidget.LEVEL_TEXTS.get(level, 'Unknown')}): {count}\n"
-        
+            stats_text += f"  Level {level} ({WordDelegate.LEVEL_TEXTS.get(level, 'Unknown')}): {count}\n"
+
         self.stats_label.setText(stats_text)
 
-        # Hide loading indicator and show content
+    def _go_back(self):
+        self.deck_loader.cancel()
         self.loading_label.hide()
-        self.search_input.show()
-        self.stats_label.show()
-        self.scroll_area.show()
-        QApplication.processEvents() # Process events to update UI
+        self.back_callback()
 
     def _filter_cards(self, query):
-        for i, word_data in enumerate(self.all_loaded_word_data):
-            word_widget = self.all_word_widgets[i]
-            
-            japanese = word_data.japanese
-            reading = word_data.reading
-            english = word_data.english
-
-            if fuzzy_match(query, japanese) or \
-               fuzzy_match(query, reading) or \
-               fuzzy_match(query, english) or \
-               fuzzy_match(romkan.to_kana(query), reading) or \
-               fuzzy_match(romkan.to_hiragana(query), reading):
-                word_widget.show()
-            else:
-                word_widget.hide()
\ No newline at end of file
+        matches = self.search_index.search(query)
+        self.proxy_model.set_rows(matches if query else None)
+
+    def _toggle_pulse(self):
+        self.word_delegate.pulse_state = not self.word_delegate.pulse_state
+        self.word_view.viewport().update()
@@ -1,11 +1,12 @@
 import os
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget, QPushButton, QGroupBox, QRadioButton
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QGroupBox, QRadioButton, QCheckBox
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
 class StudyMenuWidget(QWidget):
-    def __init__(self, back_callback, study_deck_callback):
+    def __init__(self, back_callback, study_deck_callback, study_decks_callback=None):
         super().__init__()
+        self.deck_checkboxes = {}
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -20,10 +21,24 @@ class StudyMenuWidget(QWidget):
         for file_name in os.listdir(self.vocab_path):
             if file_name.endswith('.csv'):
                 deck_name = os.path.splitext(file_name)[0]
+                deck_layout = QHBoxLayout()
+                checkbox = QCheckBox()
+                checkbox.setObjectName(f'deck_checkbox_{deck_name}')
+                checkbox.toggled.connect(self._update_selection)
+                self.deck_checkboxes[os.path.join(self.vocab_path, file_name)] = checkbox
+                deck_layout.addWidget(checkbox)
                 button = QPushButton(deck_name)
                 button.setObjectName(f'deck_button_{deck_name}')
                 button.clicked.connect(lambda checked, f=file_name: self.on_deck_selected(os.path.join(self.vocab_path, f)))
-                layout.addWidget(button)
+                deck_layout.addWidget(button)
+                layout.addLayout(deck_layout)
+
+        # Ticked decks are studied together in one session
+        self.study_selected_button = QPushButton("Study Selected Decks")
+        self.study_selected_button.setObjectName('study_selected_button')
+        self.study_selected_button.setEnabled(False)
+        self.study_selected_button.clicked.connect(self.on_decks_selected)
+        layout.addWidget(self.study_selected_button)
 
         mode_groupbox = QGroupBox("Quiz Mode")
         mode_layout = QVBoxLayout()
@@ -46,12 +61,23 @@ class StudyMenuWidget(QWidget):
         layout.addWidget(back_button)
 
         self.study_deck_callback = study_deck_callback
+        self.study_decks_callback = study_decks_callback
+        self.study_selected_button.setVisible(study_decks_callback is not None)
 
-    def on_deck_selected(self, deck_path):
+    def _selected_mode(self):
         if self.eng_to_jap_radio.isChecked():
-            mode = "eng_to_jap"
+            return "eng_to_jap"
         elif self.jap_to_eng_radio.isChecked():
-            mode = "jap_to_eng"
+            return "jap_to_eng"
         else:
-            mode = "mixed"
-        self.study_deck_callback(deck_path, mode)
\ No newline at end of file
+            return "mixed"
+
+    def _update_selection(self):
+        self.study_selected_button.setEnabled(any(checkbox.isChecked() for checkbox in self.deck_checkboxes.values()))
+
+    def on_deck_selected(self, deck_path):
+        self.study_deck_callback(deck_path, self._selected_mode())
+
+    def on_decks_selected(self):
+        deck_paths = [deck_path for deck_path, checkbox in self.deck_checkboxes.items() if checkbox.isChecked()]
+        self.study_decks_callback(deck_paths, self._selected_mode())
\ No newline at end of file
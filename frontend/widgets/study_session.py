@@ -1,30 +1,95 @@
-import csv
 import os
 import sys
-import json
-import random
-import time
-import threading
-import platform
-import numpy as np
+from functools import partial
+from typing import Optional
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QLineEdit, QFrame
-from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt, QTimer
-
-if platform.system().lower() == "windows":
-    import winsound
-
-try:
-    import sounddevice as sd
-    SOUNDDEVICE_AVAILABLE = True
-except ImportError:
-    SOUNDDEVICE_AVAILABLE = False
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtCore import QPropertyAnimation, QRectF, Qt, QTimer, pyqtProperty
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-from spaced_repetition.card import Card
 from spaced_repetition.card_data import CardData
-import translation.romaji_to_kana as romkan
+from spaced_repetition.clock import Clock, SystemClock
+from frontend.audio import AudioPlayer, shared_player
+from frontend.workers import DeckLoader
+from translation.kana_input import IncrementalKanaConverter, to_kana_mixed_case
 from spaced_repetition.deck import Deck
+from spaced_repetition.multi_deck import MultiDeck, MultiDeckProgress
+from spaced_repetition.study_session import StudySession
+from storage.autosave import AutosaveWorker
+from storage.deck_loader import deck_forecast, iter_deck_batches, mark_progress_saved
+from storage.progress_store import open_progress_store
+
+class CardFrame(QFrame):
+    """The frame around the question, painting its own border instead of using a stylesheet.
+
+    ``border_color`` is the level color, or None for no border. ``pulse`` animates the
+    ``pulseColor`` Qt property; while it is valid it replaces the border with a thicker
+    rounded one. Changing either, and every animation frame, costs one repaint.
+    """
+
+    BORDER_WIDTH = 3
+    PULSE_WIDTH = 5
+    PULSE_RADIUS = 10
+    PULSE_BACKGROUND = QColor(255, 255, 255, 25)
+    PULSE_DURATION = 1000 # Milliseconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        margin = self.PULSE_WIDTH
+        self.setContentsMargins(margin, margin, margin, margin)
+        self._border_color: Optional[QColor] = None
+        self._pulse_color = QColor()
+
+        # Gold fading in over the first half, then green fading out
+        self.pulse_animation = QPropertyAnimation(self, b"pulseColor", self)
+        self.pulse_animation.setDuration(self.PULSE_DURATION)
+        self.pulse_animation.setKeyValueAt(0.0, QColor(255, 215, 0, 100))
+        self.pulse_animation.setKeyValueAt(0.5, QColor(255, 215, 0, 255))
+        self.pulse_animation.setKeyValueAt(0.501, QColor(0, 255, 0, 255))
+        self.pulse_animation.setKeyValueAt(1.0, QColor(0, 255, 0, 100))
+        self.pulse_animation.finished.connect(self._end_pulse)
+
+    def pulse(self) -> None:
+        """Play the reward pulse, restarting it if it is running."""
+        self.pulse_animation.stop()
+        self.pulse_animation.start()
+
+    def _end_pulse(self) -> None:
+        self.set_pulse_color(QColor())
+
+    def border_color(self) -> Optional[QColor]:
+        return self._border_color
+
+    def set_border_color(self, color: Optional[QColor]) -> None:
+        if color != self._border_color:
+            self._border_color = color
+            self.update()
+
+    def get_pulse_color(self) -> QColor:
+        return self._pulse_color
+
+    def set_pulse_color(self, color: QColor) -> None:
+        self._pulse_color = QColor(color)
+        self.update()
+
+    pulseColor = pyqtProperty(QColor, fget=get_pulse_color, fset=set_pulse_color)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self._pulse_color.isValid():
+            width, radius = self.PULSE_WIDTH, self.PULSE_RADIUS
+            painter.setBrush(self.PULSE_BACKGROUND)
+            color = self._pulse_color
+        elif self._border_color is not None:
+            width, radius = self.BORDER_WIDTH, 0
+            color = self._border_color
+        else:
+            return
+        painter.setPen(QPen(color, width))
+        inset = width / 2
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(inset, inset, -inset, -inset), radius, radius)
+
 
 class StudySessionWidget(QWidget):
     LEVEL_COLORS = {
@@ -34,35 +99,43 @@ class StudySessionWidget(QWidget):
         3: "#00FF00",  # Green
     }
 
-    current_card: Card
-    deck_manager: Deck
-    deck_path: str
-    mode: str
+    session: StudySession
     current_question_is_japanese: bool
-    previous_question_correct: int = 0 # 1 or -1 unless just initialized
 
-    def __init__(self, back_callback):
+    def __init__(self, back_callback, clock: Optional[Clock] = None, seed: int = 0,
+                 audio_player: Optional[AudioPlayer] = None):
         super().__init__()
         self.back_callback = back_callback
-        self.deck_manager = Deck()
-        self.current_card = None # Store the current card being studied
-        self.deck_path = None
-        self.mode = None
+        self.audio_player = audio_player # The app's shared player unless given
+        self.clock = clock if clock is not None else SystemClock()
+        self.seed = seed # Shuffle seed of the sessions started here, e.g. shuffle.daily_seed
+        self.session = StudySession(clock=self.clock, seed=self.seed)
         self.current_question_is_japanese = False
-        
-        
-        # Initialize animation properties
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self._update_animation)
-        self.animation_phase = 0
-        self.original_style = ""
+        self.kana_converter = IncrementalKanaConverter()
+
+        # The first cards can be studied while the rest of the deck is parsed
+        self.deck_loader = DeckLoader(self)
+        self.deck_loader.batch_loaded.connect(self._on_batch_loaded)
+
+        # Answers are written to disk in batches on background threads
+        self.autosave_workers: list[AutosaveWorker] = []
+
+        # When only waiting cards are left, one timer wakes the session as the first falls due
+        self.wake_timer = QTimer(self)
+        self.wake_timer.setSingleShot(True)
+        self.wake_timer.setTimerType(Qt.TimerType.PreciseTimer) # Coarse timers may fire up to 5% late
+        self.wake_timer.timeout.connect(self.next_card)
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.timeout.connect(self._update_countdown)
+
+        # Border colors are parsed once, not on every card
+        self.level_colors = {level: QColor(color) for level, color in self.LEVEL_COLORS.items()}
+        self.default_level_color = QColor("#FFFFFF")
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.card_frame = QFrame()
-        self.card_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        self.card_frame.setLineWidth(3)
+        self.card_frame = CardFrame()
         card_layout = QVBoxLayout(self.card_frame)
         
         self.question_label = QLabel("")
@@ -98,7 +171,7 @@ class StudySessionWidget(QWidget):
         layout.addWidget(self.continue_button)
 
         self.back_button = QPushButton("Back to Menu")
-        self.back_button.clicked.connect(lambda: (self.save_progress(), self.back_callback()))
+        self.back_button.clicked.connect(self._go_back)
         layout.addWidget(self.back_button)
 
         self.answer_input.textChanged.connect(self.on_text_changed)
@@ -108,195 +181,102 @@ class StudySessionWidget(QWidget):
         # Start the reward animation immediately
         self._start_reward_animation()
         
-        # Play jingle in a separate thread so it doesn't block the animation
-        threading.Thread(target=self._play_jingle, daemon=True).start()
-
-    def _generate_tone(self, frequency: float, duration: float, sample_rate: int = 44100) -> np.ndarray:
-        """Generate a sine wave tone with the specified frequency and duration."""
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        return np.sin(2 * np.pi * frequency * t)
-
-    def _play_jingle(self) -> None:
-        """Play a pleasant jingle using platform-specific sound function."""
-        try:
-            system = platform.system().lower()
-            if system == "windows":
-                self._play_jingle_windows()
-            elif system == "linux":
-                self._play_jingle_linux()
-            elif system == "darwin":  # macOS
-                self._play_jingle_mac()
-            else:
-                # Fallback to Windows method for unknown systems
-                self._play_jingle_windows()
-        except:
-            pass
-
-    def _play_jingle_windows(self) -> None:
-        """Play a pleasant jingle on Windows using winsound."""
-        # Play a faster ascending jingle: C-E-G (do-mi-sol)
-        # C4 = 261.63 Hz, E4 = 329.63 Hz, G4 = 392.00 Hz
-        winsound.Beep(262, 150)  # C4 - faster
-        winsound.Beep(330, 150)  # E4 - faster
-        winsound.Beep(392, 150)  # G4 - slightly longer but still faster
-        winsound.Beep(440, 150)  # A4 - slightly longer but still faster
-
-    def _play_jingle_linux(self) -> None:
-        """Play a pleasant jingle on Linux using sounddevice."""
-        if not SOUNDDEVICE_AVAILABLE:
-            return
-        
-        # Play a faster ascending jingle: C-E-G (do-mi-sol)
-        # C4 = 261.63 Hz, E4 = 329.63 Hz, G4 = 392.00 Hz, A4 = 440.00 Hz
-        frequencies = [262, 330, 392, 440]
-        duration = 0.15  # 150ms
-        
-        for freq in frequencies:
-            tone = self._generate_tone(freq, duration)
-            sd.play(tone, samplerate=44100)
-            sd.wait()  # Wait for the tone to finish playing
-
-    def _play_jingle_mac(self) -> None:
-        """Play a pleasant jingle on macOS using sounddevice."""
-        if not SOUNDDEVICE_AVAILABLE:
-            return
-        
-        # Play a faster ascending jingle: C-E-G (do-mi-sol)
-        # C4 = 261.63 Hz, E4 = 329.63 Hz, G4 = 392.00 Hz, A4 = 440.00 Hz
-        frequencies = [262, 330, 392, 440]
-        duration = 0.15  # 150ms
-        
-        for freq in frequencies:
-            tone = self._generate_tone(freq, duration)
-            sd.play(tone, samplerate=44100)
-            sd.wait()  # Wait for the tone to finish playing
+        # The jingle is pre-rendered and played on the audio worker thread
+        if self.audio_player is None:
+            self.audio_player = shared_player()
+        self.audio_player.play_jingle()
 
     def _start_reward_animation(self) -> None:
-        """Start a subtle pulsing/fireworks animation effect."""
-        self.original_style = self.card_frame.styleSheet()
-        self.animation_phase = 0
-        self.animation_timer.start(50)  # Update every 50ms for smooth animation
-
-    def _update_animation(self) -> None:
-        """Update the reward animation frame."""
-        self.animation_phase += 1
-        
-        if self.animation_phase > 20:  # Animation duration: 1 second (20 * 50ms)
-            self.animation_timer.stop()
-            self.card_frame.setStyleSheet(self.original_style)
-            return
-        
-        # Create a pulsing effect with color changes
-        progress = self.animation_phase / 20.0
-        
-        # Create a subtle pulsing effect with golden colors
-        if progress < 0.5:
-            # First half: pulse in with golden color
-            intensity = progress * 2
-            alpha = int(100 + intensity * 155)  # 100-255 alpha
-            color = f"rgba(255, 215, 0, {alpha})"  # Gold color
-        else:
-            # Second half: pulse out with green color
-            intensity = (1.0 - progress) * 2
-            alpha = int(100 + intensity * 155)  # 100-255 alpha
-            color = f"rgba(0, 255, 0, {alpha})"  # Green color
-        
-        # Apply the animated style
-        animated_style = f"""
-            border: 5px solid {color};
-            background-color: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-        """
-        self.card_frame.setStyleSheet(animated_style)
+        """Pulse the card frame's border; each frame of the pulse is one repaint."""
+        self.card_frame.pulse()
 
     def _convert_mixed_case_to_kana(self, text: str) -> str:
         """Convert text to kana with mixed case handling.
         """
-        if not text:
-            return ""
-        
-        
-        # Find segment boundaries where case changes
-        result = ""
-        is_current_segment_upper = None
-        current_start = 0
-        
-        for i, char in enumerate(text):
-            char_case = char.isupper()
-            if is_current_segment_upper is None:
-                is_current_segment_upper = char_case
-            elif char_case != is_current_segment_upper:
-                # Case changed, save current segment
-                if is_current_segment_upper:
-                    result += romkan.to_katakana(text[current_start:i])
-                else:
-                    result += romkan.to_hiragana(text[current_start:i])
-                current_start = i
-                is_current_segment_upper = char_case
-
-        if current_start < len(text) or len(result) < len(text):
-            if is_current_segment_upper:
-                result += romkan.to_katakana(text[current_start:i + 1])
-            else:
-                result += romkan.to_hiragana(text[current_start:i + 1])
-        
-        return result
+        return to_kana_mixed_case(text)
 
     def on_text_changed(self, text):
         if not self.current_question_is_japanese:
-            kana = self._convert_mixed_case_to_kana(text)
+            kana = self.kana_converter.convert(text)
             self.kana_preview_label.setText(kana)
         else:
             self.kana_preview_label.setText("")
 
+    @property
+    def deck_manager(self) -> Deck | MultiDeck:
+        return self.session.deck
+
+    @property
+    def current_card(self) -> Optional[CardData]:
+        return self.session.current.card_data if self.session.current is not None else None
+
     def start_study_session(self, deck_path, mode):
-        self.deck_manager = Deck()
-        self.deck_path = deck_path
-        self.mode = mode
-        
-        progress_data = self._load_progress()
-        
-        with open(deck_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 3:
-                    japanese, reading, english = row
-                    card_data_from_progress = progress_data.get(japanese)
-                    if card_data_from_progress:
-                        card = Card.from_dict(card_data_from_progress["card"])
-                        level = card.level
-                        last_reviewed = card_data_from_progress.get("last_reviewed_time")
-                    else:
-                        card = Card()
-                        level = 0
-                        last_reviewed = None
-                    
-                    card_data = CardData(
-                        card=card,
-                        japanese=japanese,
-                        english=english,
-                        reading=reading,
-                        level=level,
-                        last_reviewed_time=last_reviewed
-                    )
-                    self.deck_manager.requeue_card(card_data)
-        
-        self.deck_manager.shuffle()
+        self._stop_waiting()
+        self.stop_autosave()
+        progress_store = open_progress_store(deck_path)
+        self.session = StudySession(mode, progress_store=self._autosave(deck_path, progress_store), clock=self.clock,
+                                    seed=self.seed, forecast_of=lambda card_data: deck_forecast(deck_path))
+        self.session.add_cards(self.deck_loader.load(deck_path, progress_store))
+        self.next_card()
+
+    def start_multi_deck_session(self, deck_paths, mode):
+        """Study several decks as one queue, parsing each deck only as its cards are needed."""
+        self._stop_waiting()
+        self.stop_autosave()
+        self.deck_loader.cancel()
+        multi_deck = MultiDeck(self.clock, self.seed)
+        autosave_workers = {}
+        for deck_path in deck_paths:
+            progress_store = open_progress_store(deck_path)
+            multi_deck.add_deck(deck_path, iter_deck_batches(deck_path, progress_store))
+            autosave_workers[deck_path] = self._autosave(deck_path, progress_store)
+        self.session = StudySession(mode, multi_deck, MultiDeckProgress(multi_deck, autosave_workers), clock=self.clock,
+                                    forecast_of=lambda card_data: deck_forecast(multi_deck.deck_of(card_data)))
         self.next_card()
 
+    def _autosave(self, deck_path, progress_store):
+        # The cached deck stays valid across the app's own writes
+        autosave = AutosaveWorker(progress_store, on_saved=partial(mark_progress_saved, deck_path, progress_store))
+        self.autosave_workers.append(autosave)
+        return autosave
+
+    def stop_autosave(self):
+        """Write the pending answers and stop the autosave threads of the last session."""
+        for autosave in self.autosave_workers:
+            autosave.close()
+        self.autosave_workers = []
+
+    def _go_back(self):
+        self.deck_loader.cancel()
+        self._stop_waiting()
+        self.save_progress()
+        self.stop_autosave()
+        self.back_callback()
+
+    def _on_batch_loaded(self, cards):
+        self.session.add_cards(cards)
+        # A deck that ran dry before all batches arrived goes on with the new cards
+        if self.session.current is None:
+            self.next_card()
+
     def next_card(self):
-        self.current_card = self.deck_manager.get_next_card()
+        self._stop_waiting()
+        question = self.session.next_question()
 
-        if self.current_card is None:
-            self.question_label.setText("Deck finished!")
+        if question is None:
             self.answer_input.hide()
             self.kana_preview_label.hide()
             self.submit_button.hide()
             self.continue_button.hide()
             self.feedback_label.hide()
-            self.card_frame.setStyleSheet("border: none")
+            self.card_frame.set_border_color(None)
+            if self.deck_manager.next_due_time() is None:
+                self.question_label.setText("Deck finished!")
+            else:
+                self._wait_for_next_due_card()
             return
 
+        self.feedback_label.show()
         self.answer_input.show()
         self.kana_preview_label.show()
         self.submit_button.show()
@@ -308,54 +288,39 @@ class StudySessionWidget(QWidget):
         self.answer_input.setText("")
         self.answer_input.setFocus()
 
-        card_data = self.current_card
-        
-        if self.mode == "eng_to_jap":
-            self.question_label.setText(card_data.english)
-            self.current_question_is_japanese = False
-        elif self.mode == "jap_to_eng":
-            self.question_label.setText(card_data.japanese)
-            self.current_question_is_japanese = True
-        else: # mixed mode
-            if random.choice([True, False]):
-                self.question_label.setText(card_data.japanese)
-                self.current_question_is_japanese = True
-            else:
-                self.question_label.setText(card_data.english)
-                self.current_question_is_japanese = False
+        self.question_label.setText(question.prompt)
+        self.current_question_is_japanese = question.is_japanese
+
+        level = question.card_data.level
+        self.card_frame.set_border_color(self.level_colors.get(level, self.default_level_color))
+
+    def _wait_for_next_due_card(self):
+        """Arm the wake timer for the earliest waiting card and count down to it."""
+        delay = max(self.deck_manager.next_due_time() - self.clock.now(), 0)
+        self.wake_timer.start(int(delay * 1000) + 1) # Wake just after the card is due
+        self.countdown_timer.start(1000)
+        self._update_countdown()
 
-        level = card_data.level
-        color = self.LEVEL_COLORS.get(level, "#FFFFFF")
-        self.card_frame.setStyleSheet(f"border: 3px solid {color};")
+    def _update_countdown(self):
+        remaining = max(int(self.deck_manager.next_due_time() - self.clock.now() + 0.999), 0)
+        minutes, seconds = divmod(remaining, 60)
+        self.question_label.setText(f"Next card in {minutes}:{seconds:02d}")
+
+    def _stop_waiting(self):
+        self.wake_timer.stop()
+        self.countdown_timer.stop()
 
     def check_answer(self):
-        card_data = self.current_card
         user_answer_romaji = self.answer_input.text().strip()
 
         self.kana_preview_label.hide()
 
-        if self.current_question_is_japanese:
-            correct_answer = card_data.english
-            is_correct = user_answer_romaji.lower().strip() in correct_answer.lower().strip() and len(user_answer_romaji) != 0
-            feedback_answer = correct_answer
-        else:
-            user_answer_kana = self._convert_mixed_case_to_kana(user_answer_romaji)
-            correct_answer_japanese = card_data.japanese
-            correct_answer_reading = card_data.reading
-            is_correct = user_answer_kana == correct_answer_japanese or (correct_answer_reading and user_answer_kana == correct_answer_reading)
-            feedback_answer = f'{correct_answer_japanese} ({correct_answer_reading})'
-
-        if is_correct:
-            self.feedback_label.setText(f"Correct! The answer is {feedback_answer}")
-            card_data.level = min(card_data.level + 1, 3)
-            self.previous_question_correct = 1
+        result = self.session.answer(user_answer_romaji)
+        if result.correct:
+            self.feedback_label.setText(f"Correct! The answer is {result.expected}")
             self.reward_user()
         else:
-            self.feedback_label.setText(f"Incorrect. Your answer: {self._convert_mixed_case_to_kana(user_answer_romaji)}. Correct answer: {feedback_answer}")
-            card_data.level = max(card_data.level - 1, 0)
-            self.previous_question_correct = -1
-        
-        card_data.last_reviewed_time = time.time()
+            self.feedback_label.setText(f"Incorrect. Your answer: {self._convert_mixed_case_to_kana(user_answer_romaji)}. Correct answer: {result.expected}")
 
         self.answer_input.hide()
         self.submit_button.hide()
@@ -365,54 +330,8 @@ class StudySessionWidget(QWidget):
         self.continue_button.setFocus()
 
     def update_card(self):
-        card_data = self.current_card
-        card = card_data.card
-        level = card_data.level
-        options = card.options(self.previous_question_correct)
-        
-        if 0 <= level < len(options):
-            new_card = options[level][1]
-            card_data.card = new_card
-        
-        self.deck_manager.requeue_card(card_data)
+        self.session.requeue()
         self.next_card()
 
-    def _get_progress_path(self):
-        if not self.deck_path:
-            return None
-        deck_name = os.path.splitext(os.path.basename(self.deck_path))[0]
-        return os.path.join(os.path.dirname(__file__), '..', '..', 'progress_files', f"{deck_name}.json")
-
-    def _load_progress(self):
-        progress_path = self._get_progress_path()
-        if progress_path and os.path.exists(progress_path):
-            with open(progress_path, 'r', encoding='utf-8') as f:
-                progress_list = json.load(f)
-                return {item['japanese']: item for item in progress_list}
-        return {}
-
     def save_progress(self):
-        progress_path = self._get_progress_path()
-        if not progress_path:
-            return
-
-        progress_data = []
-        default_card = Card()
-        for card_data in [self.current_card] + self.deck_manager.get_all_cards():
-            if card_data is None:
-                continue
-            card = card_data.card.to_dict()
-            is_default = (
-                card["status"] == default_card.status and
-                card["level"] == default_card.level
-            )
-            if not is_default:
-                progress_data.append({
-                    "japanese": card_data.japanese,
-                    "reading": card_data.reading,
-                    "english": card_data.english,
-                    "card": card,
-                    "last_reviewed_time": card_data.last_reviewed_time
-                })
-        with open(progress_path, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, indent=4)
\ No newline at end of file
+        self.session.save()
@@ -0,0 +1,113 @@
+import threading
+from typing import Iterator, Optional
+
+from PyQt6.QtCore import QObject, QThread, Qt, pyqtSignal
+
+from spaced_repetition.card_data import CardData
+from storage.deck_loader import DEFAULT_BATCH_SIZE, iter_deck_batches
+from storage.journal import ProgressJournal
+from storage.sqlite_store import SQLiteProgressStore
+
+
+class DeckLoadWorker(QObject):
+    """Drains a deck's batch iterator on a worker thread, emitting each batch."""
+
+    batch_loaded = pyqtSignal(int, list)
+    finished = pyqtSignal(int)
+
+    def __init__(self, generation: int, batches: Iterator[list[CardData]]):
+        super().__init__()
+        self.generation = generation
+        self.batches = batches
+        self.cancelled = threading.Event()
+
+    def run(self):
+        try:
+            for batch in self.batches:
+                if self.cancelled.is_set():
+                    break
+                self.batch_loaded.emit(self.generation, batch)
+        finally:
+            self.batches.close()
+            self.finished.emit(self.generation)
+
+
+class DeckLoader(QObject):
+    """Loads decks for a screen: the first batch right away, the rest on a worker thread.
+
+    Every ``load`` starts a new generation and cancels the previous one, and batches of
+    an older generation that were already queued are dropped, so a screen only ever
+    receives the cards of the deck it asked for last.
+    """
+
+    batch_loaded = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(parent)
+        self.batch_size = batch_size
+        self.generation = 0
+        self._worker: Optional[DeckLoadWorker] = None
+        self._thread: Optional[QThread] = None
+
+    def is_loading(self) -> bool:
+        return self._worker is not None
+
+    def load(self, deck_path: str, progress_store: Optional[ProgressJournal | SQLiteProgressStore] = None) -> list[CardData]:
+        """Start loading a deck and return its first batch.
+
+        The remaining batches arrive through ``batch_loaded`` followed by ``finished``;
+        when the first batch is the whole deck, ``finished`` is not emitted.
+        """
+        self.cancel()
+        self.generation += 1
+        batches = iter_deck_batches(deck_path, progress_store, self.batch_size)
+        first_batch = next(batches, [])
+        if len(first_batch) < self.batch_size:
+            batches.close()
+            return first_batch
+
+        self._worker = DeckLoadWorker(self.generation, batches)
+        self._thread = QThread()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.batch_loaded.connect(self._on_batch_loaded)
+        self._worker.finished.connect(self._on_finished)
+        # Quit from the worker thread itself, so a GUI thread blocked in wait() is released
+        self._worker.finished.connect(self._thread.quit, Qt.ConnectionType.DirectConnection)
+        self._thread.start()
+        return first_batch
+
+    def cancel(self, wait: bool = False):
+        """Stop the current load; batches it already queued are ignored.
+
+        With ``wait``, block until the worker thread has stopped, as needed before
+        the application quits.
+        """
+        if self._worker is not None:
+            self._worker.cancelled.set()
+            self.generation += 1
+            if wait:
+                self._thread.wait()
+            self._release()
+
+    def wait(self):
+        """Block until the current worker thread has stopped."""
+        if self._thread is not None:
+            self._thread.wait()
+
+    def _release(self):
+        # The thread stops on its own once the worker sees the cancellation; keep both
+        # alive until then so they are not garbage collected while running.
+        worker, thread = self._worker, self._thread
+        self._worker = self._thread = None
+        thread.finished.connect(lambda: (worker.deleteLater(), thread.deleteLater()))
+
+    def _on_batch_loaded(self, generation: int, batch: list):
+        if generation == self.generation:
+            self.batch_loaded.emit(batch)
+
+    def _on_finished(self, generation: int):
+        if generation == self.generation:
+            self._release()
+            self.finished.emit()
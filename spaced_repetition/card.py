@@ -23,10 +23,58 @@
 # SOFTWARE.
 ###
 from datetime import timedelta as td
-from typing import Self
+from typing import NamedTuple, Optional, Self
+
+RATINGS = ("again", "hard", "good", "easy")
+
+
+class Transition(NamedTuple):
+    """How a card changes when it is answered with one rating.
+
+    ``interval`` is the fixed next interval; when it is None the current interval is
+    scaled instead, by the ease if ``uses_ease`` and then by ``factor``. A negative
+    ``level_multiplier`` resets the level to 0.
+    """
+    status: str
+    interval: Optional[td] = None
+    factor: float = 1.0
+    uses_ease: bool = False
+    ease_delta: float = 0.0
+    ease_resets: bool = False
+    step: int = 0
+    level_multiplier: int = 1
+
+
+_LEARNING_AGAIN = Transition("learning", td(minutes=1), ease_resets=True, level_multiplier=-1)
+_LEARNING_HARD = Transition("learning", td(minutes=3), ease_resets=True, step=1)
+_LEARNING_EASY = Transition("reviewing", td(days=4), ease_resets=True, level_multiplier=2)
+_REVIEWING = (
+    Transition("relearning", td(minutes=10), ease_delta=-0.2),
+    Transition("reviewing", factor=1.2, ease_delta=-0.15),
+    Transition("reviewing", uses_ease=True),
+    Transition("reviewing", factor=1.5, uses_ease=True, ease_delta=0.15),
+)
+_RELEARNING = (
+    Transition("relearning", td(minutes=1)),
+    Transition("relearning", td(minutes=6)),
+    Transition("reviewing", td(days=1)),
+    Transition("reviewing", td(days=4)),
+)
+
+# Transitions per (status, past the first learning step), one entry per rating in RATINGS.
+TRANSITIONS: dict[tuple[str, bool], tuple[Transition, ...]] = {
+    ("learning", False): (_LEARNING_AGAIN, _LEARNING_HARD, Transition("learning", td(minutes=5), ease_resets=True, step=1), _LEARNING_EASY),
+    ("learning", True): (_LEARNING_AGAIN, _LEARNING_HARD, Transition("reviewing", td(days=1), ease_resets=True), _LEARNING_EASY),
+    ("reviewing", False): _REVIEWING,
+    ("reviewing", True): _REVIEWING,
+    ("relearning", False): _RELEARNING,
+    ("relearning", True): _RELEARNING,
+}
 
 
 class Card:
+    __slots__ = ("status", "interval", "step", "ease", "level")
+
     def __init__(self, status="learning", interval=None, ease=2.5, step=0, level=0):
         self.status, self.interval, self.step = status, interval, step
         self.ease = max(ease, 1.3)
@@ -35,31 +83,29 @@ class Card:
     def __repr__(self):
         return f"Card(status={self.status}, step={self.step}, interval={self.interval}, ease={self.ease}, level={self.level})"
 
+    def apply(self, rating: int | str, change: int) -> Self:
+        """Return the card's next state for one rating, building only that state."""
+        if isinstance(rating, str):
+            rating = RATINGS.index(rating)
+        transition = TRANSITIONS[self.status, self.step != 0][rating]
+
+        interval = transition.interval
+        if interval is None:
+            interval = self.interval
+            if transition.uses_ease:
+                interval = interval * self.ease
+            if transition.factor != 1.0:
+                interval = interval * transition.factor
+
+        ease = 2.5 if transition.ease_resets else self.ease + transition.ease_delta
+        if transition.level_multiplier < 0:
+            level = 0
+        else:
+            level = self._clamp_levels(self.level + transition.level_multiplier * change)
+        return Card(transition.status, interval, ease, step=transition.step, level=level)
+
     def options(self, change: int) -> list[tuple[str, Self]]:
-        if self.status == "learning":
-            options = [
-                Card("learning", td(minutes=1), level=0),
-                Card("learning", td(minutes=3), step=1, level=self._clamp_levels(self.level + change)),
-                Card("learning", td(minutes=5), step=1, level=self._clamp_levels(self.level + change))
-                if self.step == 0
-                else Card("reviewing", td(days=1), level=self._clamp_levels(self.level + change)),
-                Card("reviewing", td(days=4), level=self._clamp_levels(self.level + change + change)),
-            ]
-        elif self.status == "reviewing":
-            options = [
-                Card("relearning", td(minutes=10), self.ease - 0.2, level=self._clamp_levels(self.level + change)),
-                Card("reviewing", self.interval * 1.2, self.ease - 0.15, level=self._clamp_levels(self.level + change)),
-                Card("reviewing", self.interval * self.ease, self.ease, level=self._clamp_levels(self.level + change)),
-                Card("reviewing", self.interval * self.ease * 1.5, self.ease + 0.15, level=self._clamp_levels(self.level + change)),
-            ]
-        elif self.status == "relearning":
-            options = [
-                Card("relearning", td(minutes=1), self.ease, level=self._clamp_levels(self.level + change)),
-                Card("relearning", td(minutes=6), self.ease, level=self._clamp_levels(self.level + change)),
-                Card("reviewing", td(days=1), self.ease, level=self._clamp_levels(self.level + change)),
-                Card("reviewing", td(days=4), self.ease, level=self._clamp_levels(self.level + change)),
-            ]
-        return list(zip(["again", "hard", "good", "easy"], options))
+        return [(rating, self.apply(i, change)) for i, rating in enumerate(RATINGS)]
 
     def to_dict(self) -> dict:
         return {
@@ -1,6 +1,14 @@
+import hashlib
 from typing import Optional
 from .card import Card
-import random
+from .shuffle import shuffle_key
+
+
+def compute_card_id(japanese: str, reading: Optional[str], english: str) -> int:
+    """Stable signed 64-bit id of a vocab row, from its japanese, reading and english."""
+    key = "\x1f".join((japanese, reading or "", english)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little", signed=True)
+
 
 class CardData:
     """Represents card data with question, answer, and spaced repetition information."""
@@ -12,7 +20,8 @@ class CardData:
         english: str,
         reading: Optional[str] = None,
         level: int = 0,
-        last_reviewed_time: Optional[float] = None
+        last_reviewed_time: Optional[float] = None,
+        card_id: Optional[int] = None
     ):
         self.card = card
         self.japanese = japanese
@@ -20,9 +29,23 @@ class CardData:
         self.reading = reading
         self.level = level
         self.last_reviewed_time = last_reviewed_time
-        random.seed(self.japanese)
-        self.sort_key = random.random()
+        self._card_id = card_id
+        self._sort_key: Optional[float] = None
     
+    @property
+    def card_id(self) -> int:
+        """Identity of the card across decks and progress files, computed once."""
+        if self._card_id is None:
+            self._card_id = compute_card_id(self.japanese, self.reading, self.english)
+        return self._card_id
+
+    @property
+    def sort_key(self) -> float:
+        """Position of the card in the default shuffled order, from its card id."""
+        if self._sort_key is None:
+            self._sort_key = shuffle_key(self.card_id)
+        return self._sort_key
+
     def __repr__(self) -> str:
         return f"CardData(card={self.card}, japanese='{self.japanese}', english='{self.english}', reading='{self.reading}', level={self.level}, last_reviewed_time={self.last_reviewed_time})"
     
@@ -0,0 +1,185 @@
+from datetime import timedelta as td
+from typing import Optional, Sequence
+
+import numpy as np
+
+from spaced_repetition.card import RATINGS, TRANSITIONS, Card
+from spaced_repetition.card_data import CardData
+
+STATUSES = ("learning", "reviewing", "relearning")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+MIN_LEVEL = 0
+MAX_LEVEL = 4
+
+# Card.TRANSITIONS unpacked into arrays indexed by [status, past_first_step, rating].
+_NEXT_STATUS = np.zeros((3, 2, 4), dtype=np.int8)
+_FIXED_INTERVAL = np.full((3, 2, 4), np.nan)
+_INTERVAL_FACTOR = np.ones((3, 2, 4))
+_FACTOR_USES_EASE = np.zeros((3, 2, 4), dtype=bool)
+_EASE_DELTA = np.zeros((3, 2, 4))
+_EASE_RESETS = np.zeros((3, 2, 4), dtype=bool)
+_NEXT_STEP = np.zeros((3, 2, 4), dtype=np.int16)
+_LEVEL_MULTIPLIER = np.ones((3, 2, 4), dtype=np.int8)
+
+
+def _unpack_transitions() -> None:
+    for (status, past_first_step), transitions in TRANSITIONS.items():
+        for rating, transition in enumerate(transitions):
+            index = (STATUS_CODES[status], int(past_first_step), rating)
+            _NEXT_STATUS[index] = STATUS_CODES[transition.status]
+            if transition.interval is not None:
+                _FIXED_INTERVAL[index] = transition.interval.total_seconds()
+            _INTERVAL_FACTOR[index] = transition.factor
+            _FACTOR_USES_EASE[index] = transition.uses_ease
+            _EASE_DELTA[index] = transition.ease_delta
+            _EASE_RESETS[index] = transition.ease_resets
+            _NEXT_STEP[index] = transition.step
+            _LEVEL_MULTIPLIER[index] = transition.level_multiplier
+
+
+_unpack_transitions()
+
+
+class CardStore:
+    """Columnar store of card scheduling state for whole-deck, vectorized queries.
+
+    Each card occupies one row across the NumPy arrays below. Missing intervals and
+    review times (``None`` on ``Card``/``CardData``) are stored as NaN.
+    """
+
+    status: np.ndarray
+    step: np.ndarray
+    interval: np.ndarray
+    ease: np.ndarray
+    level: np.ndarray
+    last_reviewed_time: np.ndarray
+
+    def __init__(self, size: int = 0):
+        self.status = np.zeros(size, dtype=np.int8)
+        self.step = np.zeros(size, dtype=np.int16)
+        self.interval = np.full(size, np.nan)
+        self.ease = np.full(size, DEFAULT_EASE)
+        self.level = np.zeros(size, dtype=np.int8)
+        self.last_reviewed_time = np.full(size, np.nan)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @classmethod
+    def from_cards(cls, cards: Sequence[Card], last_reviewed_times: Optional[Sequence[Optional[float]]] = None) -> "CardStore":
+        store = cls(len(cards))
+        for i, card in enumerate(cards):
+            store.set_card(i, card)
+        if last_reviewed_times is not None:
+            store.last_reviewed_time[:] = [np.nan if t is None else t for t in last_reviewed_times]
+        return store
+
+    @classmethod
+    def from_card_data(cls, cards: Sequence[CardData]) -> "CardStore":
+        return cls.from_cards([card_data.card for card_data in cards], [card_data.last_reviewed_time for card_data in cards])
+
+    def set_card(self, index: int, card: Card, last_reviewed_time: Optional[float] = None) -> None:
+        """Write a single card's state into row ``index``."""
+        self.status[index] = STATUS_CODES[card.status]
+        self.step[index] = card.step
+        self.interval[index] = card.interval.total_seconds() if card.interval is not None else np.nan
+        self.ease[index] = card.ease
+        self.level[index] = card.level
+        if last_reviewed_time is not None:
+            self.last_reviewed_time[index] = last_reviewed_time
+
+    def card(self, index: int) -> Card:
+        interval = self.interval[index]
+        return Card(
+            status=STATUSES[self.status[index]],
+            interval=None if np.isnan(interval) else td(seconds=float(interval)),
+            ease=float(self.ease[index]),
+            step=int(self.step[index]),
+            level=int(self.level[index]),
+        )
+
+    def cards(self) -> list[Card]:
+        return [self.card(i) for i in range(len(self))]
+
+    def write_back(self, cards: Sequence[CardData]) -> None:
+        """Copy the stored state onto the matching ``CardData`` objects (same row order)."""
+        for i, card_data in enumerate(cards):
+            card_data.card = self.card(i)
+            last_reviewed_time = self.last_reviewed_time[i]
+            card_data.last_reviewed_time = None if np.isnan(last_reviewed_time) else float(last_reviewed_time)
+
+    def due_times(self) -> np.ndarray:
+        """Timestamp at which each card becomes due; cards without a review or interval are due at -inf."""
+        due = self.last_reviewed_time + self.interval
+        never_scheduled = np.isnan(due) | (self.interval == 0) | (self.last_reviewed_time == 0)
+        return np.where(never_scheduled, -np.inf, due)
+
+    def due_mask(self, now: float) -> np.ndarray:
+        """Cards due at ``now``: unlearned new cards, plus reviewed cards whose interval has elapsed."""
+        is_new = (self.status == STATUS_CODES["learning"]) & (self.step == 0)
+        with np.errstate(invalid="ignore"):
+            elapsed = now >= self.last_reviewed_time + self.interval
+        return is_new | elapsed
+
+    def due_indices(self, now: float) -> np.ndarray:
+        return np.flatnonzero(self.due_mask(now))
+
+    def level_histogram(self) -> np.ndarray:
+        """Number of cards at each level from MIN_LEVEL to MAX_LEVEL.
+
+        As on the progress screen, a negative level (-1 marks a card as learned) is
+        counted with MAX_LEVEL, and so are levels above it.
+        """
+        levels = np.where(self.level < MIN_LEVEL, MAX_LEVEL, np.minimum(self.level, MAX_LEVEL))
+        return np.bincount(levels, minlength=MAX_LEVEL + 1)
+
+    def next_state(self, indices: np.ndarray, ratings: np.ndarray | int, changes: np.ndarray | int) -> dict[str, np.ndarray]:
+        """Compute the state each selected card would move to, without modifying the store.
+
+        ``ratings`` index into RATINGS and ``changes`` is the level change (+1/-1) passed to
+        ``Card.apply``; both may be scalars or arrays matching ``indices``.
+        """
+        indices = np.asarray(indices)
+        ratings = np.broadcast_to(np.asarray(ratings, dtype=np.intp), indices.shape)
+        changes = np.broadcast_to(np.asarray(changes, dtype=np.int64), indices.shape)
+
+        status = self.status[indices]
+        past_first_step = (self.step[indices] != 0).astype(np.intp)
+        key = (status, past_first_step, ratings)
+
+        ease = self.ease[indices]
+        factor = np.where(_FACTOR_USES_EASE[key], _INTERVAL_FACTOR[key] * ease, _INTERVAL_FACTOR[key])
+        fixed = _FIXED_INTERVAL[key]
+        interval = np.where(np.isnan(fixed), self.interval[indices] * factor, fixed)
+
+        next_ease = np.where(_EASE_RESETS[key], DEFAULT_EASE, ease + _EASE_DELTA[key])
+        next_ease = np.maximum(next_ease, MIN_EASE)
+
+        multiplier = _LEVEL_MULTIPLIER[key]
+        level = np.where(multiplier < 0, MIN_LEVEL, self.level[indices] + multiplier * changes)
+        level = np.clip(level, MIN_LEVEL, MAX_LEVEL)
+
+        return {
+            "status": _NEXT_STATUS[key],
+            "step": _NEXT_STEP[key],
+            "interval": interval,
+            "ease": next_ease,
+            "level": level.astype(np.int8),
+        }
+
+    def next_intervals(self, ratings: np.ndarray | int, changes: np.ndarray | int = 1) -> np.ndarray:
+        """Next interval in seconds for every card under the given rating(s)."""
+        return self.next_state(np.arange(len(self)), ratings, changes)["interval"]
+
+    def schedule(self, indices: np.ndarray, ratings: np.ndarray | int, changes: np.ndarray | int, now: float | np.ndarray) -> None:
+        """Apply a batch of answers in place and stamp the cards as reviewed at ``now``."""
+        state = self.next_state(indices, ratings, changes)
+        self.status[indices] = state["status"]
+        self.step[indices] = state["step"]
+        self.interval[indices] = state["interval"]
+        self.ease[indices] = state["ease"]
+        self.level[indices] = state["level"]
+        self.last_reviewed_time[indices] = now
@@ -0,0 +1,30 @@
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    def now(self) -> float: ...
+
+
+class SystemClock:
+    """Wall-clock time, read from ``time.time`` on every call."""
+
+    def now(self) -> float:
+        return time.time()
+
+
+class VirtualClock:
+    """A clock that only moves when told to, for tests and simulations."""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float) -> float:
+        self.time += seconds
+        return self.time
+
+    def set(self, timestamp: float) -> None:
+        self.time = timestamp
@@ -1,63 +1,164 @@
 from collections import deque
-import time
+import heapq
+import itertools
 from typing import Optional
 
+import numpy as np
+
 from spaced_repetition.card import Card
-from spaced_repetition.card_data import CardData 
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import Clock, SystemClock
+from spaced_repetition.shuffle import shuffle_key, shuffle_order
 
 class Deck:
 
     levels: dict[int, deque[CardData]]
     review_deck: deque[CardData]
-    waiting_deck: deque[CardData]
+    # Min-heap of (due_time, sequence, card_data); the sequence keeps the
+    # release order stable for cards that become due together.
+    waiting_heap: list[tuple[float, int, CardData]]
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None, seed: int = 0):
+        self.clock = clock if clock is not None else SystemClock()
+        self.seed = seed # Shuffle seed; 0 orders cards by their own sort_key
         self.levels = {0: deque(), 1: deque(), 2: deque(), 3: deque()}
         self.review_deck = deque()
-        self.waiting_deck = deque()
+        self.waiting_heap = []
+        self._sequence = itertools.count()
+        # Per queue (by id), how many cards at its end came from ``requeue_cards`` and
+        # are still in shuffled order; later batches are merged into that run.
+        self._shuffled_run: dict[int, int] = {}
+
+    @property
+    def waiting_deck(self) -> deque[CardData]:
+        """Cards that are not due yet, in no particular order."""
+        return deque(card_data for _, _, card_data in self.waiting_heap)
 
     def add_card(self, card_data: CardData):
+        self._queue_for(card_data).appendleft(card_data)
+
+    def _queue_for(self, card_data: CardData) -> deque[CardData]:
         level = card_data.card.level
-        if 0 <= level <= 3:
-            self.levels[level].appendleft(card_data)
-        else:
-            self.review_deck.appendleft(card_data)
+        return self.levels[level] if 0 <= level <= 3 else self.review_deck
 
     def get_next_card(self) -> Optional[CardData]:
+        queue = self._next_queue()
+        if queue is None:
+            return None # No more cards
+        card_data = queue.popleft()
+        if self._shuffled_run.get(id(queue), 0) > len(queue):
+            self._shuffled_run[id(queue)] = len(queue)
+        return card_data
+
+    def peek_next_card(self) -> Optional[CardData]:
+        """The card ``get_next_card`` would return, left in the deck."""
+        queue = self._next_queue()
+        return queue[0] if queue is not None else None
+
+    def _next_queue(self) -> Optional[deque[CardData]]:
         self.check_waiting_deck()
         for level in reversed(sorted(self.levels.keys())):
             if self.levels[level]:
-                return self.levels[level].popleft()
-        
+                return self.levels[level]
+
         if self.review_deck:
-            return self.review_deck.popleft()
-        
-        return None # No more cards
-    
+            return self.review_deck
+
+        return None
+
     def check_waiting_deck(self):
-        to_remove = []
-        for card in self.waiting_deck:
-            wait_time = card.card.interval.total_seconds() if card.card.interval else 0
-            last_reviewed_time = card.last_reviewed_time if card.last_reviewed_time else 0
-            if last_reviewed_time + wait_time <= time.time() or wait_time == 0 or last_reviewed_time == 0:
-                self.add_card(card)
-                to_remove += [card]
-        
-        [self.waiting_deck.remove(card) for card in to_remove]
+        now = self.clock.now()
+        released = []
+        while self.waiting_heap and self.waiting_heap[0][0] <= now:
+            released.append(heapq.heappop(self.waiting_heap))
+
+        # Release in queue order rather than due order, as a linear scan would.
+        released.sort(key=lambda entry: entry[1])
+        for _, _, card_data in released:
+            self.add_card(card_data)
+
+    def next_due_time(self) -> Optional[float]:
+        """When the earliest waiting card becomes due, or None if no card is waiting."""
+        return self.waiting_heap[0][0] if self.waiting_heap else None
 
     def requeue_card(self, card_data: CardData):
-        self.waiting_deck.append(card_data)
+        heapq.heappush(self.waiting_heap, (self.due_time(card_data), next(self._sequence), card_data))
+
+    def requeue_cards(self, cards: list[CardData]):
+        """Queue a batch of new cards in shuffled order, leaving the queued cards as they are.
+
+        Cards that are already due are merged into the cards earlier batches left in
+        their queue, so a deck loaded in batches is drawn in the order ``shuffle``
+        gives the whole deck, whatever the batch boundaries.
+        """
+        now = self.clock.now()
+        due: dict[int, list[CardData]] = {}
+        for i in self._shuffle_order(cards):
+            card_data = cards[i]
+            if self.due_time(card_data) <= now:
+                due.setdefault(id(self._queue_for(card_data)), []).append(card_data)
+            else:
+                self.requeue_card(card_data)
+        for queue in [*self.levels.values(), self.review_deck]:
+            if id(queue) in due:
+                self._merge_shuffled(queue, due[id(queue)])
+
+    def _merge_shuffled(self, queue: deque[CardData], cards: list[CardData]):
+        """Merge cards in ascending key order into the shuffled run at the end of ``queue``.
+
+        The run is drawn in descending key order, as cards released together from the
+        waiting heap are.
+        """
+        run_length = self._shuffled_run.get(id(queue), 0)
+        run = [queue.pop() for _ in range(run_length)] # Ascending key order
+        merged = heapq.merge(run, cards, key=self.sort_key)
+        queue.extend(reversed(list(merged)))
+        self._shuffled_run[id(queue)] = run_length + len(cards)
+
+    def sort_key(self, card_data: CardData) -> float:
+        """Position of a card in this deck's shuffled order."""
+        return card_data.sort_key if self.seed == 0 else shuffle_key(card_data.card_id, self.seed)
+
+    def _shuffle_order(self, cards: list[CardData]) -> np.ndarray:
+        return shuffle_order(np.fromiter((card_data.card_id for card_data in cards), dtype=np.int64, count=len(cards)), self.seed)
 
     def get_all_cards(self) -> list[CardData]:
         all_cards = []
         for level in self.levels.values():
             all_cards.extend(level)
         all_cards.extend(self.review_deck)
-        all_cards.extend(self.waiting_deck)
+        all_cards.extend(card_data for _, _, card_data in self.waiting_heap)
         return all_cards
-    
+
     def shuffle(self):
-        for level in self.levels.keys():
-            self.levels[level] = deque(sorted(self.levels[level], key=lambda x: x.sort_key))
-        self.review_deck = deque(sorted(self.review_deck, key=lambda x: x.sort_key))
-        self.waiting_deck = deque(sorted(self.waiting_deck, key=lambda x: x.sort_key))
+        """Put every queue in shuffled order.
+
+        The keys of all queued cards are computed in one pass and sorted once; the
+        resulting permutation then deals each card back to the queue it came from.
+        """
+        queues = [*self.levels.values(), self.review_deck]
+        cards = [card_data for queue in queues for card_data in queue]
+        origins = [queue for queue in queues for _ in queue]
+        waiting = self.waiting_heap
+        cards.extend(card_data for _, _, card_data in waiting)
+
+        for queue in queues:
+            queue.clear()
+        self._shuffled_run.clear()
+        self.waiting_heap = []
+        for i in self._shuffle_order(cards):
+            if i < len(origins):
+                origins[i].append(cards[i])
+            else:
+                due_time = waiting[i - len(origins)][0]
+                self.waiting_heap.append((due_time, next(self._sequence), cards[i]))
+        heapq.heapify(self.waiting_heap)
+
+    @staticmethod
+    def due_time(card_data: CardData) -> float:
+        """Timestamp at which a waiting card becomes due; never-reviewed cards are due immediately."""
+        wait_time = card_data.card.interval.total_seconds() if card_data.card.interval else 0
+        last_reviewed_time = card_data.last_reviewed_time if card_data.last_reviewed_time else 0
+        if wait_time == 0 or last_reviewed_time == 0:
+            return float("-inf")
+        return last_reviewed_time + wait_time
@@ -0,0 +1,52 @@
+import threading
+from typing import Iterable
+
+import numpy as np
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+class DueForecast:
+    """Sorted due times of a deck, for counting upcoming reviews with binary search.
+
+    Due times come from ``CardStore.due_times``: cards that were never scheduled are due
+    at -inf, so they count as due at any time. The array is sorted once when built and
+    kept sorted as cards are added and rescheduled, so no query scans the deck. A deck
+    loader may add batches on its thread while a session reschedules on another.
+    """
+
+    def __init__(self, due_times: Iterable[float] = ()):
+        self._due = np.sort(np.fromiter(due_times, dtype=float))
+        self._lock = threading.Lock() # Queries read one array and need no lock
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def add(self, due_times: np.ndarray) -> None:
+        """Merge the due times of newly loaded cards."""
+        due_times = np.sort(np.asarray(due_times, dtype=float))
+        with self._lock:
+            self._due = np.insert(self._due, np.searchsorted(self._due, due_times), due_times)
+
+    def reschedule(self, old_due_time: float, new_due_time: float) -> None:
+        """Move one card from its old due time to its new one after a review."""
+        with self._lock:
+            old = np.searchsorted(self._due, old_due_time)
+            if old == len(self._due) or self._due[old] != old_due_time:
+                raise KeyError(f"No card is due at {old_due_time}")
+            due = np.delete(self._due, old)
+            self._due = np.insert(due, np.searchsorted(due, new_due_time), new_due_time)
+
+    def due_by(self, timestamp: float) -> int:
+        """Number of cards due at or before ``timestamp``."""
+        return int(np.searchsorted(self._due, timestamp, side="right"))
+
+    def histogram(self, now: float, buckets: int, bucket_seconds: float = DAY) -> np.ndarray:
+        """Cards becoming due in each of the next ``buckets`` periods of ``bucket_seconds``.
+
+        The first bucket also holds the cards that are already due at ``now``.
+        """
+        edges = now + bucket_seconds * np.arange(1, buckets + 1)
+        counts = np.searchsorted(self._due, edges, side="right")
+        return np.diff(counts, prepend=0)
@@ -0,0 +1,94 @@
+from typing import Iterator, Optional
+
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import Clock, SystemClock
+from spaced_repetition.deck import Deck
+from spaced_repetition.study_session import ProgressRecorder
+
+
+class MultiDeck:
+    """Several decks studied as one, each keeping its own queues.
+
+    ``get_next_card`` merges the decks: it looks at the card each deck would serve
+    next and takes the one with the highest priority, in the order a single ``Deck``
+    serves its own cards (higher session levels first, review cards last, ties broken
+    by the deck's ``sort_key``). Decks are read from batch iterators, and a deck only parses its
+    next batch when none of its loaded cards is due, so a session over several large
+    decks starts after one batch each.
+    """
+
+    def __init__(self, clock: Optional[Clock] = None, seed: int = 0):
+        self.clock = clock if clock is not None else SystemClock()
+        self.seed = seed
+        self.decks: dict[str, Deck] = {}
+        self._sources: dict[str, Iterator[list[CardData]]] = {}
+        self._deck_paths: dict[int, str] = {} # id of each loaded CardData to its deck
+
+    def add_deck(self, deck_path: str, batches: Iterator[list[CardData]]) -> None:
+        """Add a deck whose cards are read from ``batches`` as they are needed."""
+        self.decks[deck_path] = Deck(self.clock, self.seed)
+        self._sources[deck_path] = batches
+
+    def add_cards(self, deck_path: str, cards: list[CardData]) -> None:
+        for card_data in cards:
+            self._deck_paths[id(card_data)] = deck_path
+        self.decks[deck_path].requeue_cards(cards)
+
+    def deck_of(self, card_data: CardData) -> str:
+        return self._deck_paths[id(card_data)]
+
+    def get_next_card(self) -> Optional[CardData]:
+        best = None
+        for deck_path, deck in self.decks.items():
+            card_data = self._peek(deck_path)
+            if card_data is not None and (best is None or self._rank(deck, card_data) < self._rank(*best)):
+                best = (deck, card_data)
+        return best[0].get_next_card() if best is not None else None
+
+    def _peek(self, deck_path: str) -> Optional[CardData]:
+        """The next card of one deck, loading batches until one is due or the deck is read."""
+        deck = self.decks[deck_path]
+        card_data = deck.peek_next_card()
+        while card_data is None and deck_path in self._sources:
+            batch = next(self._sources[deck_path], None)
+            if batch is None:
+                del self._sources[deck_path]
+                break
+            self.add_cards(deck_path, batch)
+            card_data = deck.peek_next_card()
+        return card_data
+
+    @staticmethod
+    def _rank(deck: Deck, card_data: CardData) -> tuple[int, float]:
+        level = card_data.card.level
+        return (3 - level if 0 <= level <= 3 else 4, deck.sort_key(card_data))
+
+    def requeue_card(self, card_data: CardData) -> None:
+        self.decks[self.deck_of(card_data)].requeue_card(card_data)
+
+    def next_due_time(self) -> Optional[float]:
+        due_times = [due for deck in self.decks.values() if (due := deck.next_due_time()) is not None]
+        return min(due_times, default=None)
+
+    def get_all_cards(self) -> list[CardData]:
+        """The cards loaded so far, deck by deck."""
+        return [card_data for deck in self.decks.values() for card_data in deck.get_all_cards()]
+
+
+class MultiDeckProgress:
+    """Records each answered card in the progress store of the deck it came from.
+
+    Keeping any cache of the decks current is up to the stores, as the autosave
+    workers of the study screen do after each write.
+    """
+
+    def __init__(self, multi_deck: MultiDeck, progress_stores: dict[str, ProgressRecorder]):
+        self.multi_deck = multi_deck
+        self.progress_stores = progress_stores
+
+    def record(self, card_data: CardData) -> None:
+        self.progress_stores[self.multi_deck.deck_of(card_data)].record(card_data)
+
+    def flush(self) -> None:
+        for progress_store in self.progress_stores.values():
+            progress_store.flush()
@@ -0,0 +1,44 @@
+import numpy as np
+
+DAY = 24 * 60 * 60
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+
+
+def _seed_bits(seed: int) -> int:
+    return (seed * _GOLDEN) & _MASK
+
+
+def shuffle_key(card_id: int, seed: int = 0) -> float:
+    """Position of a card in the shuffled order for ``seed``, in [0, 1).
+
+    The card id is mixed with the seed by the splitmix64 finalizer, so every seed
+    gives an unrelated order while the same seed always gives the same one.
+    """
+    z = (card_id & _MASK) ^ _seed_bits(seed)
+    z = ((z ^ (z >> 30)) * _MIX_1) & _MASK
+    z = ((z ^ (z >> 27)) * _MIX_2) & _MASK
+    z ^= z >> 31
+    return (z >> 11) * 2.0 ** -53
+
+
+def shuffle_keys(card_ids: np.ndarray, seed: int = 0) -> np.ndarray:
+    """``shuffle_key`` of many cards at once."""
+    z = np.asarray(card_ids, dtype=np.int64).view(np.uint64) ^ np.uint64(_seed_bits(seed))
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX_1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX_2)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+
+def shuffle_order(card_ids: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Indices that put cards in shuffled order, ties kept in their given order."""
+    return np.argsort(shuffle_keys(card_ids, seed), kind="stable")
+
+
+def daily_seed(timestamp: float) -> int:
+    """A seed that changes once a day, for sessions that should shuffle differently each day."""
+    return int(timestamp // DAY)
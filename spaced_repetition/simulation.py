@@ -0,0 +1,116 @@
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from spaced_repetition.card_store import MAX_LEVEL, CardStore
+from spaced_repetition.clock import VirtualClock
+from spaced_repetition.study_session import MAX_SESSION_LEVEL
+
+DAY = 24 * 60 * 60
+# Within a day the deck is studied in sittings this far apart, so cards on
+# minute-long learning steps come back the same day.
+SITTING_GAP = 10 * 60
+MAX_SITTINGS = 12
+
+# Given the store, the rows being answered and the current time, returns which answers are correct.
+AccuracyModel = Callable[[CardStore, np.ndarray, float, np.random.Generator], np.ndarray]
+
+
+def constant_accuracy(probability: float) -> AccuracyModel:
+    """Every answer is correct with the same probability."""
+    def model(store: CardStore, indices: np.ndarray, now: float, rng: np.random.Generator) -> np.ndarray:
+        return rng.random(len(indices)) < probability
+    return model
+
+
+def forgetting_curve_accuracy(retention: float = 0.9) -> AccuracyModel:
+    """Answers are correct with probability ``retention ** (elapsed / interval)``.
+
+    A card answered exactly when due is recalled with probability ``retention``, one
+    answered late is forgotten more often. Cards without an interval yet use ``retention``.
+    """
+    def model(store: CardStore, indices: np.ndarray, now: float, rng: np.random.Generator) -> np.ndarray:
+        interval = store.interval[indices]
+        elapsed = now - store.last_reviewed_time[indices]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            exponent = np.where(interval > 0, elapsed / interval, 1.0)
+        exponent = np.nan_to_num(np.maximum(exponent, 0.0), nan=1.0)
+        return rng.random(len(indices)) < retention ** exponent
+    return model
+
+
+class SimulationReport(NamedTuple):
+    daily_reviews: np.ndarray # Answers given on each day, new cards included
+    daily_new: np.ndarray # Cards seen for the first time on each day
+    backlog: np.ndarray # Cards due but not reviewed at the end of each day
+    introduction_day: np.ndarray # Per card, the day it was first studied, or -1
+    mastery_day: np.ndarray # Per card, the day it first reached MAX_LEVEL, or -1
+
+    @property
+    def mastered(self) -> int:
+        return int(np.count_nonzero(self.mastery_day >= 0))
+
+    def time_to_mastery(self) -> np.ndarray:
+        """Days each mastered card took from its introduction to MAX_LEVEL."""
+        mastered = (self.mastery_day >= 0) & (self.introduction_day >= 0)
+        return self.mastery_day[mastered] - self.introduction_day[mastered]
+
+
+def simulate(store: CardStore, days: int, accuracy: AccuracyModel, new_cards_per_day: int = 20,
+             max_reviews_per_day: Optional[int] = None, clock: Optional[VirtualClock] = None,
+             rng: Optional[np.random.Generator] = None) -> SimulationReport:
+    """Study the cards of ``store`` for ``days`` simulated days, updating it in place.
+
+    Each day introduces up to ``new_cards_per_day`` cards that were never reviewed, in
+    row order, and answers every due card in a few sittings, at most
+    ``max_reviews_per_day`` in total. Answers are rated as ``StudySession`` rates them:
+    each day's session level of a card starts at its card level and moves one up for
+    a correct answer and one down for a wrong one, within 0 and MAX_SESSION_LEVEL, and
+    the new session level is the rating. All cards answered in a sitting are scheduled
+    together with ``CardStore.schedule``.
+    """
+    # The store reads a review time of 0 as never reviewed, so simulated time starts a day in
+    clock = clock if clock is not None else VirtualClock(DAY)
+    rng = rng if rng is not None else np.random.default_rng()
+    daily_reviews = np.zeros(days, dtype=np.int64)
+    daily_new = np.zeros(days, dtype=np.int64)
+    backlog = np.zeros(days, dtype=np.int64)
+    unseen = np.flatnonzero(np.isnan(store.last_reviewed_time))
+    introduction_day = np.zeros(len(store), dtype=np.int64)
+    introduction_day[unseen] = -1
+    introduced = introduction_day >= 0
+    mastery_day = np.where(store.level >= MAX_LEVEL, 0, -1)
+
+    for day in range(days):
+        day_start = clock.now()
+        new = unseen[:new_cards_per_day]
+        unseen = unseen[new_cards_per_day:]
+        introduced[new] = True
+        introduction_day[new] = day
+        daily_new[day] = len(new)
+        budget = max_reviews_per_day if max_reviews_per_day is not None else len(store)
+        session_level = store.level.astype(np.int64) # Each day is one study session
+
+        for _ in range(MAX_SITTINGS):
+            now = clock.now()
+            due_times = store.due_times()
+            due = np.flatnonzero(introduced & (due_times <= now))
+            if not len(due) or not budget:
+                break
+            # Most overdue first when the daily budget runs out
+            due = due[np.argsort(due_times[due], kind="stable")][:budget]
+            correct = accuracy(store, due, now, rng)
+            changes = np.where(correct, 1, -1)
+            session_level[due] = np.clip(session_level[due] + changes, 0, MAX_SESSION_LEVEL)
+            store.schedule(due, session_level[due], changes, now)
+            budget -= len(due)
+            daily_reviews[day] += len(due)
+
+            reached = due[(store.level[due] >= MAX_LEVEL) & (mastery_day[due] < 0)]
+            mastery_day[reached] = day
+            clock.advance(SITTING_GAP)
+
+        backlog[day] = np.count_nonzero(introduced & (store.due_times() <= clock.now()))
+        clock.set(day_start + DAY)
+
+    return SimulationReport(daily_reviews, daily_new, backlog, introduction_day, mastery_day)
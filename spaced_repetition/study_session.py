@@ -0,0 +1,127 @@
+import random
+from typing import Callable, NamedTuple, Optional, Protocol
+
+from spaced_repetition.card import RATINGS
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import Clock, SystemClock
+from spaced_repetition.deck import Deck
+from spaced_repetition.forecast import DueForecast
+from translation.kana_input import to_kana_mixed_case
+
+MODES = ("eng_to_jap", "jap_to_eng", "mixed")
+MAX_SESSION_LEVEL = 3
+
+
+class ProgressRecorder(Protocol):
+    def record(self, card_data: CardData) -> None: ...
+    def flush(self) -> None: ...
+
+
+class Question(NamedTuple):
+    card_data: CardData
+    prompt: str
+    is_japanese: bool # The prompt is the japanese side and the answer is english
+
+
+class AnswerResult(NamedTuple):
+    correct: bool
+    answer: str # What was graded: the typed english, or the kana the romaji converts to
+    expected: str # The correct answer as shown to the user
+
+
+class StudySession:
+    """One study session over a deck, independent of any UI.
+
+    The session hands out questions in deck order, grades typed answers, moves the
+    session level and scheduling state of the answered card, and records it in the
+    progress store. Views call ``next_question``, ``answer`` and ``requeue`` and only
+    display the results. The deck may also be a ``MultiDeck`` with a
+    ``MultiDeckProgress`` as its progress store. ``seed`` picks the shuffled order of
+    the deck the session builds itself. ``forecast_of`` gives the ``DueForecast`` that
+    holds a card, which the session reschedules after each answer.
+    """
+
+    def __init__(self, mode: str = "eng_to_jap", deck: Optional[Deck] = None,
+                 progress_store: Optional[ProgressRecorder] = None,
+                 rng: Optional[random.Random] = None, clock: Optional[Clock] = None, seed: int = 0,
+                 forecast_of: Optional[Callable[[CardData], DueForecast]] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown study mode: {mode!r}")
+        self.mode = mode
+        self.clock = clock if clock is not None else SystemClock()
+        self.deck = deck if deck is not None else Deck(self.clock, seed)
+        self.progress_store = progress_store
+        self.rng = rng if rng is not None else random.Random()
+        self.forecast_of = forecast_of
+        self.current: Optional[Question] = None
+        self.previous_question_correct = 0 # 1 or -1 once a question has been answered
+
+    def add_cards(self, cards: list[CardData]) -> None:
+        self.deck.requeue_cards(cards)
+
+    def next_question(self) -> Optional[Question]:
+        """Draw the next due card, or None when nothing is due."""
+        card_data = self.deck.get_next_card()
+        if card_data is None:
+            self.current = None
+            return None
+
+        if self.mode == "eng_to_jap":
+            is_japanese = False
+        elif self.mode == "jap_to_eng":
+            is_japanese = True
+        else: # mixed mode
+            is_japanese = self.rng.choice([True, False])
+        prompt = card_data.japanese if is_japanese else card_data.english
+        self.current = Question(card_data, prompt, is_japanese)
+        return self.current
+
+    @staticmethod
+    def grade(question: Question, user_answer: str) -> AnswerResult:
+        """Check a typed answer without changing any state."""
+        card_data = question.card_data
+        user_answer = user_answer.strip()
+        if question.is_japanese:
+            correct_answer = card_data.english
+            is_correct = user_answer.lower() in correct_answer.lower().strip() and len(user_answer) != 0
+            return AnswerResult(is_correct, user_answer, correct_answer)
+
+        user_answer_kana = to_kana_mixed_case(user_answer)
+        is_correct = user_answer_kana == card_data.japanese or bool(card_data.reading and user_answer_kana == card_data.reading)
+        return AnswerResult(is_correct, user_answer_kana, f'{card_data.japanese} ({card_data.reading})')
+
+    def answer(self, user_answer: str, now: Optional[float] = None) -> AnswerResult:
+        """Grade an answer to the current question and schedule its card."""
+        result = self.grade(self.current, user_answer)
+        card_data = self.current.card_data
+        due_time = Deck.due_time(card_data)
+        if result.correct:
+            card_data.level = min(card_data.level + 1, MAX_SESSION_LEVEL)
+            self.previous_question_correct = 1
+        else:
+            card_data.level = max(card_data.level - 1, 0)
+            self.previous_question_correct = -1
+
+        card_data.last_reviewed_time = self.clock.now() if now is None else now
+        self._apply_answer(card_data)
+        if self.forecast_of is not None:
+            self.forecast_of(card_data).reschedule(due_time, Deck.due_time(card_data))
+        return result
+
+    def _apply_answer(self, card_data: CardData) -> None:
+        """Move the card to its next scheduling state and record it straight away."""
+        level = card_data.level
+        if 0 <= level < len(RATINGS):
+            card_data.card = card_data.card.apply(level, self.previous_question_correct)
+        if self.progress_store is not None:
+            self.progress_store.record(card_data)
+
+    def requeue(self) -> None:
+        """Put the answered card back into the deck's waiting queue."""
+        if self.current is not None:
+            self.deck.requeue_card(self.current.card_data)
+
+    def save(self) -> None:
+        """Answers are recorded as they happen; this only lets the store tidy up."""
+        if self.progress_store is not None:
+            self.progress_store.flush()
@@ -0,0 +1,86 @@
+import threading
+from typing import Callable, Optional
+
+from spaced_repetition.card_data import CardData
+from storage.journal import ProgressJournal, progress_entry
+from storage.sqlite_store import SQLiteProgressStore
+
+DEFAULT_INTERVAL = 3.0
+DEFAULT_MAX_PENDING = 20
+
+
+class AutosaveWorker:
+    """Writes the reviews of a progress store on a background thread, in batches.
+
+    ``record`` only copies the card's progress entry, so answering never waits for the
+    disk. The worker writes the pending entries every ``interval`` seconds, or sooner
+    once ``max_pending`` cards are waiting, with a single ``record_entries`` call, and
+    lets the store compact afterwards. A crash loses at most the answers of the last
+    few seconds; a failed write keeps its entries pending for the next attempt. ``flush`` writes everything pending before returning, and ``close``
+    also stops the thread; the store itself stays open.
+    """
+
+    def __init__(self, progress_store: ProgressJournal | SQLiteProgressStore, interval: float = DEFAULT_INTERVAL,
+                 max_pending: int = DEFAULT_MAX_PENDING, on_saved: Optional[Callable[[], None]] = None):
+        self.progress_store = progress_store
+        self.interval = interval
+        self.max_pending = max_pending
+        self.on_saved = on_saved # Called after each write, on the thread that wrote
+        self._pending: dict[int, dict] = {} # Latest entry of each answered card, by card id
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock() # One writer at a time: the worker or flush
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def record(self, card_data: CardData) -> None:
+        # Copy the entry now; the card keeps changing while the write is pending
+        entry = progress_entry(card_data)
+        with self._pending_lock:
+            self._pending[entry["id"]] = entry
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def pending(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def flush(self) -> None:
+        """Write every pending entry and compact the store if it needs it."""
+        self._write_pending()
+
+    def close(self) -> None:
+        """Flush and stop the worker thread."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self._write_pending()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self._write_pending()
+            except Exception:
+                pass # The entries are still pending; try again on the next interval
+
+    def _write_pending(self) -> None:
+        with self._write_lock:
+            with self._pending_lock:
+                entries, self._pending = list(self._pending.values()), {}
+            if not entries:
+                return
+            try:
+                self.progress_store.record_entries(entries)
+            except Exception:
+                with self._pending_lock:
+                    # Answers recorded since are newer than the ones that failed
+                    for entry in entries:
+                        self._pending.setdefault(entry["id"], entry)
+                raise
+            self.progress_store.flush()
+            if self.on_saved is not None:
+                self.on_saved()
@@ -0,0 +1,204 @@
+import json
+import os
+import struct
+import weakref
+from typing import Iterator, MutableMapping, Optional
+
+import numpy as np
+
+from spaced_repetition.card_store import STATUS_CODES, STATUSES
+from storage.journal import ProgressJournal, entry_id
+
+# File layout: header, the records sorted by card id, then for each record the offset
+# of its text (a JSON [japanese, reading, english] list) followed by the text itself.
+MAGIC = b"BKYPRG01"
+_HEADER = struct.Struct("<8sQQ8x") # magic, record count, text size; padded to 32 bytes
+
+RECORD_DTYPE = np.dtype([
+    ("card_id", "<i8"),
+    ("interval", "<f8"), # Seconds; NaN for no interval
+    ("ease", "<f8"),
+    ("last_reviewed_time", "<f8"), # NaN for never reviewed
+    ("step", "<i2"),
+    ("status", "i1"),
+    ("level", "i1"),
+])
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class BinaryProgress(MutableMapping[int, dict]):
+    """Progress entries of a binary snapshot, read from a memory map as they are asked for.
+
+    Entries are keyed by card id. Opening costs nothing beyond mapping the file: an
+    entry is found by binary search on the sorted ids and built only when it is
+    looked up. Entries assigned
+    afterwards, such as replayed journal records, are kept in memory on top.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._records = np.zeros(0, dtype=RECORD_DTYPE)
+        self._text_offsets = np.zeros(1, dtype="<u8")
+        self._text = np.zeros(0, dtype=np.uint8)
+        self._overlay: dict[int, dict] = {}
+        self._deleted: set[int] = set()
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as f:
+                magic, count, text_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Not a binary progress file: {path}")
+            offset = _HEADER.size
+            if count:
+                self._records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=offset, shape=(count,))
+            offset += count * RECORD_DTYPE.itemsize
+            self._text_offsets = np.memmap(path, dtype="<u8", mode="r", offset=offset, shape=(count + 1,))
+            offset += (count + 1) * 8
+            if text_size:
+                self._text = np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(text_size,))
+
+    def _find(self, card_id: int) -> Optional[int]:
+        ids = self._records["card_id"]
+        position = int(np.searchsorted(ids, card_id))
+        if position < len(ids) and ids[position] == card_id:
+            return position
+        return None
+
+    def _texts(self, position: int) -> list[Optional[str]]:
+        start, end = int(self._text_offsets[position]), int(self._text_offsets[position + 1])
+        return json.loads(self._text[start:end].tobytes().decode("utf-8"))
+
+    def _entry(self, position: int) -> dict:
+        record = self._records[position]
+        japanese, reading, english = self._texts(position)
+        return {
+            "id": int(record["card_id"]),
+            "japanese": japanese,
+            "reading": reading,
+            "english": english,
+            "card": {
+                "status": STATUSES[int(record["status"])],
+                "step": int(record["step"]),
+                "interval": _optional(record["interval"]),
+                "ease": float(record["ease"]),
+                "level": int(record["level"]),
+            },
+            "last_reviewed_time": _optional(record["last_reviewed_time"]),
+        }
+
+    def __getitem__(self, card_id: int) -> dict:
+        if card_id in self._overlay:
+            return self._overlay[card_id]
+        position = self._find(card_id) if card_id not in self._deleted else None
+        if position is None:
+            raise KeyError(card_id)
+        return self._entry(position)
+
+    def __setitem__(self, card_id: int, entry: dict) -> None:
+        self._overlay[card_id] = entry
+
+    def __delitem__(self, card_id: int) -> None:
+        self[card_id] # KeyError for missing entries
+        self._overlay.pop(card_id, None)
+        self._deleted.add(card_id)
+
+    def __iter__(self) -> Iterator[int]:
+        for card_id in self._records["card_id"].tolist():
+            if card_id not in self._overlay and card_id not in self._deleted:
+                yield card_id
+        yield from self._overlay
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def release(self) -> None:
+        """Decode every entry into memory and unmap the file, so it can be replaced."""
+        entries = dict(self.items())
+        self._records = np.zeros(0, dtype=RECORD_DTYPE)
+        self._text_offsets = np.zeros(1, dtype="<u8")
+        self._text = np.zeros(0, dtype=np.uint8)
+        self._overlay, self._deleted = entries, set()
+
+
+def write_binary_progress(path: str, entries: list[dict]) -> None:
+    """Write progress entries as a binary snapshot, swapped in atomically."""
+    entries = sorted(entries, key=entry_id)
+    records = np.zeros(len(entries), dtype=RECORD_DTYPE)
+    texts = []
+    for i, entry in enumerate(entries):
+        card = entry["card"]
+        last_reviewed_time = entry.get("last_reviewed_time")
+        records[i] = (
+            entry_id(entry),
+            np.nan if card["interval"] is None else card["interval"],
+            card["ease"],
+            np.nan if last_reviewed_time is None else last_reviewed_time,
+            card["step"],
+            STATUS_CODES[card["status"]],
+            card["level"],
+        )
+        texts.append(json.dumps([entry["japanese"], entry.get("reading"), entry.get("english")],
+                                ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    text_offsets = np.cumsum([0] + [len(text) for text in texts], dtype="<u8")
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(entries), int(text_offsets[-1])))
+        f.write(records.tobytes())
+        f.write(text_offsets.tobytes())
+        f.write(b"".join(texts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def json_to_binary(json_path: str, binary_path: str) -> None:
+    """Convert a JSON progress snapshot to the binary format."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        write_binary_progress(binary_path, json.load(f))
+
+
+def binary_to_json(binary_path: str, json_path: str) -> None:
+    """Convert a binary progress snapshot back to a JSON snapshot with the same entries."""
+    entries = list(BinaryProgress(binary_path).values())
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, separators=(",", ":"))
+
+
+class BinaryProgressStore(ProgressJournal):
+    """A ``ProgressJournal`` whose snapshot is a memory-mapped binary record array.
+
+    Reviews are appended to the same JSON-lines journal; ``load`` maps the snapshot
+    and replays the journal on top, so only the cards that are looked up are decoded.
+    The first time a deck is opened, its JSON snapshot (if any) is converted; the
+    journal next to it is shared, as both snapshots sit in the same directory.
+    """
+
+    def __init__(self, snapshot_path: str, compact_every: int = 500, json_snapshot_path: Optional[str] = None):
+        super().__init__(snapshot_path, compact_every)
+        if json_snapshot_path is not None and not os.path.exists(snapshot_path) and os.path.exists(json_snapshot_path):
+            json_to_binary(json_snapshot_path, snapshot_path)
+        self._open_snapshots: list[weakref.ref[BinaryProgress]] = []
+
+    def _load_snapshot(self) -> BinaryProgress:
+        snapshot = BinaryProgress(self.snapshot_path)
+        self._open_snapshots = [ref for ref in self._open_snapshots if ref() is not None]
+        self._open_snapshots.append(weakref.ref(snapshot))
+        return snapshot
+
+    def compact(self, entries: Optional[dict[int, dict]] = None) -> None:
+        """Rewrite the snapshot as in ``ProgressJournal.compact``, from a plain dict.
+
+        Every snapshot this store has mapped is released first: Windows does not let
+        a file be replaced while it is memory-mapped.
+        """
+        entries = dict(self.load() if entries is None else entries)
+        for ref in self._open_snapshots:
+            if (snapshot := ref()) is not None:
+                snapshot.release()
+        self._open_snapshots = []
+        super().compact(entries)
+
+    def _write_snapshot(self, snapshot: list[dict]) -> None:
+        write_binary_progress(self.snapshot_path, snapshot)
@@ -0,0 +1,163 @@
+import csv
+import os
+from typing import Hashable, Iterator, Optional
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData, compute_card_id
+from spaced_repetition.card_store import CardStore
+from spaced_repetition.forecast import DueForecast
+from storage.files import file_signature
+from storage.journal import ProgressJournal
+from storage.progress_store import open_progress_store
+from storage.sqlite_store import SQLiteProgressStore
+
+# Parsed decks keyed by absolute CSV path: (signature of the CSV and its progress, cards).
+_cache: dict[str, tuple[Hashable, list[CardData]]] = {}
+# Due times of the cards last parsed for each deck, keyed like the cache.
+_forecasts: dict[str, DueForecast] = {}
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _signature(deck_path: str, progress_store: ProgressJournal | SQLiteProgressStore) -> Optional[Hashable]:
+    csv_signature = file_signature(deck_path)
+    if csv_signature is None:
+        return None
+    return csv_signature, progress_store.signature()
+
+
+def parse_deck(deck_path: str, progress_data: dict[int, dict]) -> list[CardData]:
+    """Read a vocab CSV and attach the saved progress of each row."""
+    return list(iter_deck(deck_path, progress_data))
+
+
+def iter_deck(deck_path: str, progress_data: dict[int, dict]) -> Iterator[CardData]:
+    """Like ``parse_deck``, yielding each card as soon as its row is read.
+
+    Progress is joined by card id, so rows that share their japanese keep apart.
+    """
+    with open(deck_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if len(row) >= 3:
+                japanese, reading, english = row
+                card_id = compute_card_id(japanese, reading, english)
+                card_data_from_progress = progress_data.get(card_id)
+                if card_data_from_progress:
+                    card = Card.from_dict(card_data_from_progress["card"])
+                    level = card.level
+                    last_reviewed = card_data_from_progress.get("last_reviewed_time")
+                else:
+                    card = Card()
+                    level = 0
+                    last_reviewed = None
+
+                yield CardData(
+                    card=card,
+                    japanese=japanese,
+                    english=english,
+                    reading=reading,
+                    level=level,
+                    last_reviewed_time=last_reviewed,
+                    card_id=card_id
+                )
+
+
+def load_deck_cards(deck_path: str, progress_store: Optional[ProgressJournal | SQLiteProgressStore] = None) -> list[CardData]:
+    """Cards of a deck with their progress, parsed once and reused while the files are unchanged.
+
+    The returned ``CardData`` objects are shared between callers, so a study session and
+    the progress screen see the same in-memory state. Decks whose files cannot be
+    stat'ed are parsed every time.
+    """
+    if progress_store is None:
+        progress_store = open_progress_store(deck_path)
+    cached = _cached_cards(deck_path, progress_store)
+    if cached is not None:
+        return cached
+    cards = []
+    for _ in _parse_batches(deck_path, progress_store, cards, DEFAULT_BATCH_SIZE):
+        pass
+    return cards
+
+
+def iter_deck_batches(deck_path: str, progress_store: Optional[ProgressJournal | SQLiteProgressStore] = None,
+                      batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[list[CardData]]:
+    """The cards of ``load_deck_cards`` in batches of ``batch_size``, parsing lazily.
+
+    A batch shorter than ``batch_size`` is the last one. The parsed deck is cached
+    before the last batch is handed out, so a consumer that stops there, or closes
+    the iterator early, still finds the full deck (or nothing) in the cache.
+    """
+    if progress_store is None:
+        progress_store = open_progress_store(deck_path)
+    cached = _cached_cards(deck_path, progress_store)
+    if cached is not None:
+        for start in range(0, len(cached), batch_size):
+            yield cached[start:start + batch_size]
+    else:
+        yield from _parse_batches(deck_path, progress_store, [], batch_size)
+
+
+def _parse_batches(deck_path: str, progress_store: ProgressJournal | SQLiteProgressStore,
+                   cards: list[CardData], batch_size: int) -> Iterator[list[CardData]]:
+    """Parse the deck into ``cards`` batch by batch and cache it before the last batch."""
+    key = os.path.abspath(deck_path)
+    signature = _signature(deck_path, progress_store)
+    forecast = _forecasts[key] = DueForecast()
+    batch = []
+    for card_data in iter_deck(deck_path, progress_store.load()):
+        cards.append(card_data)
+        batch.append(card_data)
+        if len(batch) == batch_size:
+            forecast.add(CardStore.from_card_data(batch).due_times())
+            yield batch
+            batch = []
+
+    forecast.add(CardStore.from_card_data(batch).due_times())
+    if signature is not None:
+        _cache[key] = (signature, cards)
+    else:
+        _cache.pop(key, None)
+    if batch:
+        yield batch
+
+
+def _cached_cards(deck_path: str, progress_store: ProgressJournal | SQLiteProgressStore) -> Optional[list[CardData]]:
+    signature = _signature(deck_path, progress_store)
+    cached = _cache.get(os.path.abspath(deck_path))
+    if signature is None or cached is None or cached[0] != signature:
+        return None
+    cards = cached[1]
+    for card_data in cards:
+        card_data.level = card_data.card.level # Session levels start from the saved level
+    return cards
+
+
+def deck_forecast(deck_path: str) -> DueForecast:
+    """Due-time forecast of the cards last loaded for a deck.
+
+    It is filled as the deck is parsed and shared like the cached cards; study sessions
+    reschedule the cards they answer in it, so it stays current without a rescan.
+    """
+    return _forecasts.setdefault(os.path.abspath(deck_path), DueForecast())
+
+
+def mark_progress_saved(deck_path: str, progress_store: ProgressJournal | SQLiteProgressStore) -> None:
+    """Keep the cached deck after the app itself wrote its progress.
+
+    Answers are applied to the shared ``CardData`` objects before they are recorded,
+    so the cache already reflects what was written and only its signature is stale.
+    """
+    key = os.path.abspath(deck_path)
+    if key in _cache:
+        signature = _signature(deck_path, progress_store)
+        if signature is None:
+            del _cache[key]
+        else:
+            _cache[key] = (signature, _cache[key][1])
+
+
+def clear_cache() -> None:
+    _cache.clear()
+    _forecasts.clear()
@@ -0,0 +1,13 @@
+import os
+from typing import Optional
+
+FileSignature = tuple[int, int]
+
+
+def file_signature(path: str) -> Optional[FileSignature]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
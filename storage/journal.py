@@ -0,0 +1,135 @@
+import json
+import os
+from typing import Iterable, Optional
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData, compute_card_id
+from storage.files import FileSignature, file_signature
+
+PROGRESS_DIR = os.path.join(os.path.dirname(__file__), '..', 'progress_files')
+
+
+def progress_path_for(deck_path: str) -> str:
+    """Path of the progress snapshot that belongs to a vocab CSV."""
+    deck_name = os.path.splitext(os.path.basename(deck_path))[0]
+    return os.path.join(PROGRESS_DIR, f"{deck_name}.json")
+
+
+def progress_entry(card_data: CardData) -> dict:
+    """Serializable progress record for one card, as stored in snapshots and the journal."""
+    return {
+        "id": card_data.card_id,
+        "japanese": card_data.japanese,
+        "reading": card_data.reading,
+        "english": card_data.english,
+        "card": card_data.card.to_dict(),
+        "last_reviewed_time": card_data.last_reviewed_time,
+    }
+
+
+def entry_id(entry: dict) -> int:
+    """Card id of a progress entry; entries written before ids existed get theirs computed."""
+    if entry.get("id") is None:
+        entry["id"] = compute_card_id(entry["japanese"], entry.get("reading"), entry.get("english", ""))
+    return entry["id"]
+
+
+def is_default_entry(entry: dict) -> bool:
+    """True for cards that are still in their initial state and need not be stored."""
+    default_card = Card()
+    return entry["card"]["status"] == default_card.status and entry["card"]["level"] == default_card.level
+
+
+class ProgressJournal:
+    """Progress for one deck: a JSON snapshot plus an append-only journal of reviews.
+
+    Every answered card is appended to the journal as one compact JSON line, so saving
+    costs O(1) per review and a crash loses at most the answer being written. Loading
+    replays the journal over the snapshot; ``compact`` folds the journal back into the
+    snapshot once it grows past ``compact_every`` records.
+    """
+
+    def __init__(self, snapshot_path: str, compact_every: int = 500):
+        self.snapshot_path = snapshot_path
+        self.journal_path = os.path.splitext(snapshot_path)[0] + ".journal"
+        self.compact_every = compact_every
+        self._journal_records: Optional[int] = None # Counted when first needed
+
+    @property
+    def journal_records(self) -> int:
+        """Records in the journal, including those written before this store was opened."""
+        if self._journal_records is None:
+            self._journal_records = 0
+            if os.path.exists(self.journal_path):
+                with open(self.journal_path, 'rb') as f:
+                    self._journal_records = sum(1 for _ in f)
+        return self._journal_records
+
+    def signature(self) -> tuple[Optional[FileSignature], Optional[FileSignature]]:
+        """Changes whenever the snapshot or the journal is written."""
+        return file_signature(self.snapshot_path), file_signature(self.journal_path)
+
+    def load(self) -> dict[int, dict]:
+        """Current progress entries keyed by card id."""
+        entries = self._load_snapshot()
+
+        journal_records = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue # Torn write from a crash; everything before it is intact
+                    entries[entry_id(entry)] = entry
+                    journal_records += 1
+        self._journal_records = journal_records
+        return entries
+
+    def _load_snapshot(self) -> dict[int, dict]:
+        entries = {}
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    entries[entry_id(entry)] = entry
+        return entries
+
+    def record(self, card_data: CardData) -> None:
+        self.record_entries([progress_entry(card_data)])
+
+    def record_entries(self, entries: Iterable[dict]) -> None:
+        """Append several progress entries to the journal in one write."""
+        lines = [json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in entries]
+        journal_records = self.journal_records # Counted before the new lines are appended
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write("".join(lines))
+        self._journal_records = journal_records + len(lines)
+
+    def needs_compaction(self) -> bool:
+        return self.journal_records >= self.compact_every
+
+    def flush(self) -> None:
+        """Records are already on disk; compact the journal if it has grown long."""
+        if self.needs_compaction():
+            self.compact()
+
+    def compact(self, entries: Optional[dict[int, dict]] = None) -> None:
+        """Rewrite the snapshot with the journal applied, then empty the journal."""
+        if entries is None:
+            entries = self.load()
+        self._write_snapshot([entry for entry in entries.values() if not is_default_entry(entry)])
+        # The snapshot is complete before the journal is cleared, so a crash here only
+        # means the same records are replayed again on the next load.
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+        self._journal_records = 0
+
+    def _write_snapshot(self, snapshot: list[dict]) -> None:
+        # Write next to the snapshot and swap it in, so a crash mid-write leaves the
+        # old snapshot in place instead of a truncated one.
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
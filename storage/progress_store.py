@@ -0,0 +1,33 @@
+import os
+from typing import Optional
+
+from storage.binary_store import BinaryProgressStore
+from storage.journal import PROGRESS_DIR, ProgressJournal, progress_path_for
+from storage.sqlite_store import SQLiteProgressStore
+
+# Selects the progress backend: "json" (snapshot plus journal, the default), "binary"
+# (memory-mapped snapshot plus journal) or "sqlite".
+PROGRESS_BACKEND_ENV = "BENKYOU_PROGRESS_BACKEND"
+PROGRESS_DB_PATH = os.path.join(PROGRESS_DIR, "progress.sqlite3")
+
+_sqlite_stores: dict[str, SQLiteProgressStore] = {}
+
+
+def open_progress_store(deck_path: str, backend: Optional[str] = None) -> ProgressJournal | SQLiteProgressStore:
+    """Progress store for a vocab CSV using the configured backend.
+
+    Every backend exposes ``load()``, ``record(card_data)``, ``record_entries(entries)``
+    and ``flush()``.
+    """
+    backend = backend or os.environ.get(PROGRESS_BACKEND_ENV, "json")
+    snapshot_path = progress_path_for(deck_path)
+    if backend == "json":
+        return ProgressJournal(snapshot_path)
+    if backend == "binary":
+        return BinaryProgressStore(os.path.splitext(snapshot_path)[0] + ".bin", json_snapshot_path=snapshot_path)
+    if backend == "sqlite":
+        deck_name = os.path.splitext(os.path.basename(deck_path))[0]
+        if deck_name not in _sqlite_stores:
+            _sqlite_stores[deck_name] = SQLiteProgressStore(PROGRESS_DB_PATH, deck_name, snapshot_path)
+        return _sqlite_stores[deck_name]
+    raise ValueError(f"Unknown progress backend: {backend!r}")
@@ -0,0 +1,164 @@
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+from spaced_repetition.card_data import CardData
+from storage.files import FileSignature, file_signature
+from storage.journal import ProgressJournal, entry_id, progress_entry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    deck TEXT NOT NULL,
+    card_id INTEGER NOT NULL,
+    card_key TEXT NOT NULL,
+    reading TEXT,
+    english TEXT,
+    status TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    interval REAL,
+    ease REAL NOT NULL,
+    level INTEGER NOT NULL,
+    last_reviewed_time REAL,
+    due REAL,
+    PRIMARY KEY (deck, card_id)
+);
+CREATE INDEX IF NOT EXISTS progress_card_key ON progress (card_key);
+CREATE INDEX IF NOT EXISTS progress_due ON progress (due);
+CREATE INDEX IF NOT EXISTS progress_deck_due ON progress (deck, due);
+CREATE TABLE IF NOT EXISTS migrated_decks (deck TEXT PRIMARY KEY);
+"""
+
+_UPSERT = """
+INSERT INTO progress (deck, card_id, card_key, reading, english, status, step, interval, ease, level, last_reviewed_time, due)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (deck, card_id) DO UPDATE SET
+    card_key = excluded.card_key,
+    reading = excluded.reading,
+    english = excluded.english,
+    status = excluded.status,
+    step = excluded.step,
+    interval = excluded.interval,
+    ease = excluded.ease,
+    level = excluded.level,
+    last_reviewed_time = excluded.last_reviewed_time,
+    due = excluded.due
+"""
+
+_COLUMNS = "card_id, card_key, reading, english, status, step, interval, ease, level, last_reviewed_time"
+# Columns of the first schema, keyed by (deck, card_key) alone
+_V0_COLUMNS = "deck, card_key, reading, english, status, step, interval, ease, level, last_reviewed_time"
+
+
+def _row_values(deck: str, entry: dict) -> tuple:
+    card = entry["card"]
+    last_reviewed_time = entry.get("last_reviewed_time")
+    due = None
+    if last_reviewed_time is not None and card["interval"] is not None:
+        due = last_reviewed_time + card["interval"]
+    return (
+        deck, entry_id(entry), entry["japanese"], entry.get("reading"), entry.get("english"),
+        card["status"], card["step"], card["interval"], card["ease"], card["level"],
+        last_reviewed_time, due,
+    )
+
+
+def _row_entry(row: tuple) -> dict:
+    card_id, card_key, reading, english, status, step, interval, ease, level, last_reviewed_time = row
+    return {
+        "id": card_id,
+        "japanese": card_key,
+        "reading": reading,
+        "english": english,
+        "card": {"status": status, "step": step, "interval": interval, "ease": ease, "level": level},
+        "last_reviewed_time": last_reviewed_time,
+    }
+
+
+class SQLiteProgressStore:
+    """Progress for one deck kept in a SQLite database shared by all decks.
+
+    Rows are keyed by deck and card id, keep the card's japanese text as its card key,
+    and carry the card's due timestamp, so due queries are answered from an index
+    without loading the deck. Each recorded batch is its own transaction. The first
+    time a deck is opened, its JSON snapshot and journal (if any) are migrated into
+    the database, and databases from before card ids are rebuilt with them.
+    """
+
+    def __init__(self, db_path: str, deck: str, json_snapshot_path: Optional[str] = None):
+        self.db_path = db_path
+        self.deck = deck
+        self._lock = threading.Lock()
+        self._revision = 0
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._migrate_card_ids()
+            self._connection.executescript(_SCHEMA)
+        if json_snapshot_path is not None:
+            self._migrate_json(json_snapshot_path)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _migrate_card_ids(self) -> None:
+        """Rebuild a progress table keyed by japanese text alone as one keyed by card id."""
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(progress)")]
+        if not columns or "card_id" in columns:
+            return
+        rows = self._connection.execute(f"SELECT {_V0_COLUMNS} FROM progress").fetchall()
+        self._connection.execute("BEGIN") # DDL is not in a transaction by default
+        self._connection.execute("DROP TABLE progress")
+        for statement in _SCHEMA.split(";"):
+            if statement.strip():
+                self._connection.execute(statement)
+        self._connection.executemany(_UPSERT, [_row_values(row[0], _row_entry((None,) + row[1:])) for row in rows])
+
+    def _migrate_json(self, json_snapshot_path: str) -> None:
+        with self._lock:
+            migrated = self._connection.execute("SELECT 1 FROM migrated_decks WHERE deck = ?", (self.deck,)).fetchone()
+        if migrated:
+            return
+        entries = ProgressJournal(json_snapshot_path).load()
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, [_row_values(self.deck, entry) for entry in entries.values()])
+            self._connection.execute("INSERT INTO migrated_decks (deck) VALUES (?)", (self.deck,))
+
+    def signature(self) -> tuple[int, Optional[FileSignature], Optional[FileSignature]]:
+        """Changes whenever this store records a review or another process writes the database."""
+        return self._revision, file_signature(self.db_path), file_signature(self.db_path + "-wal")
+
+    def load(self) -> dict[int, dict]:
+        """Current progress entries keyed by card id."""
+        with self._lock:
+            rows = self._connection.execute(f"SELECT {_COLUMNS} FROM progress WHERE deck = ?", (self.deck,)).fetchall()
+        return {row[0]: _row_entry(row) for row in rows}
+
+    def record(self, card_data: CardData) -> None:
+        self.record_entries([progress_entry(card_data)])
+
+    def record_entries(self, entries: Iterable[dict]) -> None:
+        """Upsert several progress entries in one transaction."""
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, [_row_values(self.deck, entry) for entry in entries])
+            self._revision += 1
+
+    def flush(self) -> None:
+        """Every review is committed as it is recorded, so there is nothing to flush."""
+
+    def next_due(self, now: float, limit: int = 50) -> list[dict]:
+        """The ``limit`` most overdue cards of this deck at ``now``, earliest due first."""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM progress WHERE deck = ? AND due <= ? ORDER BY due LIMIT ?",
+                (self.deck, now, limit),
+            ).fetchall()
+        return [_row_entry(row) for row in rows]
+
+    def due_counts(self, now: float) -> dict[str, int]:
+        """Number of reviewed cards due at ``now`` in every deck of the database."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT deck, COUNT(*) FROM progress WHERE due <= ? GROUP BY deck", (now,)
+            ).fetchall()
+        return dict(rows)
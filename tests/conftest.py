@@ -0,0 +1,13 @@
+from datetime import timedelta
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+
+
+def by_japanese(entries):
+    return {entry["japanese"]: entry for entry in entries.values()}
+
+
+def make_card_data(japanese, status="reviewing", interval_days=1, level=2, last_reviewed_time=1000.0):
+    card = Card(status=status, interval=timedelta(days=interval_days), level=level)
+    return CardData(card=card, japanese=japanese, english="E", reading="R", level=level, last_reviewed_time=last_reviewed_time)
@@ -0,0 +1,83 @@
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from frontend.audio import (
+    FADE_DURATION, JINGLE_FREQUENCIES, NOTE_DURATION, SAMPLE_RATE, AudioPlayer, NullSink, jingle, render_tone,
+    wav_bytes,
+)
+from frontend.widgets.study_session import StudySessionWidget
+
+
+class BlockingSink:
+    """Holds every buffer until released, to simulate a sound that is still playing."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.played = 0
+
+    def play(self, buffer):
+        self.started.set()
+        self.release.wait()
+        self.played += 1
+
+
+def test_jingle_is_rendered_once_with_fades():
+    buffer = jingle()
+    assert buffer is jingle()
+    assert buffer.dtype == np.float32
+    assert len(buffer) == len(JINGLE_FREQUENCIES) * int(SAMPLE_RATE * NOTE_DURATION)
+    assert not buffer.flags.writeable
+    assert np.abs(buffer).max() <= 0.5
+
+
+def test_tones_fade_in_and_out():
+    tone = render_tone(440, NOTE_DURATION)
+    fade = int(SAMPLE_RATE * FADE_DURATION)
+    assert tone[0] == 0.0
+    assert np.abs(tone[-3:]).max() < 0.01
+    assert np.abs(tone[fade:]).max() > 0.99
+
+
+def test_wav_bytes_holds_the_buffer():
+    data = wav_bytes(jingle())
+    assert data[:4] == b"RIFF"
+    assert len(data) == 44 + 2 * len(jingle())
+
+
+def test_player_plays_through_its_sink():
+    sink = NullSink()
+    player = AudioPlayer(sink)
+    assert player.play_jingle()
+    player.close()
+    assert sink.played == 1
+
+
+def test_rapid_requests_do_not_pile_up():
+    sink = BlockingSink()
+    player = AudioPlayer(sink)
+    player.play_jingle()
+    assert sink.started.wait(5)
+
+    # One request waits behind the playing jingle, the rest are dropped
+    results = [player.play_jingle() for _ in range(10)]
+    assert results == [True] + [False] * 9
+
+    sink.release.set()
+    player.close()
+    assert sink.played == 2
+
+
+def test_reward_user_uses_the_widget_player(qtbot):
+    sink = NullSink()
+    player = AudioPlayer(sink)
+    widget = StudySessionWidget(MagicMock(), audio_player=player)
+    qtbot.addWidget(widget)
+
+    widget.reward_user()
+    widget.reward_user()
+    player.close()
+
+    assert 1 <= sink.played <= 2
@@ -0,0 +1,107 @@
+import threading
+from datetime import timedelta
+
+import pytest
+
+from spaced_repetition.card import Card
+from storage.autosave import AutosaveWorker
+from storage.journal import ProgressJournal
+
+from conftest import by_japanese, make_card_data
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return ProgressJournal(str(tmp_path / "deck.json"))
+
+
+def test_record_returns_before_writing(journal):
+    autosave = AutosaveWorker(journal, interval=60)
+    autosave.record(make_card_data("犬"))
+    assert autosave.pending() == 1
+    assert journal.load() == {}
+    autosave.close()
+    assert "犬" in by_japanese(journal.load())
+
+
+def test_full_batch_is_written_in_the_background(journal):
+    saved = threading.Event()
+    autosave = AutosaveWorker(journal, interval=60, max_pending=2, on_saved=saved.set)
+    autosave.record(make_card_data("犬"))
+    autosave.record(make_card_data("猫"))
+
+    assert saved.wait(5)
+    assert set(by_japanese(journal.load())) == {"犬", "猫"}
+    autosave.close()
+
+
+def test_interval_writes_a_partial_batch(journal):
+    saved = threading.Event()
+    autosave = AutosaveWorker(journal, interval=0.05, on_saved=saved.set)
+    autosave.record(make_card_data("犬"))
+
+    assert saved.wait(5)
+    assert "犬" in by_japanese(journal.load())
+    autosave.close()
+
+
+def test_batch_keeps_the_latest_answer_of_each_card(journal):
+    autosave = AutosaveWorker(journal, interval=60)
+    card_data = make_card_data("犬", level=1)
+    autosave.record(card_data)
+    card_data.card = Card(status="reviewing", interval=timedelta(days=2), level=3)
+    autosave.record(card_data)
+    card_data.card = Card(level=0) # Changed after recording; not written
+    autosave.flush()
+
+    assert by_japanese(journal.load())["犬"]["card"]["level"] == 3
+    assert journal.journal_records == 1
+    autosave.close()
+
+
+def test_flush_compacts_a_long_journal(tmp_path):
+    journal = ProgressJournal(str(tmp_path / "deck.json"), compact_every=2)
+    autosave = AutosaveWorker(journal, interval=60)
+    for japanese in ("犬", "猫", "魚"):
+        autosave.record(make_card_data(japanese))
+    autosave.close()
+
+    assert journal.journal_records == 0
+    assert set(by_japanese(ProgressJournal(journal.snapshot_path).load())) == {"犬", "猫", "魚"}
+
+
+class FailingJournal(ProgressJournal):
+    def __init__(self, snapshot_path, failures):
+        super().__init__(snapshot_path)
+        self.failures = failures
+
+    def record_entries(self, entries):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        super().record_entries(entries)
+
+
+def test_failed_write_keeps_entries_pending(tmp_path):
+    journal = FailingJournal(str(tmp_path / "deck.json"), failures=1)
+    autosave = AutosaveWorker(journal, interval=60)
+    autosave.record(make_card_data("犬", level=1))
+    with pytest.raises(OSError):
+        autosave.flush()
+    autosave.record(make_card_data("猫"))
+    autosave.record(make_card_data("犬", level=2)) # Newer than the entry that failed
+    assert autosave.pending() == 2
+    autosave.close()
+    assert by_japanese(journal.load())["犬"]["card"]["level"] == 2
+    assert "猫" in by_japanese(journal.load())
+
+
+def test_worker_retries_after_a_failed_write(tmp_path):
+    saved = threading.Event()
+    journal = FailingJournal(str(tmp_path / "deck.json"), failures=2)
+    autosave = AutosaveWorker(journal, interval=0.01, on_saved=saved.set)
+    autosave.record(make_card_data("犬"))
+    assert saved.wait(5)
+    assert journal.failures == 0
+    assert "犬" in by_japanese(journal.load())
+    autosave.close()
@@ -0,0 +1,120 @@
+import json
+import time
+from datetime import timedelta
+
+import numpy as np
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData, compute_card_id
+from storage.binary_store import (
+    BinaryProgress, BinaryProgressStore, binary_to_json, json_to_binary, write_binary_progress,
+)
+from storage.journal import progress_entry
+
+from conftest import by_japanese
+
+
+def entry_card_id(japanese, reading="よみ"):
+    return compute_card_id(japanese, reading, f"{japanese} in english")
+
+
+def make_entry(japanese, level=2, interval=86400.0, reading="よみ", last_reviewed_time=1000.0):
+    return {
+        "japanese": japanese,
+        "reading": reading,
+        "english": f"{japanese} in english",
+        "card": {"status": "reviewing", "step": 0, "interval": interval, "ease": 2.35, "level": level},
+        "last_reviewed_time": last_reviewed_time,
+    }
+
+
+def test_json_round_trip_is_lossless(tmp_path):
+    entries = [
+        make_entry("犬"),
+        make_entry("猫", level=-1, reading=None),
+        make_entry("魚", interval=None, last_reviewed_time=None),
+    ]
+    entries[1]["card"].update(status="relearning", step=1)
+    json_path, binary_path, back_path = tmp_path / "deck.json", tmp_path / "deck.bin", tmp_path / "back.json"
+    json_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+
+    json_to_binary(str(json_path), str(binary_path))
+    binary_to_json(str(binary_path), str(back_path))
+
+    restored = json.loads(back_path.read_text(encoding="utf-8"))
+    for entry in entries:
+        entry["id"] = compute_card_id(entry["japanese"], entry["reading"], entry["english"])
+    assert sorted(restored, key=lambda entry: entry["japanese"]) == sorted(entries, key=lambda entry: entry["japanese"])
+
+
+def test_binary_progress_looks_up_entries_by_card_id(tmp_path):
+    path = str(tmp_path / "deck.bin")
+    write_binary_progress(path, [make_entry("犬"), make_entry("猫", level=3)])
+
+    progress = BinaryProgress(path)
+
+    assert progress[entry_card_id("猫")]["card"]["level"] == 3
+    assert progress.get(entry_card_id("鳥")) is None
+    assert set(progress) == {entry_card_id("犬"), entry_card_id("猫")}
+    assert isinstance(progress._records, np.memmap)
+    assert list(progress._records["card_id"]) == sorted([entry_card_id("犬"), entry_card_id("猫")])
+
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / "deck.bin")
+    write_binary_progress(path, [])
+    assert dict(BinaryProgress(path)) == {}
+    assert dict(BinaryProgress(str(tmp_path / "missing.bin"))) == {}
+
+
+def test_store_replays_journal_over_binary_snapshot(tmp_path):
+    store = BinaryProgressStore(str(tmp_path / "deck.bin"), compact_every=2)
+    card_data = CardData(card=Card(status="reviewing", interval=timedelta(days=1), level=1), japanese="犬", english="dog", reading="いぬ", last_reviewed_time=1000.0)
+    store.record(card_data)
+    assert by_japanese(store.load())["犬"] == progress_entry(card_data)
+
+    store.record(CardData(card=Card(status="reviewing", interval=timedelta(days=2), level=2), japanese="猫", english="cat", reading="ねこ", last_reviewed_time=2000.0))
+    store.flush()
+
+    assert store.journal_records == 0
+    reopened = BinaryProgressStore(str(tmp_path / "deck.bin")).load()
+    assert reopened[card_data.card_id] == progress_entry(card_data)
+    assert by_japanese(reopened)["猫"]["card"]["level"] == 2
+
+
+def test_store_converts_the_json_snapshot_once(tmp_path):
+    json_path = tmp_path / "deck.json"
+    json_path.write_text(json.dumps([make_entry("犬", level=3)], ensure_ascii=False), encoding="utf-8")
+
+    store = BinaryProgressStore(str(tmp_path / "deck.bin"), json_snapshot_path=str(json_path))
+
+    assert by_japanese(store.load())["犬"]["card"]["level"] == 3
+
+
+def test_compaction_releases_open_snapshots(tmp_path):
+    path = str(tmp_path / "deck.bin")
+    write_binary_progress(path, [make_entry("犬"), make_entry("猫", level=3)])
+    store = BinaryProgressStore(path)
+    progress = store.load()
+    store.record_entries([make_entry("猫", level=1)])
+
+    store.compact()
+
+    # The open snapshot no longer maps the file it was read from, yet keeps its entries
+    assert not isinstance(progress._records, np.memmap)
+    assert by_japanese(progress)["犬"]["card"]["level"] == 2
+    assert by_japanese(progress)["猫"]["card"]["level"] == 3
+    assert by_japanese(store.load())["猫"]["card"]["level"] == 1
+
+
+def test_large_snapshot_opens_without_decoding(tmp_path):
+    path = str(tmp_path / "big.bin")
+    write_binary_progress(path, [make_entry(f"単語{i}") for i in range(100_000)])
+
+    start = time.perf_counter()
+    progress = BinaryProgress(path)
+    found = [progress.get(entry_card_id(f"単語{i}")) for i in range(0, 100_000, 1000)]
+    elapsed = time.perf_counter() - start
+
+    assert all(entry is not None for entry in found)
+    assert elapsed < 1.0
@@ -100,3 +100,89 @@ def test_card_from_dict():
     assert card.ease == 3.0
     assert card.step == 1
     assert card.level == 2
+
+def as_tuple(card):
+    return (card.status, card.interval, round(card.ease, 4), card.step, card.level)
+
+# Expected (status, interval, ease, step, level) for again, hard, good and easy.
+@pytest.mark.parametrize("card, change, expected", [
+    (Card(level=2), 1, [
+        ("learning", timedelta(minutes=1), 2.5, 0, 0),
+        ("learning", timedelta(minutes=3), 2.5, 1, 3),
+        ("learning", timedelta(minutes=5), 2.5, 1, 3),
+        ("reviewing", timedelta(days=4), 2.5, 0, 4),
+    ]),
+    (Card(level=2), -1, [
+        ("learning", timedelta(minutes=1), 2.5, 0, 0),
+        ("learning", timedelta(minutes=3), 2.5, 1, 1),
+        ("learning", timedelta(minutes=5), 2.5, 1, 1),
+        ("reviewing", timedelta(days=4), 2.5, 0, 0),
+    ]),
+    (Card(level=-1), 1, [
+        ("learning", timedelta(minutes=1), 2.5, 0, 0),
+        ("learning", timedelta(minutes=3), 2.5, 1, 0),
+        ("learning", timedelta(minutes=5), 2.5, 1, 0),
+        ("reviewing", timedelta(days=4), 2.5, 0, 1),
+    ]),
+    (Card(interval=timedelta(minutes=3), step=1, level=2), 1, [
+        ("learning", timedelta(minutes=1), 2.5, 0, 0),
+        ("learning", timedelta(minutes=3), 2.5, 1, 3),
+        ("reviewing", timedelta(days=1), 2.5, 0, 3),
+        ("reviewing", timedelta(days=4), 2.5, 0, 4),
+    ]),
+    (Card(interval=timedelta(minutes=3), step=1, level=2), -1, [
+        ("learning", timedelta(minutes=1), 2.5, 0, 0),
+        ("learning", timedelta(minutes=3), 2.5, 1, 1),
+        ("reviewing", timedelta(days=1), 2.5, 0, 1),
+        ("reviewing", timedelta(days=4), 2.5, 0, 0),
+    ]),
+    (Card(status="reviewing", interval=timedelta(days=10), ease=2.0, level=3), 1, [
+        ("relearning", timedelta(minutes=10), 1.8, 0, 4),
+        ("reviewing", timedelta(days=12), 1.85, 0, 4),
+        ("reviewing", timedelta(days=20), 2.0, 0, 4),
+        ("reviewing", timedelta(days=30), 2.15, 0, 4),
+    ]),
+    (Card(status="reviewing", interval=timedelta(days=10), ease=2.0, level=3), -1, [
+        ("relearning", timedelta(minutes=10), 1.8, 0, 2),
+        ("reviewing", timedelta(days=12), 1.85, 0, 2),
+        ("reviewing", timedelta(days=20), 2.0, 0, 2),
+        ("reviewing", timedelta(days=30), 2.15, 0, 2),
+    ]),
+    (Card(status="reviewing", interval=timedelta(days=10), ease=1.4, level=0), -1, [
+        ("relearning", timedelta(minutes=10), 1.3, 0, 0),
+        ("reviewing", timedelta(days=12), 1.3, 0, 0),
+        ("reviewing", timedelta(days=14), 1.4, 0, 0),
+        ("reviewing", timedelta(days=21), 1.55, 0, 0),
+    ]),
+    (Card(status="relearning", interval=timedelta(minutes=10), ease=2.1, level=4), 1, [
+        ("relearning", timedelta(minutes=1), 2.1, 0, 4),
+        ("relearning", timedelta(minutes=6), 2.1, 0, 4),
+        ("reviewing", timedelta(days=1), 2.1, 0, 4),
+        ("reviewing", timedelta(days=4), 2.1, 0, 4),
+    ]),
+    (Card(status="relearning", interval=timedelta(minutes=10), ease=2.1, level=4), -1, [
+        ("relearning", timedelta(minutes=1), 2.1, 0, 3),
+        ("relearning", timedelta(minutes=6), 2.1, 0, 3),
+        ("reviewing", timedelta(days=1), 2.1, 0, 3),
+        ("reviewing", timedelta(days=4), 2.1, 0, 3),
+    ]),
+])
+def test_card_apply_transitions(card, change, expected):
+    assert [as_tuple(card.apply(rating, change)) for rating in range(4)] == expected
+    assert [as_tuple(option) for _, option in card.options(change)] == expected
+
+@pytest.mark.parametrize("rating, name", [(0, "again"), (1, "hard"), (2, "good"), (3, "easy")])
+def test_card_apply_accepts_rating_names(rating, name):
+    card = Card(status="reviewing", interval=timedelta(days=10), level=2)
+    assert as_tuple(card.apply(name, 1)) == as_tuple(card.apply(rating, 1))
+
+def test_card_apply_reviewing_good():
+    card = Card(status="reviewing", interval=timedelta(days=10), level=1)
+    applied = card.apply("good", 1)
+    assert applied.interval == timedelta(days=25)
+    assert applied.level == 2
+
+def test_card_has_slots():
+    card = Card()
+    with pytest.raises(AttributeError):
+        card.extra = 1
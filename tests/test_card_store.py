@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.card_store import CardStore, RATINGS
+
+
+@pytest.fixture
+def cards():
+    return [
+        Card(),
+        Card(step=1, level=1),
+        Card(status="reviewing", interval=timedelta(days=10), ease=2.0, level=3),
+        Card(status="reviewing", interval=timedelta(days=3), ease=1.4, level=4),
+        Card(status="relearning", interval=timedelta(minutes=10), ease=2.3, level=2),
+    ]
+
+
+def test_round_trip_cards(cards):
+    store = CardStore.from_cards(cards)
+    assert len(store) == len(cards)
+    for original, restored in zip(cards, store.cards()):
+        assert restored.to_dict() == original.to_dict()
+
+
+def test_round_trip_card_data(cards):
+    card_data = [CardData(card=card, japanese=f"Q{i}", english=f"A{i}", last_reviewed_time=None if i == 0 else 1000.0 + i)
+                 for i, card in enumerate(cards)]
+    store = CardStore.from_card_data(card_data)
+    store.last_reviewed_time[1] = 5000.0
+    store.write_back(card_data)
+    assert card_data[0].last_reviewed_time is None
+    assert card_data[1].last_reviewed_time == 5000.0
+    assert card_data[2].card.to_dict() == cards[2].to_dict()
+
+
+@pytest.mark.parametrize("change", [1, -1])
+@pytest.mark.parametrize("rating", range(len(RATINGS)))
+def test_next_state_matches_card_options(cards, rating, change):
+    store = CardStore.from_cards(cards)
+    state = store.next_state(np.arange(len(cards)), rating, change)
+    for i, card in enumerate(cards):
+        expected = card.options(change)[rating][1]
+        assert state["status"][i] == ("learning", "reviewing", "relearning").index(expected.status)
+        assert state["step"][i] == expected.step
+        assert state["interval"][i] == pytest.approx(expected.interval.total_seconds())
+        assert state["ease"][i] == pytest.approx(expected.ease)
+        assert state["level"][i] == expected.level
+
+
+def test_due_mask_and_histogram():
+    cards = [
+        Card(),
+        Card(status="reviewing", interval=timedelta(days=1), level=2),
+        Card(status="reviewing", interval=timedelta(days=4), level=4),
+    ]
+    store = CardStore.from_cards(cards, [None, 0.0, 0.0])
+    now = timedelta(days=2).total_seconds()
+    assert store.due_mask(now).tolist() == [True, True, False]
+    assert store.due_indices(now).tolist() == [0, 1]
+    assert store.level_histogram().tolist() == [1, 0, 1, 0, 1]
+
+
+def test_histogram_counts_negative_levels_as_learned():
+    store = CardStore.from_cards([Card(level=-1), Card(level=0), Card(level=4)])
+    assert store.level_histogram().tolist() == [1, 0, 0, 0, 2]
+
+
+def test_schedule_updates_in_place(cards):
+    store = CardStore.from_cards(cards)
+    store.schedule(np.array([0, 2]), np.array([3, 2]), 1, now=100.0)
+    assert store.card(0).status == "reviewing"
+    assert store.card(0).interval == timedelta(days=4)
+    assert store.card(2).interval == timedelta(days=20)
+    assert store.last_reviewed_time[[0, 2]].tolist() == [100.0, 100.0]
+    assert np.isnan(store.last_reviewed_time[1])
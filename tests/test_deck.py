@@ -1,7 +1,9 @@
 import time
+from datetime import timedelta
 from collections import deque
 from spaced_repetition.card import Card
 from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import VirtualClock
 from spaced_repetition.deck import Deck
 import pytest
 
@@ -105,4 +107,71 @@ def test_get_next_card_review_deck_after_levels(deck):
     assert deck.get_next_card() == card_data_review
 
 def test_get_all_cards_empty(deck):
-    assert deck.get_all_cards() == []
\ No newline at end of file
+    assert deck.get_all_cards() == []
+
+def test_check_waiting_deck_keeps_cards_not_due(deck):
+    due_card = CardData(card=Card(interval=timedelta(minutes=1)), japanese="Due", english="A", last_reviewed_time=time.time() - 120)
+    later_card = CardData(card=Card(interval=timedelta(minutes=10)), japanese="Later", english="B", last_reviewed_time=time.time())
+    deck.requeue_card(later_card)
+    deck.requeue_card(due_card)
+    deck.check_waiting_deck()
+    assert list(deck.waiting_deck) == [later_card]
+    assert deck.levels[0] == deque([due_card])
+
+def test_check_waiting_deck_releases_in_queue_order(deck):
+    card_data_1 = CardData(card=Card(), japanese="Q1", english="A1", last_reviewed_time=time.time() - 10)
+    card_data_2 = CardData(card=Card(), japanese="Q2", english="A2")
+    deck.requeue_card(card_data_1)
+    deck.requeue_card(card_data_2)
+    assert deck.get_next_card() == card_data_2
+    assert deck.get_next_card() == card_data_1
+
+def test_shuffle_orders_waiting_cards_by_sort_key(deck):
+    cards = [CardData(card=Card(), japanese=f"Q{i}", english=f"A{i}") for i in range(10)]
+    for card_data in cards:
+        deck.requeue_card(card_data)
+    deck.shuffle()
+    drawn = [deck.get_next_card() for _ in cards]
+    assert drawn == sorted(cards, key=lambda c: c.sort_key, reverse=True)
+
+def test_requeue_cards_matches_shuffle():
+    cards = [CardData(card=Card(), japanese=str(i), english="A") for i in range(20)]
+    shuffled = Deck()
+    for card_data in cards:
+        shuffled.requeue_card(card_data)
+    shuffled.shuffle()
+    batched = Deck()
+    batched.requeue_cards(cards)
+    assert [batched.get_next_card() for _ in cards] == [shuffled.get_next_card() for _ in cards]
+
+def test_batched_deck_is_drawn_in_shuffle_order():
+    cards = [CardData(card=Card(level=i % 2), japanese=str(i), english="A") for i in range(1200)]
+    shuffled = Deck(seed=7)
+    for card_data in cards:
+        shuffled.requeue_card(card_data)
+    shuffled.shuffle()
+    expected = [shuffled.get_next_card() for _ in cards]
+
+    batched = Deck(seed=7)
+    for start in range(0, len(cards), 500):
+        batched.requeue_cards(cards[start:start + 500])
+    assert [batched.get_next_card() for _ in cards] == expected
+
+def test_batch_added_mid_session_merges_into_shuffle_order():
+    cards = [CardData(card=Card(), japanese=str(i), english="A") for i in range(1200)]
+    deck = Deck()
+    deck.requeue_cards(cards[:500])
+    drawn = [deck.get_next_card() for _ in range(100)]
+    deck.requeue_cards(cards[500:])
+    rest = [deck.get_next_card() for _ in range(1100)]
+    drawn_ids = {id(card_data) for card_data in drawn}
+    remaining = [card_data for card_data in cards if id(card_data) not in drawn_ids]
+    assert rest == sorted(remaining, key=lambda c: c.sort_key, reverse=True)
+
+def test_next_due_time_is_earliest_waiting_card():
+    deck = Deck(clock=VirtualClock(1000.0))
+    assert deck.next_due_time() is None
+    later = CardData(card=Card(interval=timedelta(minutes=10)), japanese="Later", english="A", last_reviewed_time=1000.0)
+    sooner = CardData(card=Card(interval=timedelta(minutes=1)), japanese="Sooner", english="A", last_reviewed_time=1000.0)
+    deck.requeue_cards([later, sooner])
+    assert deck.next_due_time() == 1060.0
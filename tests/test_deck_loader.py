@@ -0,0 +1,116 @@
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.forecast import DAY
+from spaced_repetition.study_session import StudySession
+from storage import deck_loader
+from storage.journal import ProgressJournal, progress_entry
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    deck_loader.clear_cache()
+    yield
+    deck_loader.clear_cache()
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    path = tmp_path / "deck.csv"
+    path.write_text("勉強,べんきょう,to study\n犬,いぬ,dog\n", encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProgressJournal(str(tmp_path / "deck.json"))
+
+
+def test_parses_rows_with_progress(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    assert [card_data.japanese for card_data in cards] == ["勉強", "犬"]
+    assert cards[1].reading == "いぬ"
+    assert cards[1].card.status == "learning"
+
+
+def test_reuses_parsed_deck_while_files_are_unchanged(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    assert deck_loader.load_deck_cards(deck_path, store) is cards
+
+
+def test_reparses_when_csv_changes(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    with open(deck_path, 'a', encoding='utf-8') as f:
+        f.write("猫,ねこ,cat\n")
+    reloaded = deck_loader.load_deck_cards(deck_path, store)
+    assert reloaded is not cards
+    assert len(reloaded) == 3
+
+
+def test_reparses_when_progress_changes_elsewhere(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    answered = deck_loader.parse_deck(deck_path, {})[0]
+    answered.card = Card(status="reviewing", level=2)
+    store.record(answered)
+
+    reloaded = deck_loader.load_deck_cards(deck_path, store)
+    assert reloaded is not cards
+    assert reloaded[0].card.level == 2
+
+
+def test_own_writes_keep_cache(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    cards[0].card = Card(status="reviewing", level=2)
+    cards[0].level = 3
+    store.record(cards[0])
+    deck_loader.mark_progress_saved(deck_path, store)
+
+    reloaded = deck_loader.load_deck_cards(deck_path, store)
+    assert reloaded is cards
+    assert reloaded[0].level == 2
+
+
+def test_rows_sharing_japanese_keep_their_own_progress(tmp_path, store):
+    path = tmp_path / "homographs.csv"
+    path.write_text("上手,じょうず,skilful\n上手,うわて,superior\n", encoding='utf-8')
+    cards = deck_loader.parse_deck(str(path), {})
+    cards[1].card = Card(status="reviewing", level=3)
+    store.record(cards[1])
+
+    reloaded = deck_loader.parse_deck(str(path), store.load())
+    assert [card_data.card.level for card_data in reloaded] == [0, 3]
+
+
+def test_joins_entries_saved_without_an_id(deck_path, store):
+    answered = deck_loader.parse_deck(deck_path, {})[1]
+    answered.card = Card(status="reviewing", level=2)
+    entry = progress_entry(answered)
+    del entry["id"]
+    store.record_entries([entry])
+
+    cards = deck_loader.parse_deck(deck_path, store.load())
+    assert cards[1].card.level == 2
+    assert cards[1].card_id == answered.card_id
+
+
+def test_unstattable_deck_is_not_cached(monkeypatch, deck_path, store):
+    monkeypatch.setattr(deck_loader, "file_signature", lambda path: None)
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    assert deck_loader.load_deck_cards(deck_path, store) is not cards
+
+
+def test_forecast_is_shared_with_the_cached_deck(deck_path, store):
+    cards = deck_loader.load_deck_cards(deck_path, store)
+    forecast = deck_loader.deck_forecast(deck_path)
+    assert forecast.due_by(0.0) == 2
+
+    session = StudySession("jap_to_eng", progress_store=store, forecast_of=lambda card_data: forecast)
+    session.add_cards(cards)
+    question = session.next_question()
+    session.answer(question.card_data.english, now=1000.0)
+    deck_loader.mark_progress_saved(deck_path, store)
+
+    assert deck_loader.load_deck_cards(deck_path, store) is cards
+    assert deck_loader.deck_forecast(deck_path) is forecast
+    assert forecast.due_by(1000.0) == 1
+    assert forecast.due_by(1000.0 + DAY) == 2
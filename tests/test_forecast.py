@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.forecast import DAY, HOUR, DueForecast
+from spaced_repetition.study_session import StudySession
+
+
+def test_histogram_counts_cards_per_bucket():
+    forecast = DueForecast([-np.inf, 50.0, HOUR + 1, 2 * HOUR, 5 * HOUR])
+    assert forecast.histogram(0.0, 3, HOUR).tolist() == [2, 2, 0]
+    assert forecast.due_by(HOUR) == 2
+    assert len(forecast) == 5
+
+
+def test_add_merges_new_due_times_in_order():
+    forecast = DueForecast([3 * DAY, DAY])
+    forecast.add(np.array([2 * DAY, -np.inf]))
+    assert forecast.histogram(0.0, 3).tolist() == [2, 1, 1]
+
+
+def test_reschedule_moves_one_card():
+    forecast = DueForecast([DAY, DAY, 2 * DAY])
+    forecast.reschedule(DAY, 3 * DAY + 1)
+    assert forecast.histogram(0.0, 4).tolist() == [1, 1, 0, 1]
+    with pytest.raises(KeyError):
+        forecast.reschedule(10 * DAY, DAY)
+
+
+def test_study_session_updates_forecast_after_each_answer():
+    forecast = DueForecast([-np.inf])
+    session = StudySession("jap_to_eng", forecast_of=lambda card_data: forecast)
+    session.add_cards([CardData(card=Card(), japanese="犬", english="dog", reading="いぬ")])
+    assert forecast.due_by(0.0) == 1
+
+    session.next_question()
+    session.answer("dog", now=1000.0)
+
+    assert forecast.due_by(1000.0) == 0
+    assert forecast.due_by(1000.0 + DAY) == 1
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from spaced_repetition.card import Card
+from storage.journal import ProgressJournal, progress_path_for
+
+from conftest import by_japanese, make_card_data
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return ProgressJournal(str(tmp_path / "deck.json"), compact_every=3)
+
+
+def test_progress_path_for():
+    assert progress_path_for("/some/vocab_files/N5.csv").endswith("progress_files/N5.json")
+
+
+def test_load_empty(journal):
+    assert journal.load() == {}
+
+
+def test_append_and_replay(journal):
+    journal.record(make_card_data("犬", level=1))
+    journal.record(make_card_data("猫"))
+    journal.record(make_card_data("犬", level=3, last_reviewed_time=2000.0))
+
+    entries = by_japanese(ProgressJournal(journal.snapshot_path).load())
+    assert set(entries) == {"犬", "猫"}
+    assert entries["犬"]["card"]["level"] == 3
+    assert entries["犬"]["last_reviewed_time"] == 2000.0
+
+
+def test_replay_skips_torn_line(journal):
+    journal.record(make_card_data("犬"))
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"japanese": "猫", "car')
+    assert set(by_japanese(journal.load())) == {"犬"}
+
+
+def test_compact_writes_snapshot_and_clears_journal(journal):
+    with open(journal.snapshot_path, 'w', encoding='utf-8') as f:
+        json.dump([{"japanese": "鳥", "reading": "とり", "english": "bird", "card": Card(level=1).to_dict(), "last_reviewed_time": 5.0}], f)
+    journal.record(make_card_data("犬"))
+    journal.record(make_card_data("猫", status="learning", level=0))
+    journal.record(make_card_data("魚"))
+    assert journal.needs_compaction()
+
+    journal.compact()
+    assert not journal.needs_compaction()
+    with open(journal.journal_path, encoding='utf-8') as f:
+        assert f.read() == ""
+    with open(journal.snapshot_path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    # Cards back in their default state are dropped from the snapshot
+    assert sorted(entry["japanese"] for entry in snapshot) == ["犬", "魚", "鳥"]
+    assert set(by_japanese(ProgressJournal(journal.snapshot_path).load())) == {"犬", "魚", "鳥"}
+
+
+def test_flush_compacts_long_journal(journal):
+    for japanese in ("犬", "猫"):
+        journal.record(make_card_data(japanese))
+    journal.flush()
+    assert journal.journal_records == 2
+    journal.record(make_card_data("魚"))
+    journal.flush()
+    assert journal.journal_records == 0
+    assert set(by_japanese(journal.load())) == {"犬", "猫", "魚"}
+
+
+def test_reopened_journal_counts_existing_records(journal):
+    for japanese in ("犬", "猫"):
+        journal.record(make_card_data(japanese))
+
+    reopened = ProgressJournal(journal.snapshot_path, compact_every=3)
+    assert reopened.journal_records == 2
+    reopened.record(make_card_data("魚"))
+    reopened.flush() # Compacts without a load() first
+    assert reopened.journal_records == 0
+    with open(reopened.journal_path, encoding='utf-8') as f:
+        assert f.read() == ""
+
+
+def test_compact_crash_keeps_old_snapshot(journal, monkeypatch):
+    journal.record(make_card_data("犬"))
+    journal.compact()
+    journal.record(make_card_data("猫"))
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", crash)
+    with pytest.raises(OSError):
+        journal.compact()
+    monkeypatch.undo()
+
+    # The snapshot is untouched and the journal still holds the newer record
+    assert set(by_japanese(ProgressJournal(journal.snapshot_path).load())) == {"犬", "猫"}
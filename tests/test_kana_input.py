@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from translation.kana_input import IncrementalKanaConverter, to_kana_mixed_case
+from translation.romaji_to_kana import to_hiragana, to_katakana
+
+
+def test_to_kana_mixed_case():
+    assert to_kana_mixed_case("") == ""
+    assert to_kana_mixed_case("benkyou") == "べんきょう"
+    assert to_kana_mixed_case("AMERIKAjin") == "アメリカじん"
+    assert to_kana_mixed_case("kore ha PEN desu") == "これ は ペン です"
+
+
+def segment_reference(text):
+    """Convert each run of same-case characters on its own, from scratch."""
+    result = ""
+    start = 0
+    for i in range(1, len(text) + 1):
+        if i == len(text) or text[i].isupper() != text[start].isupper():
+            segment = text[start:i]
+            result += to_katakana(segment) if segment[0].isupper() else to_hiragana(segment)
+            start = i
+    return result
+
+
+@pytest.mark.parametrize("word", ["benkyoushimasu", "konnichiha", "AMERIKAjin", "kannji", "nnn", "shinnbunn", "kyoukasho"])
+def test_incremental_matches_full_conversion_while_typing(word):
+    converter = IncrementalKanaConverter()
+    for end in range(len(word) + 1):
+        assert converter.convert(word[:end]) == to_kana_mixed_case(word[:end])
+
+
+def test_incremental_handles_edits():
+    converter = IncrementalKanaConverter()
+    rng = random.Random(0)
+    alphabet = "aiueonkstyhmrwgzdbpjcAKNSTO '-"
+    text = ""
+    for _ in range(2000):
+        if text and rng.random() < 0.2:
+            text = text[:rng.randrange(len(text))]
+        else:
+            text += rng.choice(alphabet)
+        assert converter.convert(text) == segment_reference(text) == to_kana_mixed_case(text)
+
+
+def test_incremental_keeps_settled_prefix():
+    converter = IncrementalKanaConverter()
+    converter.convert("benkyoushimas")
+    assert converter._settled_text == "benkyoushima"
+    assert converter._settled_kana == "べんきょうしま"
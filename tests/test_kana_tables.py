@@ -0,0 +1,30 @@
+import translation.kana_tables as kana_tables
+import translation.romaji_to_kana as romkan
+from translation.generate_kana_tables import OUTPUT_PATH, main, render
+from translation.kana_source import build_tables, source_digest
+
+
+def test_generated_tables_match_the_source_tables():
+    assert kana_tables.SOURCE_DIGEST == source_digest()
+    for name, table in build_tables().items():
+        assert getattr(kana_tables, name) == table, name
+
+
+def test_generated_module_is_up_to_date():
+    with open(OUTPUT_PATH, "r", encoding="utf-8") as f:
+        assert f.read() == render()
+    assert main(["--check"]) == 0
+
+
+def test_check_reports_a_stale_module(monkeypatch, tmp_path):
+    stale_path = tmp_path / "kana_tables.py"
+    stale_path.write_text("SOURCE_DIGEST = 'stale'\n", encoding="utf-8")
+    monkeypatch.setattr("translation.generate_kana_tables.OUTPUT_PATH", str(stale_path))
+    assert main(["--check"]) == 1
+
+
+def test_converter_uses_the_generated_automaton():
+    assert romkan.ROMTRIE.nodes is kana_tables.ROMTRIE_NODES
+    assert romkan.to_hiragana("kyouha") == "きょうは"
+    assert romkan.to_katakana("konpyuuta") == "コンピュウタ"
+    assert romkan.to_roma("きょうは") == "kyouha"
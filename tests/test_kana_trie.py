@@ -0,0 +1,50 @@
+import csv
+import os
+import random
+import re
+
+import pytest
+
+import translation.romaji_to_kana as romkan
+from translation.kana_trie import KanaTrie
+
+N5_PATH = os.path.join(os.path.dirname(__file__), '..', 'vocab_files', 'N5.csv')
+
+
+def regex_converter(table):
+    """The alternation-based conversion the trie replaces, kept as a reference."""
+    pattern = re.compile("|".join(sorted(table.keys(), key=lambda x: -len(x))))
+    return lambda text: pattern.sub(lambda m: table[m.group(0)], romkan.normalize_double_n(text.lower()))
+
+
+def n5_inputs():
+    with open(N5_PATH, 'r', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    inputs = []
+    for row in rows:
+        for field in row:
+            romaji = romkan.to_roma(field)
+            inputs.extend([field, romaji, romaji.upper()])
+    return inputs
+
+
+def random_inputs(count=5000):
+    rng = random.Random(0)
+    alphabet = "aiueonnkstyhmrwgzdbpfjcvx'- NK1"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("convert, table", [
+    (romkan.to_hiragana, romkan.ROMKAN_H),
+    (romkan.to_katakana, romkan.ROMKAN),
+])
+def test_matches_regex_conversion(convert, table):
+    reference = regex_converter(table)
+    for text in n5_inputs() + random_inputs():
+        assert convert(text) == reference(text), text
+
+
+def test_longest_match_and_passthrough():
+    trie = KanaTrie({"k": "K", "ka": "か", "kya": "きゃ", "a": "あ"})
+    assert trie.convert("kyakax!") == "きゃかx!"
+    assert trie.convert("ky") == "Ky"
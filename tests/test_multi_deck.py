@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import VirtualClock
+from spaced_repetition.multi_deck import MultiDeck, MultiDeckProgress
+from spaced_repetition.study_session import StudySession
+
+
+def make_batches(prefix, count, batch_size, level=0, **card_args):
+    cards = [CardData(card=Card(level=level, **card_args), japanese=f"{prefix}{i}", english=f"{prefix} {i}", reading="よみ")
+             for i in range(count)]
+    batches_read = []
+
+    def batches():
+        for start in range(0, count, batch_size):
+            batches_read.append(start)
+            yield cards[start:start + batch_size]
+    return cards, batches(), batches_read
+
+
+class RecordingStore:
+    def __init__(self):
+        self.recorded = []
+        self.flushed = False
+
+    def record(self, card_data):
+        self.recorded.append(card_data.japanese)
+
+    def flush(self):
+        self.flushed = True
+
+
+def test_multi_deck_loads_one_batch_per_deck_up_front():
+    multi_deck = MultiDeck(VirtualClock(1000.0))
+    n5, n5_batches, n5_read = make_batches("N5-", 10, 2)
+    n4, n4_batches, n4_read = make_batches("N4-", 10, 2)
+    multi_deck.add_deck("N5.csv", n5_batches)
+    multi_deck.add_deck("N4.csv", n4_batches)
+
+    card_data = multi_deck.get_next_card()
+
+    assert card_data is not None
+    assert n5_read == [0] and n4_read == [0]
+    assert len(multi_deck.get_all_cards()) == 3
+
+
+def test_multi_deck_serves_higher_levels_first_across_decks():
+    multi_deck = MultiDeck(VirtualClock(1000.0))
+    _, low_batches, _ = make_batches("low", 2, 10, level=0)
+    high, high_batches, _ = make_batches("high", 2, 10, level=2)
+    multi_deck.add_deck("low.csv", low_batches)
+    multi_deck.add_deck("high.csv", high_batches)
+
+    served = [multi_deck.get_next_card() for _ in range(4)]
+
+    assert {card_data.japanese for card_data in served[:2]} == {card_data.japanese for card_data in high}
+    assert all(card_data.japanese.startswith("low") for card_data in served[2:])
+    assert multi_deck.get_next_card() is None
+
+
+def test_multi_deck_reads_on_past_waiting_batches():
+    clock = VirtualClock(1000.0)
+    multi_deck = MultiDeck(clock)
+    waiting = [CardData(card=Card(interval=timedelta(days=1)), japanese="w", english="w", last_reviewed_time=1000.0)]
+    new = [CardData(card=Card(), japanese="n", english="n")]
+    multi_deck.add_deck("deck.csv", iter([waiting, new]))
+
+    assert multi_deck.get_next_card() is new[0]
+    assert multi_deck.get_next_card() is None
+    assert multi_deck.next_due_time() == 1000.0 + 24 * 60 * 60
+
+
+def test_study_session_records_answers_in_each_decks_store():
+    clock = VirtualClock(1000.0)
+    multi_deck = MultiDeck(clock)
+    _, n5_batches, _ = make_batches("N5-", 1, 5)
+    _, n4_batches, _ = make_batches("N4-", 1, 5)
+    multi_deck.add_deck("N5.csv", n5_batches)
+    multi_deck.add_deck("N4.csv", n4_batches)
+    stores = {"N5.csv": RecordingStore(), "N4.csv": RecordingStore()}
+    session = StudySession("jap_to_eng", multi_deck, MultiDeckProgress(multi_deck, stores), clock=clock)
+
+    for _ in range(2):
+        question = session.next_question()
+        session.answer(question.card_data.english)
+        session.requeue()
+    session.save()
+
+    assert stores["N5.csv"].recorded == ["N5-0"]
+    assert stores["N4.csv"].recorded == ["N4-0"]
+    assert all(store.flushed for store in stores.values())
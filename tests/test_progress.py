@@ -2,10 +2,14 @@
 import os
 import json
 import time
+from datetime import timedelta
 from unittest.mock import MagicMock, mock_open, patch
-from frontend.widgets.progress import ProgressWidget
+from frontend.widgets.progress import CARD_ROLE, DUE_ROLE, ProgressWidget
+from spaced_repetition.clock import VirtualClock
 from PyQt6.QtWidgets import QLineEdit, QPushButton
 from PyQt6.QtCore import Qt
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
 
 
 def test_progress_widget(qtbot, monkeypatch):
@@ -40,8 +44,10 @@ def test_progress_widget(qtbot, monkeypatch):
     widget.load_deck(deck_path)
 
     # Check if the card is displayed
-    assert len(widget.all_word_widgets) == 1
-    assert widget.all_word_widgets[0].word_data.japanese == "勉強"
+    assert widget.proxy_model.rowCount() == 1
+    assert widget.proxy_model.index(0, 0).data(CARD_ROLE).japanese == "勉強"
+    assert widget.proxy_model.index(0, 0).data(DUE_ROLE)
+    assert widget.pulse_timer.isActive()
 
     # Check stats
     assert "Total Cards: 1" in widget.stats_label.text()
@@ -49,11 +55,103 @@ def test_progress_widget(qtbot, monkeypatch):
 
     # Filter cards
     widget.search_input.setText("study")
-    assert widget.all_word_widgets[0].isVisible()
+    assert widget.proxy_model.rowCount() == 1
 
     widget.search_input.setText("dog")
-    assert not widget.all_word_widgets[0].isVisible()
+    assert widget.proxy_model.rowCount() == 0
+
+    widget.search_input.setText("")
+    assert widget.proxy_model.rowCount() == 1
 
     # Go back
     qtbot.mouseClick(widget.findChild(QPushButton, "back_button"), Qt.MouseButton.LeftButton)
     back_callback.assert_called_once()
+
+
+def test_word_delegate_paints_rows(qtbot):
+    from PyQt6.QtGui import QImage, QPainter
+    from PyQt6.QtWidgets import QStyleOptionViewItem
+    from frontend.widgets.progress import WordDelegate, WordListModel
+
+    model = WordListModel()
+    card = CardData(card=Card(level=4), japanese="勉強", reading="べんきょう", english="to study", level=4, last_reviewed_time=None)
+    model.set_cards([card], [True])
+    delegate = WordDelegate()
+    delegate.pulse_state = True
+
+    option = QStyleOptionViewItem()
+    size = delegate.sizeHint(option, model.index(0, 0))
+    assert size.height() == delegate.row_height
+
+    image = QImage(300, delegate.row_height, QImage.Format.Format_RGB32)
+    image.fill(0)
+    option.rect = image.rect()
+    painter = QPainter(image)
+    delegate.paint(painter, option, model.index(0, 0))
+    painter.end()
+    # The inside of a due row is painted in the pulse color
+    assert image.pixelColor(280, delegate.row_height // 2).name() == WordDelegate.PULSE_COLOR.lower()
+
+
+def test_progress_widget_streams_batches_into_filtered_view(qtbot, tmp_path):
+    deck_path = tmp_path / "streamed_deck.csv"
+    deck_path.write_text("".join(f"単語{i},たんご{i},word {i}\n" for i in range(7)) + "猫,ねこ,cat\n", encoding='utf-8')
+
+    widget = ProgressWidget(MagicMock())
+    qtbot.addWidget(widget)
+    widget.deck_loader.batch_size = 2
+    widget.search_input.setText("word")
+
+    with qtbot.waitSignal(widget.deck_loader.finished, timeout=5000):
+        widget.load_deck(str(deck_path))
+        assert widget.word_model.rowCount() == 2
+        assert widget.loading_label.isVisibleTo(widget)
+
+    assert widget.word_model.rowCount() == 8
+    assert widget.proxy_model.rowCount() == 7
+    assert "Total Cards: 8" in widget.stats_label.text()
+    assert not widget.loading_label.isVisibleTo(widget)
+
+    widget.search_input.setText("cat")
+    assert [widget.proxy_model.index(0, 0).data(CARD_ROLE).japanese] == ["猫"]
+
+
+def test_progress_stats_count_negative_levels_as_learned(qtbot, tmp_path):
+    deck_path = tmp_path / "learned_deck.csv"
+    deck_path.write_text("勉強,べんきょう,to study\n犬,いぬ,dog\n", encoding='utf-8')
+
+    widget = ProgressWidget(MagicMock())
+    qtbot.addWidget(widget)
+    with patch("storage.deck_loader.iter_deck") as iter_deck:
+        iter_deck.return_value = iter([
+            CardData(card=Card(level=-1), japanese="勉強", english="to study", reading="べんきょう", level=-1),
+            CardData(card=Card(), japanese="犬", english="dog", reading="いぬ"),
+        ])
+        widget.load_deck(str(deck_path))
+
+    assert "Learned Cards: 1" in widget.stats_label.text()
+    assert "Level 4 (Master): 1" in widget.stats_label.text()
+    assert "Level 0 (Unknown): 1" in widget.stats_label.text()
+
+
+def test_progress_forecast_histogram_counts_due_days(qtbot, tmp_path):
+    deck_path = tmp_path / "forecast_deck.csv"
+    deck_path.write_text("勉強,べんきょう,to study\n犬,いぬ,dog\n猫,ねこ,cat\n", encoding='utf-8')
+    now = 1_000_000.0
+
+    widget = ProgressWidget(MagicMock(), clock=VirtualClock(now))
+    qtbot.addWidget(widget)
+    with patch("storage.deck_loader.iter_deck") as iter_deck:
+        iter_deck.return_value = iter([
+            CardData(card=Card(status="reviewing", interval=timedelta(days=1)), japanese="勉強", english="to study", reading="べんきょう", last_reviewed_time=now - 60),
+            CardData(card=Card(status="reviewing", interval=timedelta(days=3)), japanese="犬", english="dog", reading="いぬ", last_reviewed_time=now - 3600),
+            CardData(card=Card(), japanese="猫", english="cat", reading="ねこ"),
+        ])
+        widget.load_deck(str(deck_path))
+        widget.show()
+        qtbot.waitExposed(widget)
+
+    counts = widget.forecast_histogram.counts.tolist()
+    assert len(counts) == ProgressWidget.FORECAST_DAYS
+    assert counts[:3] == [2, 0, 1] # New and due within a day, then due within three days
+    assert sum(counts) == 3
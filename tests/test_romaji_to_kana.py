@@ -1,5 +1,10 @@
 
+import csv
+import os
+import time
+
 import pytest
+import translation.romaji_to_kana as romkan
 from translation.romaji_to_kana import (
     to_katakana,
     to_hiragana,
@@ -8,8 +13,19 @@ from translation.romaji_to_kana import (
     to_kunrei,
     to_roma,
     normalize_double_n,
+    to_hiragana_many,
+    to_katakana_many,
+    to_roma_many,
 )
 
+N5_PATH = os.path.join(os.path.dirname(__file__), '..', 'vocab_files', 'N5.csv')
+
+
+def n5_romaji():
+    with open(N5_PATH, 'r', encoding='utf-8') as f:
+        readings = [row[1] for row in csv.reader(f) if len(row) >= 3]
+    return [to_roma(reading) for reading in readings]
+
 
 def test_normalize_double_n():
     assert normalize_double_n("nani") == "nani"
@@ -44,3 +60,40 @@ def test_to_roma():
     assert to_roma("にほん") == "nihon"
     assert to_roma("しんぶん") == "shinbun"
     assert to_roma("ちゃ") == "cha"
+
+
+EDGE_CASES = ["", "Onna", "kannji", "sannpo", "n", "nn", "xtsu", "a\x1fb", "tōkyō", "shin'ya", "KYOU", "a\nb"]
+
+
+@pytest.mark.parametrize("many, single", [
+    (to_hiragana_many, to_hiragana),
+    (to_katakana_many, to_katakana),
+    (to_roma_many, to_roma),
+])
+def test_batch_conversion_matches_single_conversion(many, single):
+    inputs = n5_romaji() + [to_hiragana(word) for word in n5_romaji()] + EDGE_CASES
+    assert many(inputs) == [single(text) for text in inputs]
+    assert many(iter(inputs[:10])) == [single(text) for text in inputs[:10]]
+    assert many([]) == []
+
+
+def test_batch_converts_repeated_inputs_once(monkeypatch):
+    converted = []
+    convert = romkan._BATCH_CONVERTERS["roma"]
+    monkeypatch.setitem(romkan._BATCH_CONVERTERS, "roma", lambda text: converted.append(text) or convert(text))
+    assert to_roma_many(["ねこ", "いぬ", "ねこ", "ねこ"]) == ["neko", "inu", "neko", "neko"]
+    assert converted == ["ねこ\x1fいぬ"]
+
+
+def test_large_batches_can_use_a_process_pool(monkeypatch):
+    monkeypatch.setattr(romkan, "PARALLEL_THRESHOLD", 100)
+    inputs = [f"{word}{i}" for i, word in enumerate(n5_romaji()[:300])]
+    assert to_hiragana_many(inputs, processes=2) == [to_hiragana(text) for text in inputs]
+
+
+def test_batch_converts_a_large_word_list_quickly():
+    words = n5_romaji()
+    inputs = [f"{words[i % len(words)]}{i}" for i in range(100_000)]
+    start = time.perf_counter()
+    to_hiragana_many(inputs)
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from utils.fuzzy_match import fuzzy_match
+from utils.search_index import SearchIndex, normalize_kana
+import translation.romaji_to_kana as romkan
+
+WORDS = [
+    ("勉強", "べんきょう", "to study"),
+    ("犬", "いぬ", "dog"),
+    ("テレビ", "テレビ", "television"),
+    ("食べる", "たべる", "to eat"),
+    ("[括弧]", "かっこ", "brackets (symbol)"),
+]
+
+
+def make_cards(words):
+    return [CardData(card=Card(), japanese=j, reading=r, english=e, level=0, last_reviewed_time=None) for j, r, e in words]
+
+
+def reference_matches(query, cards):
+    kana_queries = [normalize_kana(romkan.to_hiragana(query)), normalize_kana(romkan.to_katakana(query))]
+    return [
+        i for i, c in enumerate(cards)
+        if fuzzy_match(query, c.japanese) or fuzzy_match(query, c.reading) or fuzzy_match(query, c.english)
+        or any(fuzzy_match(kana, normalize_kana(c.reading)) for kana in kana_queries)
+    ]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("", [0, 1, 2, 3, 4]),
+    ("study", [0]),
+    ("STUDY", [0]),
+    ("benkyou", [0]),
+    ("inu", [1]),
+    ("terebi", [2]),
+    ("てれび", [2]),
+    ("taru", [3]),
+    ("(", [4]),
+    ("[", [4]),
+    ("xyz", []),
+])
+def test_search(query, expected):
+    assert SearchIndex(make_cards(WORDS)).search(query) == expected
+
+
+def test_search_does_not_match_across_fields():
+    # "y" only appears in "study" and "dog" has no "u", so "yd" would need two fields.
+    assert SearchIndex(make_cards(WORDS)).search("yd") == []
+
+
+def test_search_while_typing_matches_reference():
+    cards = make_cards(WORDS)
+    index = SearchIndex(cards)
+    rng = random.Random(0)
+    query = ""
+    for _ in range(500):
+        if query and rng.random() < 0.3:
+            query = query[:rng.randrange(len(query))]
+        else:
+            query += rng.choice("abekinorstuyべんテ ()")
+        assert index.search(query) == reference_matches(query, cards)
+
+
+def test_search_empty_deck():
+    assert SearchIndex([]).search("a") == []
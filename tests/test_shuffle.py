@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.deck import Deck
+from spaced_repetition.shuffle import DAY, daily_seed, shuffle_key, shuffle_keys, shuffle_order
+
+
+def make_cards(count):
+    return [CardData(card=Card(), japanese=f"語{i}", english=f"word {i}") for i in range(count)]
+
+
+def test_bulk_keys_match_single_keys():
+    card_ids = np.array([card_data.card_id for card_data in make_cards(50)] + [-2 ** 63, 2 ** 63 - 1, 0])
+    for seed in (0, 1, 20250101):
+        assert shuffle_keys(card_ids, seed).tolist() == [shuffle_key(int(card_id), seed) for card_id in card_ids]
+
+
+def test_keys_are_in_unit_interval_and_spread():
+    keys = shuffle_keys(np.arange(10_000), seed=3)
+    assert keys.min() >= 0.0 and keys.max() < 1.0
+    assert np.histogram(keys, bins=10, range=(0, 1))[0].min() > 800
+
+
+def test_seed_changes_the_order():
+    card_ids = np.array([card_data.card_id for card_data in make_cards(30)])
+    assert shuffle_order(card_ids, 1).tolist() == shuffle_order(card_ids, 1).tolist()
+    assert shuffle_order(card_ids, 1).tolist() != shuffle_order(card_ids, 2).tolist()
+    assert daily_seed(5 * DAY + 10) == daily_seed(6 * DAY - 1) != daily_seed(6 * DAY)
+
+
+def test_building_cards_leaves_global_random_alone():
+    random.seed(42)
+    expected = random.random()
+    random.seed(42)
+    make_cards(100)
+    assert random.random() == expected
+
+
+def test_seeded_deck_shuffle_matches_requeue_cards():
+    cards = make_cards(40)
+    shuffled = Deck(seed=7)
+    for card_data in cards:
+        shuffled.requeue_card(card_data)
+    shuffled.shuffle()
+    batched = Deck(seed=7)
+    batched.requeue_cards(cards)
+
+    drawn = [shuffled.get_next_card() for _ in cards]
+    assert drawn == [batched.get_next_card() for _ in cards]
+    assert drawn == sorted(cards, key=lambda card_data: shuffle_key(card_data.card_id, 7), reverse=True)
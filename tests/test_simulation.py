@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import numpy as np
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.card_store import MAX_LEVEL, CardStore
+from spaced_repetition.clock import VirtualClock
+from spaced_repetition.deck import Deck
+from spaced_repetition.simulation import DAY, constant_accuracy, forgetting_curve_accuracy, simulate
+from spaced_repetition.study_session import StudySession
+
+
+def test_virtual_clock_moves_only_when_told():
+    clock = VirtualClock(100.0)
+    assert clock.now() == 100.0
+    assert clock.advance(50.0) == 150.0
+    clock.set(10.0)
+    assert clock.now() == 10.0
+
+
+def test_deck_releases_waiting_cards_on_virtual_clock():
+    clock = VirtualClock(1000.0)
+    deck = Deck(clock)
+    card_data = CardData(card=Card(interval=timedelta(days=1)), japanese="Q", english="A", last_reviewed_time=1000.0)
+    deck.requeue_card(card_data)
+
+    assert deck.get_next_card() is None
+    clock.advance(DAY)
+    assert deck.get_next_card() is card_data
+
+
+def test_study_session_stamps_answers_with_its_clock():
+    clock = VirtualClock(5000.0)
+    session = StudySession("jap_to_eng", clock=clock)
+    session.add_cards([CardData(card=Card(), japanese="犬", english="dog", reading="いぬ")])
+    question = session.next_question()
+    session.answer("dog")
+    assert question.card_data.last_reviewed_time == 5000.0
+
+
+def test_simulate_introduces_new_cards_per_day():
+    store = CardStore(100)
+    report = simulate(store, 10, constant_accuracy(1.0), new_cards_per_day=7, rng=np.random.default_rng(0))
+
+    assert report.daily_new.tolist() == [7] * 10
+    assert np.count_nonzero(report.introduction_day >= 0) == 70
+    assert report.daily_reviews[0] >= 7
+    assert np.count_nonzero(~np.isnan(store.last_reviewed_time)) == 70
+
+
+def test_simulate_perfect_recall_masters_cards():
+    store = CardStore(50)
+    report = simulate(store, 60, constant_accuracy(1.0), new_cards_per_day=50, rng=np.random.default_rng(0))
+
+    assert report.mastered == 50
+    assert (store.level == MAX_LEVEL).all()
+    assert (report.time_to_mastery() >= 0).all()
+    assert report.backlog[-1] == 0
+
+
+def test_simulate_review_cap_builds_backlog():
+    store = CardStore(500)
+    report = simulate(store, 30, constant_accuracy(0.5), new_cards_per_day=100,
+                      max_reviews_per_day=50, rng=np.random.default_rng(0))
+
+    assert (report.daily_reviews <= 50).all()
+    assert report.backlog[-1] > 0
+
+
+def test_simulate_ten_thousand_cards_for_a_year():
+    store = CardStore(10_000)
+    report = simulate(store, 365, forgetting_curve_accuracy(0.9), rng=np.random.default_rng(0))
+
+    assert len(report.daily_reviews) == 365
+    assert report.daily_new.sum() == 365 * 20
+    assert report.mastered > 0
+
+
+def test_simulate_rates_answers_like_a_study_session():
+    def reviewed_card():
+        card = Card(status="reviewing", interval=timedelta(hours=1), level=2)
+        return CardData(card=card, japanese="犬", english="dog", reading="いぬ", level=2, last_reviewed_time=1.0)
+
+    session = StudySession("jap_to_eng", clock=VirtualClock(DAY))
+    card_data = reviewed_card()
+    session.add_cards([card_data])
+    session.next_question()
+    session.answer("dog")
+
+    store = CardStore.from_card_data([reviewed_card()])
+    simulate(store, 1, constant_accuracy(1.0), new_cards_per_day=0, rng=np.random.default_rng(0))
+
+    # Session level 3 rates the answer "easy", which a fixed "good" would have missed
+    assert store.card(0).to_dict() == card_data.card.to_dict()
+    assert store.interval[0] == 3600 * 2.5 * 1.5
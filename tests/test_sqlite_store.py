@@ -0,0 +1,86 @@
+import json
+import sqlite3
+
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData, compute_card_id
+from storage.progress_store import open_progress_store
+from storage.sqlite_store import SQLiteProgressStore
+
+from conftest import by_japanese, make_card_data
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "progress.sqlite3")
+
+
+def test_record_and_load(db_path):
+    store = SQLiteProgressStore(db_path, "N5")
+    store.record(make_card_data("犬", level=1))
+    store.record(make_card_data("犬", level=3))
+    store.record(make_card_data("猫"))
+
+    entries = by_japanese(SQLiteProgressStore(db_path, "N5").load())
+    assert set(entries) == {"犬", "猫"}
+    assert entries["犬"]["card"]["level"] == 3
+    assert entries["犬"]["card"]["interval"] == 86400.0
+    assert entries["犬"]["reading"] == "R"
+    assert SQLiteProgressStore(db_path, "N4").load() == {}
+
+
+def test_due_queries(db_path):
+    day = 86400.0
+    n5 = SQLiteProgressStore(db_path, "N5")
+    n4 = SQLiteProgressStore(db_path, "N4")
+    n5.record(make_card_data("犬", interval_days=1, last_reviewed_time=0.0))
+    n5.record(make_card_data("猫", interval_days=3, last_reviewed_time=0.0))
+    n5.record(make_card_data("魚", interval_days=2, last_reviewed_time=0.0))
+    n4.record(make_card_data("鳥", interval_days=1, last_reviewed_time=0.0))
+
+    assert [entry["japanese"] for entry in n5.next_due(now=2 * day)] == ["犬", "魚"]
+    assert [entry["japanese"] for entry in n5.next_due(now=10 * day, limit=1)] == ["犬"]
+    assert n5.due_counts(now=2 * day) == {"N5": 2, "N4": 1}
+
+
+def test_migrates_json_once(tmp_path, db_path):
+    snapshot_path = str(tmp_path / "N5.json")
+    with open(snapshot_path, 'w', encoding='utf-8') as f:
+        json.dump([{"japanese": "勉強", "reading": "べんきょう", "english": "to study",
+                    "card": Card(level=2).to_dict(), "last_reviewed_time": 5.0}], f)
+
+    store = SQLiteProgressStore(db_path, "N5", snapshot_path)
+    assert by_japanese(store.load())["勉強"]["card"]["level"] == 2
+
+    card_data = CardData(card=Card(level=4), japanese="勉強", english="to study", reading="べんきょう", level=4)
+    store.record(card_data)
+    reopened = SQLiteProgressStore(db_path, "N5", snapshot_path).load()
+    assert list(reopened) == [card_data.card_id]
+    assert reopened[card_data.card_id]["card"]["level"] == 4
+
+
+def test_rebuilds_tables_from_before_card_ids(db_path):
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute(
+            "CREATE TABLE progress (deck TEXT NOT NULL, card_key TEXT NOT NULL, reading TEXT, english TEXT, "
+            "status TEXT NOT NULL, step INTEGER NOT NULL, interval REAL, ease REAL NOT NULL, "
+            "level INTEGER NOT NULL, last_reviewed_time REAL, due REAL, PRIMARY KEY (deck, card_key))"
+        )
+        connection.execute(
+            "INSERT INTO progress VALUES ('N5', '犬', 'いぬ', 'dog', 'reviewing', 0, 86400.0, 2.5, 2, 0.0, 86400.0)"
+        )
+    connection.close()
+
+    entries = SQLiteProgressStore(db_path, "N5").load()
+
+    card_id = compute_card_id("犬", "いぬ", "dog")
+    assert list(entries) == [card_id]
+    assert entries[card_id]["card"]["level"] == 2
+    assert SQLiteProgressStore(db_path, "N5").next_due(now=86400.0)[0]["id"] == card_id
+
+
+def test_open_progress_store_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        open_progress_store("/path/to/N5.csv", backend="csv")
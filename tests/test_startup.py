@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Time from importing the app to the main menu being painted, in a fresh interpreter.
+# A cold start used to spend most of its time importing NumPy and building every screen.
+STARTUP_BUDGET = 1.0 # Seconds
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+from frontend.app import MainWindow
+window = MainWindow()
+window.show()
+app.processEvents()
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+HEAVY_MODULES = (
+    "numpy",
+    "sounddevice",
+    "translation.romaji_to_kana",
+    "frontend.widgets.study_session",
+    "frontend.widgets.progress",
+)
+
+
+def run_startup():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=ROOT, env=env, capture_output=True,
+                            text=True, check=True, timeout=60).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_main_menu_starts_without_heavy_modules():
+    result = run_startup()
+    assert not set(HEAVY_MODULES) & set(result["modules"])
+    assert result["elapsed"] < STARTUP_BUDGET
+
+
+def test_screens_are_built_on_first_navigation(qtbot):
+    from frontend.app import MainWindow
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    assert window.stacked_widget.count() == 1
+
+    window.show_study_menu()
+    assert window.stacked_widget.currentWidget() is window.study_menu
+    window.show_main_menu()
+    window.show_study_menu()
+    assert window.stacked_widget.count() == 2
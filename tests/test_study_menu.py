@@ -1,7 +1,7 @@
 import os
 from unittest.mock import MagicMock
 from frontend.widgets.study_menu import StudyMenuWidget
-from PyQt6.QtWidgets import QPushButton, QRadioButton
+from PyQt6.QtWidgets import QCheckBox, QPushButton, QRadioButton
 from PyQt6.QtCore import Qt
 
 def test_study_menu_widget(qtbot, monkeypatch):
@@ -34,4 +34,22 @@ def test_study_menu_widget(qtbot, monkeypatch):
     study_deck_callback.assert_called_with(expected_path, "jap_to_eng")
 
     qtbot.mouseClick(widget.findChild(QPushButton, "back_button"), Qt.MouseButton.LeftButton)
-    back_callback.assert_called_once()
\ No newline at end of file
+    back_callback.assert_called_once()
+
+def test_study_menu_studies_selected_decks(qtbot, monkeypatch):
+    study_decks_callback = MagicMock()
+    monkeypatch.setattr(os, "listdir", lambda path: ["N5.csv", "N4.csv", "N3.csv"])
+
+    widget = StudyMenuWidget(MagicMock(), MagicMock(), study_decks_callback)
+    qtbot.addWidget(widget)
+    study_button = widget.findChild(QPushButton, "study_selected_button")
+    assert not study_button.isEnabled()
+
+    widget.findChild(QCheckBox, "deck_checkbox_N5").setChecked(True)
+    widget.findChild(QCheckBox, "deck_checkbox_N3").setChecked(True)
+    widget.findChild(QRadioButton, "mixed_radio").setChecked(True)
+    qtbot.mouseClick(study_button, Qt.MouseButton.LeftButton)
+
+    expected_paths = [os.path.join(widget.vocab_path, name) for name in ("N5.csv", "N3.csv")]
+    study_decks_callback.assert_called_once_with(expected_paths, "mixed")
+
@@ -1,10 +1,14 @@
 import os
 import json
 import time
+from datetime import timedelta
 from unittest.mock import MagicMock, patch, mock_open
 from frontend.widgets.study_session import StudySessionWidget
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import VirtualClock
 from PyQt6.QtWidgets import QPushButton, QLineEdit
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractAnimation, Qt
 
 
 def test_study_session_widget(qtbot, monkeypatch):
@@ -41,10 +45,10 @@ def test_study_session_widget(qtbot, monkeypatch):
     widget.start_study_session(deck_path, mode)
 
     # Check if the first card is displayed
-    assert widget.question_label.text() == "to study"
+    assert widget.question_label.text() == "dog"
 
     # Simulate typing the correct answer
-    widget.answer_input.setText("benkyou")
+    widget.answer_input.setText("inu")
     qtbot.keyClick(widget.answer_input, Qt.Key.Key_Return)
 
     # Check feedback
@@ -54,7 +58,7 @@ def test_study_session_widget(qtbot, monkeypatch):
     qtbot.mouseClick(widget.continue_button, Qt.MouseButton.LeftButton)
 
     # Check if the second card is displayed
-    assert widget.question_label.text() == "dog"
+    assert widget.question_label.text() == "to study"
 
     # Simulate typing the wrong answer
     widget.answer_input.setText("wrong")
@@ -110,18 +114,57 @@ def test_reward_user_function(qtbot, monkeypatch):
         # Verify reward_user was called
         mock_reward.assert_called_once()
 
+    # Write the answer while the file system is still mocked
+    widget.stop_autosave()
+
 
 def test_reward_animation_properties(qtbot):
-    """Test that reward animation properties are properly initialized."""
+    """Test that the reward animation drives the card frame without stylesheets."""
     back_callback = MagicMock()
-    widget = StudySessionWidget(back_callback)
+    widget = StudySessionWidget(back_callback, audio_player=MagicMock())
     qtbot.addWidget(widget)
 
-    # Check that animation properties are initialized
-    assert hasattr(widget, 'animation_timer')
-    assert hasattr(widget, 'animation_phase')
-    assert hasattr(widget, 'original_style')
-    
     # Check initial values
-    assert widget.animation_phase == 0
-    assert widget.original_style == ""
\ No newline at end of file
+    animation = widget.card_frame.pulse_animation
+    assert animation.targetObject() is widget.card_frame
+    assert animation.duration() == widget.card_frame.PULSE_DURATION
+    assert not widget.card_frame.get_pulse_color().isValid()
+
+    with patch.object(widget.card_frame, "setStyleSheet") as set_style_sheet:
+        widget.reward_user()
+        assert animation.state() == QAbstractAnimation.State.Running
+        qtbot.waitUntil(lambda: widget.card_frame.get_pulse_color().isValid(), timeout=1000)
+        qtbot.waitUntil(lambda: animation.state() == QAbstractAnimation.State.Stopped, timeout=3000)
+
+    set_style_sheet.assert_not_called()
+    assert not widget.card_frame.get_pulse_color().isValid()
+    widget.audio_player.play_jingle.assert_called_once()
+
+
+def test_waiting_cards_wake_the_session_when_due(qtbot):
+    clock = VirtualClock(1_000_000.0)
+    widget = StudySessionWidget(MagicMock(), clock=clock)
+    qtbot.addWidget(widget)
+    card = Card(interval=timedelta(minutes=1), step=1)
+    widget.session.add_cards([CardData(card=card, japanese="犬", english="dog", reading="いぬ", last_reviewed_time=clock.now())])
+
+    widget.next_card()
+
+    assert widget.question_label.text() == "Next card in 1:00"
+    assert widget.wake_timer.isActive()
+    assert 59_000 < widget.wake_timer.remainingTime() <= 60_001
+
+    clock.advance(60)
+    widget.wake_timer.timeout.emit()
+
+    assert widget.question_label.text() == "dog"
+    assert not widget.wake_timer.isActive()
+    assert not widget.countdown_timer.isActive()
+
+
+def test_deck_finished_when_nothing_is_waiting(qtbot):
+    widget = StudySessionWidget(MagicMock())
+    qtbot.addWidget(widget)
+    widget.next_card()
+    assert widget.question_label.text() == "Deck finished!"
+    assert not widget.wake_timer.isActive()
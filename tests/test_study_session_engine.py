@@ -0,0 +1,109 @@
+import random
+import subprocess
+import sys
+import time
+
+import pytest
+
+from spaced_repetition.card import Card
+from spaced_repetition.card_data import CardData
+from spaced_repetition.clock import VirtualClock
+from spaced_repetition.study_session import StudySession
+from storage.journal import ProgressJournal
+
+from conftest import by_japanese
+
+
+def make_cards():
+    return [
+        CardData(card=Card(), japanese="勉強", english="to study", reading="べんきょう"),
+        CardData(card=Card(), japanese="犬", english="dog", reading="いぬ"),
+    ]
+
+
+def test_study_session_imports_no_qt():
+    code = "import sys, spaced_repetition.study_session; print(any(m.startswith('PyQt6') for m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_study_session_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        StudySession("jap_to_jap")
+
+
+def test_next_question_prompt_follows_mode():
+    session = StudySession("jap_to_eng")
+    session.add_cards(make_cards())
+    question = session.next_question()
+    assert question.is_japanese
+    assert question.prompt == question.card_data.japanese
+
+
+def test_next_question_returns_none_when_deck_is_empty():
+    session = StudySession()
+    assert session.next_question() is None
+    assert session.current is None
+
+
+def test_answer_correct_romaji_raises_level_and_records(tmp_path):
+    journal = ProgressJournal(str(tmp_path / "deck.json"))
+    session = StudySession("eng_to_jap", progress_store=journal)
+    session.add_cards(make_cards())
+    question = session.next_question()
+
+    result = session.answer({"べんきょう": "benkyou", "いぬ": "inu"}[question.card_data.reading], now=1000.0)
+
+    assert result.correct
+    assert question.card_data.level == 1
+    assert question.card_data.last_reviewed_time == 1000.0
+    assert question.card_data.japanese in by_japanese(journal.load())
+
+
+def test_answer_wrong_keeps_level_at_zero():
+    session = StudySession("eng_to_jap")
+    session.add_cards(make_cards())
+    question = session.next_question()
+
+    result = session.answer("wrong", now=1000.0)
+
+    assert not result.correct
+    assert result.expected == f"{question.card_data.japanese} ({question.card_data.reading})"
+    assert question.card_data.level == 0
+    assert session.previous_question_correct == -1
+
+
+def test_grade_english_answer_is_a_substring_match():
+    card_data = CardData(card=Card(), japanese="犬", english="dog", reading="いぬ")
+    session = StudySession("jap_to_eng")
+    session.add_cards([card_data])
+    question = session.next_question()
+    assert StudySession.grade(question, " Dog ").correct
+    assert not StudySession.grade(question, "").correct
+
+
+def test_simulated_session_answers_thousands_of_questions():
+    rng = random.Random(0)
+    clock = VirtualClock(1_000_000.0)
+    cards = [CardData(card=Card(), japanese=f"語{i}", english=f"word {i}", reading="ご") for i in range(1000)]
+    session = StudySession("mixed", rng=rng, clock=clock)
+    session.add_cards(cards)
+
+    answered = 0
+    start = time.perf_counter()
+    while answered < 5000:
+        question = session.next_question()
+        if question is None:
+            clock.set(session.deck.next_due_time()) # Nothing is due yet; skip to the next due card
+            continue
+        card_data = question.card_data
+        expected = card_data.english if question.is_japanese else "go"
+        session.answer(expected if rng.random() < 0.8 else "x")
+        session.requeue()
+        answered += 1
+        clock.advance(10.0)
+    elapsed = time.perf_counter() - start
+
+    assert answered / elapsed > 2000 # Answers per second; well below what the engine manages
+    assert all(0 <= card_data.level <= 3 for card_data in cards)
+    assert any(card_data.level == 3 for card_data in cards)
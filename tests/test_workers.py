@@ -0,0 +1,67 @@
+import pytest
+
+from frontend.workers import DeckLoader
+from storage import deck_loader
+from storage.journal import ProgressJournal
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    deck_loader.clear_cache()
+    yield
+    deck_loader.clear_cache()
+
+
+def write_deck(tmp_path, name, size):
+    path = tmp_path / f"{name}.csv"
+    path.write_text("".join(f"{name}{i},よみ{i},meaning {i}\n" for i in range(size)), encoding='utf-8')
+    return str(path), ProgressJournal(str(tmp_path / f"{name}.json"))
+
+
+def test_load_returns_first_batch_and_streams_the_rest(qtbot, tmp_path):
+    deck_path, store = write_deck(tmp_path, "deck", 250)
+    loader = DeckLoader(batch_size=100)
+    batches = []
+    loader.batch_loaded.connect(batches.append)
+
+    with qtbot.waitSignal(loader.finished, timeout=5000):
+        first_batch = loader.load(deck_path, store)
+        assert len(first_batch) == 100
+        assert loader.is_loading()
+
+    assert [len(batch) for batch in batches] == [100, 50]
+    cards = first_batch + batches[0] + batches[1]
+    assert [card_data.japanese for card_data in cards] == [f"deck{i}" for i in range(250)]
+    assert not loader.is_loading()
+    # The streamed deck was cached like a synchronous load
+    assert deck_loader.load_deck_cards(deck_path, store) == cards
+
+
+def test_small_deck_loads_without_a_worker(qtbot, tmp_path):
+    deck_path, store = write_deck(tmp_path, "deck", 3)
+    loader = DeckLoader(batch_size=100)
+    assert len(loader.load(deck_path, store)) == 3
+    assert not loader.is_loading()
+
+
+def test_loading_another_deck_drops_batches_of_the_previous_one(qtbot, tmp_path):
+    first_path, first_store = write_deck(tmp_path, "first", 5000)
+    second_path, second_store = write_deck(tmp_path, "second", 150)
+    loader = DeckLoader(batch_size=100)
+    batches = []
+    loader.batch_loaded.connect(batches.append)
+
+    loader.load(first_path, first_store)
+    with qtbot.waitSignal(loader.finished, timeout=5000):
+        loader.load(second_path, second_store)
+
+    assert batches
+    assert all(card_data.japanese.startswith("second") for batch in batches for card_data in batch)
+
+
+def test_cancel_stops_the_worker(qtbot, tmp_path):
+    deck_path, store = write_deck(tmp_path, "deck", 5000)
+    loader = DeckLoader(batch_size=100)
+    loader.load(deck_path, store)
+    loader.cancel(wait=True)
+    assert not loader.is_loading()
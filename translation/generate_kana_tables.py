@@ -0,0 +1,46 @@
+"""Generate ``translation/kana_tables.py`` from the tables in ``translation/kana_source.py``.
+
+    python -m translation.generate_kana_tables          # rewrite kana_tables.py
+    python -m translation.generate_kana_tables --check  # fail if it is out of date
+"""
+import os
+import pprint
+import sys
+
+from translation.kana_source import build_tables, source_digest
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kana_tables.py")
+
+HEADER = '''"""Lookup tables of the Romaji <-> Kana conversion, derived from ``kana_source``.
+
+Generated by ``python -m translation.generate_kana_tables``; do not edit by hand.
+"""
+'''
+
+
+def render() -> str:
+    parts = [HEADER, f"SOURCE_DIGEST = {source_digest()!r}\n"]
+    for name, table in build_tables().items():
+        parts.append(f"\n{name} = {pprint.pformat(table, width=120, sort_dicts=False)}\n")
+    return "".join(parts)
+
+
+def main(argv: list[str]) -> int:
+    source = render()
+    if "--check" in argv:
+        try:
+            with open(OUTPUT_PATH, "r", encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{OUTPUT_PATH} is out of date; run python -m translation.generate_kana_tables", file=sys.stderr)
+            return 1
+        return 0
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
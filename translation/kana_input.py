@@ -0,0 +1,63 @@
+from itertools import groupby
+
+import translation.romaji_to_kana as romkan
+
+
+def to_kana_mixed_case(text: str) -> str:
+    """Convert typed romaji to kana: upper-case runs become katakana, everything else hiragana."""
+    return "".join(
+        romkan.to_katakana(segment) if is_upper else romkan.to_hiragana(segment)
+        for is_upper, segment in _case_segments(text)
+    )
+
+
+def _case_segments(text: str) -> list[tuple[bool, str]]:
+    return [(is_upper, "".join(chars)) for is_upper, chars in groupby(text, key=str.isupper)]
+
+
+class IncrementalKanaConverter:
+    """Mixed-case romaji to kana conversion for text that is typed one key at a time.
+
+    The kana for the part of the input that no further typing can change is kept, and
+    only the remaining romaji tail is converted again on each call, so the cost of a
+    keystroke does not grow with the length of the answer. Input that is not an
+    extension of the previous one (deletions, pasted text) starts over.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._text = ""
+        self._settled_text = ""
+        self._settled_kana = ""
+
+    def convert(self, text: str) -> str:
+        # Apostrophes (through the double-n clean-up) and some non-ASCII letters (through
+        # lower-casing) change the length of the text before it is scanned, which breaks
+        # the mapping back to typed positions; they are rare enough to convert in full.
+        if "'" in text or not text.isascii():
+            self.reset()
+            return to_kana_mixed_case(text)
+        # What settled a piece may be a character typed after it, so anything but a
+        # plain extension of the previous input is converted again from the start.
+        if not text.startswith(self._text):
+            self.reset()
+        self._text = text
+
+        tail = text[len(self._settled_text):]
+        segments = _case_segments(tail)
+        if not segments:
+            return self._settled_kana
+
+        # Every segment but the last is followed by a case change, so it is complete.
+        for is_upper, segment in segments[:-1]:
+            self._settled_text += segment
+            self._settled_kana += romkan.to_katakana(segment) if is_upper else romkan.to_hiragana(segment)
+
+        is_upper, segment = segments[-1]
+        trie = romkan.ROMTRIE if is_upper else romkan.ROMTRIE_H
+        parts, settled_parts, settled_length = trie.scan(segment.lower().replace("nn", "n'"))
+        self._settled_text += segment[:settled_length]
+        self._settled_kana += "".join(parts[:settled_parts])
+        return self._settled_kana + "".join(parts[settled_parts:])
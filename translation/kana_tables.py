@@ -0,0 +1,3183 @@
+"""Lookup tables of the Romaji <-> Kana conversion, derived from ``kana_source``.
+
+Generated by ``python -m translation.generate_kana_tables``; do not edit by hand.
+"""
+SOURCE_DIGEST = '877fc53a39845d3dfff05d1f4b0fd72e1deb0d7ffb78188e086474efd90a635e'
+
+KANROM = {'ァ': 'xa',
+ 'ア': 'a',
+ 'ィ': 'xi',
+ 'イ': 'i',
+ 'ゥ': 'xu',
+ 'ウ': 'u',
+ 'ヴ': 'vu',
+ 'ヴァ': 'va',
+ 'ヴィ': 'vi',
+ 'ヴェ': 've',
+ 'ヴォ': 'vo',
+ 'ェ': 'xe',
+ 'エ': 'e',
+ 'ォ': 'xo',
+ 'オ': 'o',
+ 'カ': 'ka',
+ 'ガ': 'ga',
+ 'キ': 'ki',
+ 'キャ': 'kya',
+ 'キュ': 'kyu',
+ 'キョ': 'kyo',
+ 'ギ': 'gi',
+ 'ギャ': 'gya',
+ 'ギュ': 'gyu',
+ 'ギョ': 'gyo',
+ 'ク': 'ku',
+ 'グ': 'gu',
+ 'ケ': 'ke',
+ 'ゲ': 'ge',
+ 'コ': 'ko',
+ 'ゴ': 'go',
+ 'サ': 'sa',
+ 'ザ': 'za',
+ 'シ': 'shi',
+ 'シャ': 'sha',
+ 'シュ': 'shu',
+ 'ショ': 'sho',
+ 'シェ': 'she',
+ 'ジ': 'ji',
+ 'ジャ': 'ja',
+ 'ジュ': 'ju',
+ 'ジョ': 'jo',
+ 'ス': 'su',
+ 'ズ': 'zu',
+ 'セ': 'se',
+ 'ゼ': 'ze',
+ 'ソ': 'so',
+ 'ゾ': 'zo',
+ 'タ': 'ta',
+ 'ダ': 'da',
+ 'チャ': 'cha',
+ 'チュ': 'chu',
+ 'チョ': 'cho',
+ 'ヂ': 'di',
+ 'ヂャ': 'dya',
+ 'ヂュ': 'dyu',
+ 'ヂョ': 'dyo',
+ 'ティ': 'ti',
+ 'ッ': 'xtsu',
+ 'ッヴ': 'vvu',
+ 'ッヴァ': 'vva',
+ 'ッヴィ': 'vvi',
+ 'ッヴェ': 'vve',
+ 'ッヴォ': 'vvo',
+ 'ッカ': 'kka',
+ 'ッガ': 'gga',
+ 'ッキ': 'kki',
+ 'ッキャ': 'kkya',
+ 'ッキュ': 'kkyu',
+ 'ッキョ': 'kkyo',
+ 'ッギ': 'ggi',
+ 'ッギャ': 'ggya',
+ 'ッギュ': 'ggyu',
+ 'ッギョ': 'ggyo',
+ 'ック': 'kku',
+ 'ッグ': 'ggu',
+ 'ッケ': 'kke',
+ 'ッゲ': 'gge',
+ 'ッコ': 'kko',
+ 'ッゴ': 'ggo',
+ 'ッサ': 'ssa',
+ 'ッザ': 'zza',
+ 'ッシ': 'sshi',
+ 'ッシャ': 'ssha',
+ 'ッシュ': 'sshu',
+ 'ッショ': 'ssho',
+ 'ッシェ': 'sshe',
+ 'ッジ': 'jji',
+ 'ッジャ': 'jja',
+ 'ッジュ': 'jju',
+ 'ッジョ': 'jjo',
+ 'ッス': 'ssu',
+ 'ッズ': 'zzu',
+ 'ッセ': 'sse',
+ 'ッゼ': 'zze',
+ 'ッソ': 'sso',
+ 'ッゾ': 'zzo',
+ 'ッタ': 'tta',
+ 'ッダ': 'dda',
+ 'ッチ': 'cchi',
+ 'ッティ': 'tti',
+ 'ッチャ': 'ccha',
+ 'ッチュ': 'cchu',
+ 'ッチョ': 'ccho',
+ 'ッヂ': 'ddi',
+ 'ッヂャ': 'ddya',
+ 'ッヂュ': 'ddyu',
+ 'ッヂョ': 'ddyo',
+ 'ッツ': 'ttsu',
+ 'ッヅ': 'ddu',
+ 'ッテ': 'tte',
+ 'ッデ': 'dde',
+ 'ット': 'tto',
+ 'ッド': 'ddo',
+ 'ッドゥ': 'ddu',
+ 'ッハ': 'hha',
+ 'ッバ': 'bba',
+ 'ッパ': 'ppa',
+ 'ッヒ': 'hhi',
+ 'ッヒャ': 'hhya',
+ 'ッヒュ': 'hhyu',
+ 'ッヒョ': 'hhyo',
+ 'ッビ': 'bbi',
+ 'ッビャ': 'bbya',
+ 'ッビュ': 'bbyu',
+ 'ッビョ': 'bbyo',
+ 'ッピ': 'ppi',
+ 'ッピャ': 'ppya',
+ 'ッピュ': 'ppyu',
+ 'ッピョ': 'ppyo',
+ 'ッフ': 'ffu',
+ 'ッフュ': 'ffu',
+ 'ッファ': 'ffa',
+ 'ッフィ': 'ffi',
+ 'ッフェ': 'ffe',
+ 'ッフォ': 'ffo',
+ 'ッブ': 'bbu',
+ 'ップ': 'ppu',
+ 'ッヘ': 'hhe',
+ 'ッベ': 'bbe',
+ 'ッペ': 'ppe',
+ 'ッホ': 'hho',
+ 'ッボ': 'bbo',
+ 'ッポ': 'ppo',
+ 'ッヤ': 'yya',
+ 'ッユ': 'yyu',
+ 'ッヨ': 'yyo',
+ 'ッラ': 'rra',
+ 'ッリ': 'rri',
+ 'ッリャ': 'rrya',
+ 'ッリュ': 'rryu',
+ 'ッリョ': 'rryo',
+ 'ッル': 'rru',
+ 'ッレ': 'rre',
+ 'ッロ': 'rro',
+ 'ツ': 'tsu',
+ 'ヅ': 'du',
+ 'テ': 'te',
+ 'デ': 'de',
+ 'ト': 'to',
+ 'ド': 'do',
+ 'ドゥ': 'du',
+ 'ナ': 'na',
+ 'ニ': 'ni',
+ 'ニャ': 'nya',
+ 'ニュ': 'nyu',
+ 'ニョ': 'nyo',
+ 'ヌ': 'nu',
+ 'ネ': 'ne',
+ 'ノ': 'no',
+ 'ハ': 'ha',
+ 'バ': 'ba',
+ 'パ': 'pa',
+ 'ヒ': 'hi',
+ 'ヒャ': 'hya',
+ 'ヒュ': 'hyu',
+ 'ヒョ': 'hyo',
+ 'ビ': 'bi',
+ 'ビャ': 'bya',
+ 'ビュ': 'byu',
+ 'ビョ': 'byo',
+ 'ピ': 'pi',
+ 'ピャ': 'pya',
+ 'ピュ': 'pyu',
+ 'ピョ': 'pyo',
+ 'フ': 'fu',
+ 'ファ': 'fa',
+ 'フィ': 'fi',
+ 'フェ': 'fe',
+ 'フォ': 'fo',
+ 'フュ': 'fu',
+ 'ブ': 'bu',
+ 'プ': 'pu',
+ 'ヘ': 'he',
+ 'ベ': 'be',
+ 'ペ': 'pe',
+ 'ホ': 'ho',
+ 'ボ': 'bo',
+ 'ポ': 'po',
+ 'マ': 'ma',
+ 'ミ': 'mi',
+ 'ミャ': 'mya',
+ 'ミュ': 'myu',
+ 'ミョ': 'myo',
+ 'ム': 'mu',
+ 'メ': 'me',
+ 'モ': 'mo',
+ 'ャ': 'xya',
+ 'ヤ': 'ya',
+ 'ュ': 'xyu',
+ 'ユ': 'yu',
+ 'ョ': 'xyo',
+ 'ヨ': 'yo',
+ 'ラ': 'ra',
+ 'リ': 'ri',
+ 'リャ': 'rya',
+ 'リュ': 'ryu',
+ 'リョ': 'ryo',
+ 'ル': 'ru',
+ 'レ': 're',
+ 'ロ': 'ro',
+ 'ヮ': 'xwa',
+ 'ワ': 'wa',
+ 'ウィ': 'wi',
+ 'ヰ': 'wi',
+ 'ヱ': 'we',
+ 'ウェ': 'we',
+ 'ヲ': 'wo',
+ 'ウォ': 'wo',
+ 'ン': "n'",
+ 'ディ': 'di',
+ 'ー': '-',
+ 'チェ': 'che',
+ 'ッチェ': 'cche',
+ 'ジェ': 'je',
+ 'チ': 'chi'}
+
+ROMKAN = {'xa': 'ァ',
+ 'a': 'ア',
+ 'xi': 'ィ',
+ 'i': 'イ',
+ 'xu': 'ゥ',
+ 'u': 'ウ',
+ 'vu': 'ヴ',
+ 'va': 'ヴァ',
+ 'vi': 'ヴィ',
+ 've': 'ヴェ',
+ 'vo': 'ヴォ',
+ 'xe': 'ェ',
+ 'e': 'エ',
+ 'xo': 'ォ',
+ 'o': 'オ',
+ 'ka': 'カ',
+ 'ga': 'ガ',
+ 'ki': 'キ',
+ 'kya': 'キャ',
+ 'kyu': 'キュ',
+ 'kyo': 'キョ',
+ 'gi': 'ギ',
+ 'gya': 'ギャ',
+ 'gyu': 'ギュ',
+ 'gyo': 'ギョ',
+ 'ku': 'ク',
+ 'gu': 'グ',
+ 'ke': 'ケ',
+ 'ge': 'ゲ',
+ 'ko': 'コ',
+ 'go': 'ゴ',
+ 'sa': 'サ',
+ 'za': 'ザ',
+ 'si': 'シ',
+ 'sya': 'シャ',
+ 'syu': 'シュ',
+ 'syo': 'ショ',
+ 'sye': 'シェ',
+ 'zi': 'ジ',
+ 'zya': 'ジャ',
+ 'zyu': 'ジュ',
+ 'zyo': 'ジョ',
+ 'su': 'ス',
+ 'zu': 'ズ',
+ 'se': 'セ',
+ 'ze': 'ゼ',
+ 'so': 'ソ',
+ 'zo': 'ゾ',
+ 'ta': 'タ',
+ 'da': 'ダ',
+ 'tya': 'チャ',
+ 'tyu': 'チュ',
+ 'tyo': 'チョ',
+ 'di': 'ヂ',
+ 'dya': 'ヂャ',
+ 'dyu': 'ヂュ',
+ 'dyo': 'ヂョ',
+ 'ti': 'ティ',
+ 'xtu': 'ッ',
+ 'vvu': 'ッヴ',
+ 'vva': 'ッヴァ',
+ 'vvi': 'ッヴィ',
+ 'vve': 'ッヴェ',
+ 'vvo': 'ッヴォ',
+ 'kka': 'ッカ',
+ 'gga': 'ッガ',
+ 'kki': 'ッキ',
+ 'kkya': 'ッキャ',
+ 'kkyu': 'ッキュ',
+ 'kkyo': 'ッキョ',
+ 'ggi': 'ッギ',
+ 'ggya': 'ッギャ',
+ 'ggyu': 'ッギュ',
+ 'ggyo': 'ッギョ',
+ 'kku': 'ック',
+ 'ggu': 'ッグ',
+ 'kke': 'ッケ',
+ 'gge': 'ッゲ',
+ 'kko': 'ッコ',
+ 'ggo': 'ッゴ',
+ 'ssa': 'ッサ',
+ 'zza': 'ッザ',
+ 'ssi': 'ッシ',
+ 'ssya': 'ッシャ',
+ 'ssyu': 'ッシュ',
+ 'ssyo': 'ッショ',
+ 'ssye': 'ッシェ',
+ 'zzi': 'ッジ',
+ 'zzya': 'ッジャ',
+ 'zzyu': 'ッジュ',
+ 'zzyo': 'ッジョ',
+ 'ssu': 'ッス',
+ 'zzu': 'ッズ',
+ 'sse': 'ッセ',
+ 'zze': 'ッゼ',
+ 'sso': 'ッソ',
+ 'zzo': 'ッゾ',
+ 'tta': 'ッタ',
+ 'dda': 'ッダ',
+ 'tti': 'ッティ',
+ 'ttya': 'ッチャ',
+ 'ttyu': 'ッチュ',
+ 'ttyo': 'ッチョ',
+ 'ddi': 'ッヂ',
+ 'ddya': 'ッヂャ',
+ 'ddyu': 'ッヂュ',
+ 'ddyo': 'ッヂョ',
+ 'ttu': 'ッツ',
+ 'ddu': 'ッドゥ',
+ 'tte': 'ッテ',
+ 'dde': 'ッデ',
+ 'tto': 'ット',
+ 'ddo': 'ッド',
+ 'hha': 'ッハ',
+ 'bba': 'ッバ',
+ 'ppa': 'ッパ',
+ 'hhi': 'ッヒ',
+ 'hhya': 'ッヒャ',
+ 'hhyu': 'ッヒュ',
+ 'hhyo': 'ッヒョ',
+ 'bbi': 'ッビ',
+ 'bbya': 'ッビャ',
+ 'bbyu': 'ッビュ',
+ 'bbyo': 'ッビョ',
+ 'ppi': 'ッピ',
+ 'ppya': 'ッピャ',
+ 'ppyu': 'ッピュ',
+ 'ppyo': 'ッピョ',
+ 'hhu': 'ッフ',
+ 'ffu': 'ッフュ',
+ 'ffa': 'ッファ',
+ 'ffi': 'ッフィ',
+ 'ffe': 'ッフェ',
+ 'ffo': 'ッフォ',
+ 'bbu': 'ッブ',
+ 'ppu': 'ップ',
+ 'hhe': 'ッヘ',
+ 'bbe': 'ッベ',
+ 'ppe': 'ッペ',
+ 'hho': 'ッホ',
+ 'bbo': 'ッボ',
+ 'ppo': 'ッポ',
+ 'yya': 'ッヤ',
+ 'yyu': 'ッユ',
+ 'yyo': 'ッヨ',
+ 'rra': 'ッラ',
+ 'rri': 'ッリ',
+ 'rrya': 'ッリャ',
+ 'rryu': 'ッリュ',
+ 'rryo': 'ッリョ',
+ 'rru': 'ッル',
+ 'rre': 'ッレ',
+ 'rro': 'ッロ',
+ 'tu': 'ツ',
+ 'du': 'ヅ',
+ 'te': 'テ',
+ 'de': 'デ',
+ 'to': 'ト',
+ 'do': 'ド',
+ 'na': 'ナ',
+ 'ni': 'ニ',
+ 'nya': 'ニャ',
+ 'nyu': 'ニュ',
+ 'nyo': 'ニョ',
+ 'nu': 'ヌ',
+ 'ne': 'ネ',
+ 'no': 'ノ',
+ 'ha': 'ハ',
+ 'ba': 'バ',
+ 'pa': 'パ',
+ 'hi': 'ヒ',
+ 'hya': 'ヒャ',
+ 'hyu': 'ヒュ',
+ 'hyo': 'ヒョ',
+ 'bi': 'ビ',
+ 'bya': 'ビャ',
+ 'byu': 'ビュ',
+ 'byo': 'ビョ',
+ 'pi': 'ピ',
+ 'pya': 'ピャ',
+ 'pyu': 'ピュ',
+ 'pyo': 'ピョ',
+ 'hu': 'フ',
+ 'fa': 'ファ',
+ 'fi': 'フィ',
+ 'fe': 'フェ',
+ 'fo': 'フォ',
+ 'fu': 'フ',
+ 'bu': 'ブ',
+ 'pu': 'プ',
+ 'he': 'ヘ',
+ 'be': 'ベ',
+ 'pe': 'ペ',
+ 'ho': 'ホ',
+ 'bo': 'ボ',
+ 'po': 'ポ',
+ 'ma': 'マ',
+ 'mi': 'ミ',
+ 'mya': 'ミャ',
+ 'myu': 'ミュ',
+ 'myo': 'ミョ',
+ 'mu': 'ム',
+ 'me': 'メ',
+ 'mo': 'モ',
+ 'xya': 'ャ',
+ 'ya': 'ヤ',
+ 'xyu': 'ュ',
+ 'yu': 'ユ',
+ 'xyo': 'ョ',
+ 'yo': 'ヨ',
+ 'ra': 'ラ',
+ 'ri': 'リ',
+ 'rya': 'リャ',
+ 'ryu': 'リュ',
+ 'ryo': 'リョ',
+ 'ru': 'ル',
+ 're': 'レ',
+ 'ro': 'ロ',
+ 'xwa': 'ヮ',
+ 'wa': 'ワ',
+ 'wi': 'ウィ',
+ 'we': 'ウェ',
+ 'wo': 'ヲ',
+ 'n': 'ン',
+ "n'": 'ン',
+ 'dyi': 'ディ',
+ '-': 'ー',
+ 'tye': 'チェ',
+ 'ttye': 'ッチェ',
+ 'zye': 'ジェ',
+ 'shi': 'シ',
+ 'sha': 'シャ',
+ 'shu': 'シュ',
+ 'sho': 'ショ',
+ 'she': 'シェ',
+ 'ji': 'ジ',
+ 'ja': 'ジャ',
+ 'ju': 'ジュ',
+ 'jo': 'ジョ',
+ 'chi': 'チ',
+ 'cha': 'チャ',
+ 'chu': 'チュ',
+ 'cho': 'チョ',
+ 'xtsu': 'ッ',
+ 'sshi': 'ッシ',
+ 'ssha': 'ッシャ',
+ 'sshu': 'ッシュ',
+ 'ssho': 'ッショ',
+ 'sshe': 'ッシェ',
+ 'jji': 'ッジ',
+ 'jja': 'ッジャ',
+ 'jju': 'ッジュ',
+ 'jjo': 'ッジョ',
+ 'cchi': 'ッチ',
+ 'ccha': 'ッチャ',
+ 'cchu': 'ッチュ',
+ 'ccho': 'ッチョ',
+ 'ttsu': 'ッツ',
+ 'tsu': 'ツ',
+ 'che': 'チェ',
+ 'cche': 'ッチェ',
+ 'je': 'ジェ'}
+
+KUNREI = ['xa',
+ 'a',
+ 'xi',
+ 'i',
+ 'xu',
+ 'u',
+ 'vu',
+ 'va',
+ 'vi',
+ 've',
+ 'vo',
+ 'xe',
+ 'e',
+ 'xo',
+ 'o',
+ 'ka',
+ 'ga',
+ 'ki',
+ 'kya',
+ 'kyu',
+ 'kyo',
+ 'gi',
+ 'gya',
+ 'gyu',
+ 'gyo',
+ 'ku',
+ 'gu',
+ 'ke',
+ 'ge',
+ 'ko',
+ 'go',
+ 'sa',
+ 'za',
+ 'si',
+ 'sya',
+ 'syu',
+ 'syo',
+ 'sye',
+ 'zi',
+ 'zya',
+ 'zyu',
+ 'zyo',
+ 'su',
+ 'zu',
+ 'se',
+ 'ze',
+ 'so',
+ 'zo',
+ 'ta',
+ 'da',
+ 'tya',
+ 'tyu',
+ 'tyo',
+ 'di',
+ 'dya',
+ 'dyu',
+ 'dyo',
+ 'ti',
+ 'xtu',
+ 'vvu',
+ 'vva',
+ 'vvi',
+ 'vve',
+ 'vvo',
+ 'kka',
+ 'gga',
+ 'kki',
+ 'kkya',
+ 'kkyu',
+ 'kkyo',
+ 'ggi',
+ 'ggya',
+ 'ggyu',
+ 'ggyo',
+ 'kku',
+ 'ggu',
+ 'kke',
+ 'gge',
+ 'kko',
+ 'ggo',
+ 'ssa',
+ 'zza',
+ 'ssi',
+ 'ssya',
+ 'ssyu',
+ 'ssyo',
+ 'ssye',
+ 'zzi',
+ 'zzya',
+ 'zzyu',
+ 'zzyo',
+ 'ssu',
+ 'zzu',
+ 'sse',
+ 'zze',
+ 'sso',
+ 'zzo',
+ 'tta',
+ 'dda',
+ 'tti',
+ 'tti',
+ 'ttya',
+ 'ttyu',
+ 'ttyo',
+ 'ddi',
+ 'ddya',
+ 'ddyu',
+ 'ddyo',
+ 'ttu',
+ 'ddu',
+ 'tte',
+ 'dde',
+ 'tto',
+ 'ddo',
+ 'ddu',
+ 'hha',
+ 'bba',
+ 'ppa',
+ 'hhi',
+ 'hhya',
+ 'hhyu',
+ 'hhyo',
+ 'bbi',
+ 'bbya',
+ 'bbyu',
+ 'bbyo',
+ 'ppi',
+ 'ppya',
+ 'ppyu',
+ 'ppyo',
+ 'hhu',
+ 'ffu',
+ 'ffa',
+ 'ffi',
+ 'ffe',
+ 'ffo',
+ 'bbu',
+ 'ppu',
+ 'hhe',
+ 'bbe',
+ 'ppe',
+ 'hho',
+ 'bbo',
+ 'ppo',
+ 'yya',
+ 'yyu',
+ 'yyo',
+ 'rra',
+ 'rri',
+ 'rrya',
+ 'rryu',
+ 'rryo',
+ 'rru',
+ 'rre',
+ 'rro',
+ 'tu',
+ 'du',
+ 'te',
+ 'de',
+ 'to',
+ 'do',
+ 'du',
+ 'na',
+ 'ni',
+ 'nya',
+ 'nyu',
+ 'nyo',
+ 'nu',
+ 'ne',
+ 'no',
+ 'ha',
+ 'ba',
+ 'pa',
+ 'hi',
+ 'hya',
+ 'hyu',
+ 'hyo',
+ 'bi',
+ 'bya',
+ 'byu',
+ 'byo',
+ 'pi',
+ 'pya',
+ 'pyu',
+ 'pyo',
+ 'hu',
+ 'fa',
+ 'fi',
+ 'fe',
+ 'fo',
+ 'fu',
+ 'bu',
+ 'pu',
+ 'he',
+ 'be',
+ 'pe',
+ 'ho',
+ 'bo',
+ 'po',
+ 'ma',
+ 'mi',
+ 'mya',
+ 'myu',
+ 'myo',
+ 'mu',
+ 'me',
+ 'mo',
+ 'xya',
+ 'ya',
+ 'xyu',
+ 'yu',
+ 'xyo',
+ 'yo',
+ 'ra',
+ 'ri',
+ 'rya',
+ 'ryu',
+ 'ryo',
+ 'ru',
+ 're',
+ 'ro',
+ 'xwa',
+ 'wa',
+ 'wi',
+ 'wi',
+ 'we',
+ 'we',
+ 'wo',
+ 'wo',
+ 'n',
+ "n'",
+ 'dyi',
+ '-',
+ 'tye',
+ 'ttye',
+ 'zye']
+
+HEPBURN = ['xa',
+ 'a',
+ 'xi',
+ 'i',
+ 'xu',
+ 'u',
+ 'vu',
+ 'va',
+ 'vi',
+ 've',
+ 'vo',
+ 'xe',
+ 'e',
+ 'xo',
+ 'o',
+ 'ka',
+ 'ga',
+ 'ki',
+ 'kya',
+ 'kyu',
+ 'kyo',
+ 'gi',
+ 'gya',
+ 'gyu',
+ 'gyo',
+ 'ku',
+ 'gu',
+ 'ke',
+ 'ge',
+ 'ko',
+ 'go',
+ 'sa',
+ 'za',
+ 'shi',
+ 'sha',
+ 'shu',
+ 'sho',
+ 'she',
+ 'ji',
+ 'ja',
+ 'ju',
+ 'jo',
+ 'su',
+ 'zu',
+ 'se',
+ 'ze',
+ 'so',
+ 'zo',
+ 'ta',
+ 'da',
+ 'chi',
+ 'cha',
+ 'chu',
+ 'cho',
+ 'di',
+ 'dya',
+ 'dyu',
+ 'dyo',
+ 'ti',
+ 'xtsu',
+ 'vvu',
+ 'vva',
+ 'vvi',
+ 'vve',
+ 'vvo',
+ 'kka',
+ 'gga',
+ 'kki',
+ 'kkya',
+ 'kkyu',
+ 'kkyo',
+ 'ggi',
+ 'ggya',
+ 'ggyu',
+ 'ggyo',
+ 'kku',
+ 'ggu',
+ 'kke',
+ 'gge',
+ 'kko',
+ 'ggo',
+ 'ssa',
+ 'zza',
+ 'sshi',
+ 'ssha',
+ 'sshu',
+ 'ssho',
+ 'sshe',
+ 'jji',
+ 'jja',
+ 'jju',
+ 'jjo',
+ 'ssu',
+ 'zzu',
+ 'sse',
+ 'zze',
+ 'sso',
+ 'zzo',
+ 'tta',
+ 'dda',
+ 'cchi',
+ 'tti',
+ 'ccha',
+ 'cchu',
+ 'ccho',
+ 'ddi',
+ 'ddya',
+ 'ddyu',
+ 'ddyo',
+ 'ttsu',
+ 'ddu',
+ 'tte',
+ 'dde',
+ 'tto',
+ 'ddo',
+ 'ddu',
+ 'hha',
+ 'bba',
+ 'ppa',
+ 'hhi',
+ 'hhya',
+ 'hhyu',
+ 'hhyo',
+ 'bbi',
+ 'bbya',
+ 'bbyu',
+ 'bbyo',
+ 'ppi',
+ 'ppya',
+ 'ppyu',
+ 'ppyo',
+ 'ffu',
+ 'ffu',
+ 'ffa',
+ 'ffi',
+ 'ffe',
+ 'ffo',
+ 'bbu',
+ 'ppu',
+ 'hhe',
+ 'bbe',
+ 'ppe',
+ 'hho',
+ 'bbo',
+ 'ppo',
+ 'yya',
+ 'yyu',
+ 'yyo',
+ 'rra',
+ 'rri',
+ 'rrya',
+ 'rryu',
+ 'rryo',
+ 'rru',
+ 'rre',
+ 'rro',
+ 'tsu',
+ 'du',
+ 'te',
+ 'de',
+ 'to',
+ 'do',
+ 'du',
+ 'na',
+ 'ni',
+ 'nya',
+ 'nyu',
+ 'nyo',
+ 'nu',
+ 'ne',
+ 'no',
+ 'ha',
+ 'ba',
+ 'pa',
+ 'hi',
+ 'hya',
+ 'hyu',
+ 'hyo',
+ 'bi',
+ 'bya',
+ 'byu',
+ 'byo',
+ 'pi',
+ 'pya',
+ 'pyu',
+ 'pyo',
+ 'fu',
+ 'fa',
+ 'fi',
+ 'fe',
+ 'fo',
+ 'fu',
+ 'bu',
+ 'pu',
+ 'he',
+ 'be',
+ 'pe',
+ 'ho',
+ 'bo',
+ 'po',
+ 'ma',
+ 'mi',
+ 'mya',
+ 'myu',
+ 'myo',
+ 'mu',
+ 'me',
+ 'mo',
+ 'xya',
+ 'ya',
+ 'xyu',
+ 'yu',
+ 'xyo',
+ 'yo',
+ 'ra',
+ 'ri',
+ 'rya',
+ 'ryu',
+ 'ryo',
+ 'ru',
+ 're',
+ 'ro',
+ 'xwa',
+ 'wa',
+ 'wi',
+ 'wi',
+ 'we',
+ 'we',
+ 'wo',
+ 'wo',
+ 'n',
+ "n'",
+ 'di',
+ '-',
+ 'che',
+ 'cche',
+ 'je']
+
+TO_HEPBURN = {'xa': 'xa',
+ 'a': 'a',
+ 'xi': 'xi',
+ 'i': 'i',
+ 'xu': 'xu',
+ 'u': 'u',
+ 'vu': 'vu',
+ 'va': 'va',
+ 'vi': 'vi',
+ 've': 've',
+ 'vo': 'vo',
+ 'xe': 'xe',
+ 'e': 'e',
+ 'xo': 'xo',
+ 'o': 'o',
+ 'ka': 'ka',
+ 'ga': 'ga',
+ 'ki': 'ki',
+ 'kya': 'kya',
+ 'kyu': 'kyu',
+ 'kyo': 'kyo',
+ 'gi': 'gi',
+ 'gya': 'gya',
+ 'gyu': 'gyu',
+ 'gyo': 'gyo',
+ 'ku': 'ku',
+ 'gu': 'gu',
+ 'ke': 'ke',
+ 'ge': 'ge',
+ 'ko': 'ko',
+ 'go': 'go',
+ 'sa': 'sa',
+ 'za': 'za',
+ 'si': 'shi',
+ 'sya': 'sha',
+ 'syu': 'shu',
+ 'syo': 'sho',
+ 'sye': 'she',
+ 'zi': 'ji',
+ 'zya': 'ja',
+ 'zyu': 'ju',
+ 'zyo': 'jo',
+ 'su': 'su',
+ 'zu': 'zu',
+ 'se': 'se',
+ 'ze': 'ze',
+ 'so': 'so',
+ 'zo': 'zo',
+ 'ta': 'ta',
+ 'da': 'da',
+ 'tya': 'chi',
+ 'tyu': 'cha',
+ 'tyo': 'chu',
+ 'di': 'cho',
+ 'dya': 'di',
+ 'dyu': 'dya',
+ 'dyo': 'dyu',
+ 'ti': 'chi',
+ 'xtu': 'ti',
+ 'vvu': 'xtsu',
+ 'vva': 'vvu',
+ 'vvi': 'vva',
+ 'vve': 'vvi',
+ 'vvo': 'vve',
+ 'kka': 'vvo',
+ 'gga': 'kka',
+ 'kki': 'gga',
+ 'kkya': 'kki',
+ 'kkyu': 'kkya',
+ 'kkyo': 'kkyu',
+ 'ggi': 'kkyo',
+ 'ggya': 'ggi',
+ 'ggyu': 'ggya',
+ 'ggyo': 'ggyu',
+ 'kku': 'ggyo',
+ 'ggu': 'kku',
+ 'kke': 'ggu',
+ 'gge': 'kke',
+ 'kko': 'gge',
+ 'ggo': 'kko',
+ 'ssa': 'ggo',
+ 'zza': 'ssa',
+ 'ssi': 'zza',
+ 'ssya': 'sshi',
+ 'ssyu': 'ssha',
+ 'ssyo': 'sshu',
+ 'ssye': 'ssho',
+ 'zzi': 'sshe',
+ 'zzya': 'jji',
+ 'zzyu': 'jja',
+ 'zzyo': 'jju',
+ 'ssu': 'jjo',
+ 'zzu': 'ssu',
+ 'sse': 'zzu',
+ 'zze': 'sse',
+ 'sso': 'zze',
+ 'zzo': 'sso',
+ 'tta': 'zzo',
+ 'dda': 'tta',
+ 'tti': 'cchi',
+ 'ttya': 'tti',
+ 'ttyu': 'ccha',
+ 'ttyo': 'cchu',
+ 'ddi': 'ccho',
+ 'ddya': 'ddi',
+ 'ddyu': 'ddya',
+ 'ddyo': 'ddyu',
+ 'ttu': 'ddyo',
+ 'ddu': 'ddo',
+ 'tte': 'ddu',
+ 'dde': 'tte',
+ 'tto': 'dde',
+ 'ddo': 'tto',
+ 'hha': 'ddu',
+ 'bba': 'hha',
+ 'ppa': 'bba',
+ 'hhi': 'ppa',
+ 'hhya': 'hhi',
+ 'hhyu': 'hhya',
+ 'hhyo': 'hhyu',
+ 'bbi': 'hhyo',
+ 'bbya': 'bbi',
+ 'bbyu': 'bbya',
+ 'bbyo': 'bbyu',
+ 'ppi': 'bbyo',
+ 'ppya': 'ppi',
+ 'ppyu': 'ppya',
+ 'ppyo': 'ppyu',
+ 'hhu': 'ppyo',
+ 'ffu': 'ffu',
+ 'ffa': 'ffu',
+ 'ffi': 'ffa',
+ 'ffe': 'ffi',
+ 'ffo': 'ffe',
+ 'bbu': 'ffo',
+ 'ppu': 'bbu',
+ 'hhe': 'ppu',
+ 'bbe': 'hhe',
+ 'ppe': 'bbe',
+ 'hho': 'ppe',
+ 'bbo': 'hho',
+ 'ppo': 'bbo',
+ 'yya': 'ppo',
+ 'yyu': 'yya',
+ 'yyo': 'yyu',
+ 'rra': 'yyo',
+ 'rri': 'rra',
+ 'rrya': 'rri',
+ 'rryu': 'rrya',
+ 'rryo': 'rryu',
+ 'rru': 'rryo',
+ 'rre': 'rru',
+ 'rro': 'rre',
+ 'tu': 'rro',
+ 'du': 'do',
+ 'te': 'du',
+ 'de': 'te',
+ 'to': 'de',
+ 'do': 'to',
+ 'na': 'du',
+ 'ni': 'na',
+ 'nya': 'ni',
+ 'nyu': 'nya',
+ 'nyo': 'nyu',
+ 'nu': 'nyo',
+ 'ne': 'nu',
+ 'no': 'ne',
+ 'ha': 'no',
+ 'ba': 'ha',
+ 'pa': 'ba',
+ 'hi': 'pa',
+ 'hya': 'hi',
+ 'hyu': 'hya',
+ 'hyo': 'hyu',
+ 'bi': 'hyo',
+ 'bya': 'bi',
+ 'byu': 'bya',
+ 'byo': 'byu',
+ 'pi': 'byo',
+ 'pya': 'pi',
+ 'pyu': 'pya',
+ 'pyo': 'pyu',
+ 'hu': 'pyo',
+ 'fa': 'fu',
+ 'fi': 'fa',
+ 'fe': 'fi',
+ 'fo': 'fe',
+ 'fu': 'fo',
+ 'bu': 'fu',
+ 'pu': 'bu',
+ 'he': 'pu',
+ 'be': 'he',
+ 'pe': 'be',
+ 'ho': 'pe',
+ 'bo': 'ho',
+ 'po': 'bo',
+ 'ma': 'po',
+ 'mi': 'ma',
+ 'mya': 'mi',
+ 'myu': 'mya',
+ 'myo': 'myu',
+ 'mu': 'myo',
+ 'me': 'mu',
+ 'mo': 'me',
+ 'xya': 'mo',
+ 'ya': 'xya',
+ 'xyu': 'ya',
+ 'yu': 'xyu',
+ 'xyo': 'yu',
+ 'yo': 'xyo',
+ 'ra': 'yo',
+ 'ri': 'ra',
+ 'rya': 'ri',
+ 'ryu': 'rya',
+ 'ryo': 'ryu',
+ 'ru': 'ryo',
+ 're': 'ru',
+ 'ro': 're',
+ 'xwa': 'ro',
+ 'wa': 'xwa',
+ 'wi': 'wi',
+ 'we': 'we',
+ 'wo': 'wo',
+ 'n': 'wo',
+ "n'": 'n',
+ 'dyi': "n'",
+ '-': 'di',
+ 'tye': '-',
+ 'ttye': 'che',
+ 'zye': 'cche'}
+
+TO_KUNREI = {'xa': 'xa',
+ 'a': 'a',
+ 'xi': 'xi',
+ 'i': 'i',
+ 'xu': 'xu',
+ 'u': 'u',
+ 'vu': 'vu',
+ 'va': 'va',
+ 'vi': 'vi',
+ 've': 've',
+ 'vo': 'vo',
+ 'xe': 'xe',
+ 'e': 'e',
+ 'xo': 'xo',
+ 'o': 'o',
+ 'ka': 'ka',
+ 'ga': 'ga',
+ 'ki': 'ki',
+ 'kya': 'kya',
+ 'kyu': 'kyu',
+ 'kyo': 'kyo',
+ 'gi': 'gi',
+ 'gya': 'gya',
+ 'gyu': 'gyu',
+ 'gyo': 'gyo',
+ 'ku': 'ku',
+ 'gu': 'gu',
+ 'ke': 'ke',
+ 'ge': 'ge',
+ 'ko': 'ko',
+ 'go': 'go',
+ 'sa': 'sa',
+ 'za': 'za',
+ 'shi': 'si',
+ 'sha': 'sya',
+ 'shu': 'syu',
+ 'sho': 'syo',
+ 'she': 'sye',
+ 'ji': 'zi',
+ 'ja': 'zya',
+ 'ju': 'zyu',
+ 'jo': 'zyo',
+ 'su': 'su',
+ 'zu': 'zu',
+ 'se': 'se',
+ 'ze': 'ze',
+ 'so': 'so',
+ 'zo': 'zo',
+ 'ta': 'ta',
+ 'da': 'da',
+ 'chi': 'tya',
+ 'cha': 'tyu',
+ 'chu': 'tyo',
+ 'cho': 'di',
+ 'di': '-',
+ 'dya': 'dyu',
+ 'dyu': 'dyo',
+ 'dyo': 'ti',
+ 'ti': 'xtu',
+ 'xtsu': 'vvu',
+ 'vvu': 'vva',
+ 'vva': 'vvi',
+ 'vvi': 'vve',
+ 'vve': 'vvo',
+ 'vvo': 'kka',
+ 'kka': 'gga',
+ 'gga': 'kki',
+ 'kki': 'kkya',
+ 'kkya': 'kkyu',
+ 'kkyu': 'kkyo',
+ 'kkyo': 'ggi',
+ 'ggi': 'ggya',
+ 'ggya': 'ggyu',
+ 'ggyu': 'ggyo',
+ 'ggyo': 'kku',
+ 'kku': 'ggu',
+ 'ggu': 'kke',
+ 'kke': 'gge',
+ 'gge': 'kko',
+ 'kko': 'ggo',
+ 'ggo': 'ssa',
+ 'ssa': 'zza',
+ 'zza': 'ssi',
+ 'sshi': 'ssya',
+ 'ssha': 'ssyu',
+ 'sshu': 'ssyo',
+ 'ssho': 'ssye',
+ 'sshe': 'zzi',
+ 'jji': 'zzya',
+ 'jja': 'zzyu',
+ 'jju': 'zzyo',
+ 'jjo': 'ssu',
+ 'ssu': 'zzu',
+ 'zzu': 'sse',
+ 'sse': 'zze',
+ 'zze': 'sso',
+ 'sso': 'zzo',
+ 'zzo': 'tta',
+ 'tta': 'dda',
+ 'dda': 'tti',
+ 'cchi': 'tti',
+ 'tti': 'ttya',
+ 'ccha': 'ttyu',
+ 'cchu': 'ttyo',
+ 'ccho': 'ddi',
+ 'ddi': 'ddya',
+ 'ddya': 'ddyu',
+ 'ddyu': 'ddyo',
+ 'ddyo': 'ttu',
+ 'ttsu': 'ddu',
+ 'ddu': 'hha',
+ 'tte': 'dde',
+ 'dde': 'tto',
+ 'tto': 'ddo',
+ 'ddo': 'ddu',
+ 'hha': 'bba',
+ 'bba': 'ppa',
+ 'ppa': 'hhi',
+ 'hhi': 'hhya',
+ 'hhya': 'hhyu',
+ 'hhyu': 'hhyo',
+ 'hhyo': 'bbi',
+ 'bbi': 'bbya',
+ 'bbya': 'bbyu',
+ 'bbyu': 'bbyo',
+ 'bbyo': 'ppi',
+ 'ppi': 'ppya',
+ 'ppya': 'ppyu',
+ 'ppyu': 'ppyo',
+ 'ppyo': 'hhu',
+ 'ffu': 'ffa',
+ 'ffa': 'ffi',
+ 'ffi': 'ffe',
+ 'ffe': 'ffo',
+ 'ffo': 'bbu',
+ 'bbu': 'ppu',
+ 'ppu': 'hhe',
+ 'hhe': 'bbe',
+ 'bbe': 'ppe',
+ 'ppe': 'hho',
+ 'hho': 'bbo',
+ 'bbo': 'ppo',
+ 'ppo': 'yya',
+ 'yya': 'yyu',
+ 'yyu': 'yyo',
+ 'yyo': 'rra',
+ 'rra': 'rri',
+ 'rri': 'rrya',
+ 'rrya': 'rryu',
+ 'rryu': 'rryo',
+ 'rryo': 'rru',
+ 'rru': 'rre',
+ 'rre': 'rro',
+ 'rro': 'tu',
+ 'tsu': 'du',
+ 'du': 'na',
+ 'te': 'de',
+ 'de': 'to',
+ 'to': 'do',
+ 'do': 'du',
+ 'na': 'ni',
+ 'ni': 'nya',
+ 'nya': 'nyu',
+ 'nyu': 'nyo',
+ 'nyo': 'nu',
+ 'nu': 'ne',
+ 'ne': 'no',
+ 'no': 'ha',
+ 'ha': 'ba',
+ 'ba': 'pa',
+ 'pa': 'hi',
+ 'hi': 'hya',
+ 'hya': 'hyu',
+ 'hyu': 'hyo',
+ 'hyo': 'bi',
+ 'bi': 'bya',
+ 'bya': 'byu',
+ 'byu': 'byo',
+ 'byo': 'pi',
+ 'pi': 'pya',
+ 'pya': 'pyu',
+ 'pyu': 'pyo',
+ 'pyo': 'hu',
+ 'fu': 'bu',
+ 'fa': 'fi',
+ 'fi': 'fe',
+ 'fe': 'fo',
+ 'fo': 'fu',
+ 'bu': 'pu',
+ 'pu': 'he',
+ 'he': 'be',
+ 'be': 'pe',
+ 'pe': 'ho',
+ 'ho': 'bo',
+ 'bo': 'po',
+ 'po': 'ma',
+ 'ma': 'mi',
+ 'mi': 'mya',
+ 'mya': 'myu',
+ 'myu': 'myo',
+ 'myo': 'mu',
+ 'mu': 'me',
+ 'me': 'mo',
+ 'mo': 'xya',
+ 'xya': 'ya',
+ 'ya': 'xyu',
+ 'xyu': 'yu',
+ 'yu': 'xyo',
+ 'xyo': 'yo',
+ 'yo': 'ra',
+ 'ra': 'ri',
+ 'ri': 'rya',
+ 'rya': 'ryu',
+ 'ryu': 'ryo',
+ 'ryo': 'ru',
+ 'ru': 're',
+ 're': 'ro',
+ 'ro': 'xwa',
+ 'xwa': 'wa',
+ 'wa': 'wi',
+ 'wi': 'we',
+ 'we': 'wo',
+ 'wo': 'n',
+ 'n': "n'",
+ "n'": 'dyi',
+ '-': 'tye',
+ 'che': 'ttye',
+ 'cche': 'zye'}
+
+ROMTRIE_NODES = {'x': {'a': {'': 'ァ'},
+       'i': {'': 'ィ'},
+       'u': {'': 'ゥ'},
+       'e': {'': 'ェ'},
+       'o': {'': 'ォ'},
+       't': {'u': {'': 'ッ'}, 's': {'u': {'': 'ッ'}}},
+       'y': {'a': {'': 'ャ'}, 'u': {'': 'ュ'}, 'o': {'': 'ョ'}},
+       'w': {'a': {'': 'ヮ'}}},
+ 'a': {'': 'ア'},
+ 'i': {'': 'イ'},
+ 'u': {'': 'ウ'},
+ 'v': {'u': {'': 'ヴ'},
+       'a': {'': 'ヴァ'},
+       'i': {'': 'ヴィ'},
+       'e': {'': 'ヴェ'},
+       'o': {'': 'ヴォ'},
+       'v': {'u': {'': 'ッヴ'}, 'a': {'': 'ッヴァ'}, 'i': {'': 'ッヴィ'}, 'e': {'': 'ッヴェ'}, 'o': {'': 'ッヴォ'}}},
+ 'e': {'': 'エ'},
+ 'o': {'': 'オ'},
+ 'k': {'a': {'': 'カ'},
+       'i': {'': 'キ'},
+       'y': {'a': {'': 'キャ'}, 'u': {'': 'キュ'}, 'o': {'': 'キョ'}},
+       'u': {'': 'ク'},
+       'e': {'': 'ケ'},
+       'o': {'': 'コ'},
+       'k': {'a': {'': 'ッカ'},
+             'i': {'': 'ッキ'},
+             'y': {'a': {'': 'ッキャ'}, 'u': {'': 'ッキュ'}, 'o': {'': 'ッキョ'}},
+             'u': {'': 'ック'},
+             'e': {'': 'ッケ'},
+             'o': {'': 'ッコ'}}},
+ 'g': {'a': {'': 'ガ'},
+       'i': {'': 'ギ'},
+       'y': {'a': {'': 'ギャ'}, 'u': {'': 'ギュ'}, 'o': {'': 'ギョ'}},
+       'u': {'': 'グ'},
+       'e': {'': 'ゲ'},
+       'o': {'': 'ゴ'},
+       'g': {'a': {'': 'ッガ'},
+             'i': {'': 'ッギ'},
+             'y': {'a': {'': 'ッギャ'}, 'u': {'': 'ッギュ'}, 'o': {'': 'ッギョ'}},
+             'u': {'': 'ッグ'},
+             'e': {'': 'ッゲ'},
+             'o': {'': 'ッゴ'}}},
+ 's': {'a': {'': 'サ'},
+       'i': {'': 'シ'},
+       'y': {'a': {'': 'シャ'}, 'u': {'': 'シュ'}, 'o': {'': 'ショ'}, 'e': {'': 'シェ'}},
+       'u': {'': 'ス'},
+       'e': {'': 'セ'},
+       'o': {'': 'ソ'},
+       's': {'a': {'': 'ッサ'},
+             'i': {'': 'ッシ'},
+             'y': {'a': {'': 'ッシャ'}, 'u': {'': 'ッシュ'}, 'o': {'': 'ッショ'}, 'e': {'': 'ッシェ'}},
+             'u': {'': 'ッス'},
+             'e': {'': 'ッセ'},
+             'o': {'': 'ッソ'},
+             'h': {'i': {'': 'ッシ'}, 'a': {'': 'ッシャ'}, 'u': {'': 'ッシュ'}, 'o': {'': 'ッショ'}, 'e': {'': 'ッシェ'}}},
+       'h': {'i': {'': 'シ'}, 'a': {'': 'シャ'}, 'u': {'': 'シュ'}, 'o': {'': 'ショ'}, 'e': {'': 'シェ'}}},
+ 'z': {'a': {'': 'ザ'},
+       'i': {'': 'ジ'},
+       'y': {'a': {'': 'ジャ'}, 'u': {'': 'ジュ'}, 'o': {'': 'ジョ'}, 'e': {'': 'ジェ'}},
+       'u': {'': 'ズ'},
+       'e': {'': 'ゼ'},
+       'o': {'': 'ゾ'},
+       'z': {'a': {'': 'ッザ'},
+             'i': {'': 'ッジ'},
+             'y': {'a': {'': 'ッジャ'}, 'u': {'': 'ッジュ'}, 'o': {'': 'ッジョ'}},
+             'u': {'': 'ッズ'},
+             'e': {'': 'ッゼ'},
+             'o': {'': 'ッゾ'}}},
+ 't': {'a': {'': 'タ'},
+       'y': {'a': {'': 'チャ'}, 'u': {'': 'チュ'}, 'o': {'': 'チョ'}, 'e': {'': 'チェ'}},
+       'i': {'': 'ティ'},
+       't': {'a': {'': 'ッタ'},
+             'i': {'': 'ッティ'},
+             'y': {'a': {'': 'ッチャ'}, 'u': {'': 'ッチュ'}, 'o': {'': 'ッチョ'}, 'e': {'': 'ッチェ'}},
+             'u': {'': 'ッツ'},
+             'e': {'': 'ッテ'},
+             'o': {'': 'ット'},
+             's': {'u': {'': 'ッツ'}}},
+       'u': {'': 'ツ'},
+       'e': {'': 'テ'},
+       'o': {'': 'ト'},
+       's': {'u': {'': 'ツ'}}},
+ 'd': {'a': {'': 'ダ'},
+       'i': {'': 'ヂ'},
+       'y': {'a': {'': 'ヂャ'}, 'u': {'': 'ヂュ'}, 'o': {'': 'ヂョ'}, 'i': {'': 'ディ'}},
+       'd': {'a': {'': 'ッダ'},
+             'i': {'': 'ッヂ'},
+             'y': {'a': {'': 'ッヂャ'}, 'u': {'': 'ッヂュ'}, 'o': {'': 'ッヂョ'}},
+             'u': {'': 'ッドゥ'},
+             'e': {'': 'ッデ'},
+             'o': {'': 'ッド'}},
+       'u': {'': 'ヅ'},
+       'e': {'': 'デ'},
+       'o': {'': 'ド'}},
+ 'h': {'h': {'a': {'': 'ッハ'},
+             'i': {'': 'ッヒ'},
+             'y': {'a': {'': 'ッヒャ'}, 'u': {'': 'ッヒュ'}, 'o': {'': 'ッヒョ'}},
+             'u': {'': 'ッフ'},
+             'e': {'': 'ッヘ'},
+             'o': {'': 'ッホ'}},
+       'a': {'': 'ハ'},
+       'i': {'': 'ヒ'},
+       'y': {'a': {'': 'ヒャ'}, 'u': {'': 'ヒュ'}, 'o': {'': 'ヒョ'}},
+       'u': {'': 'フ'},
+       'e': {'': 'ヘ'},
+       'o': {'': 'ホ'}},
+ 'b': {'b': {'a': {'': 'ッバ'},
+             'i': {'': 'ッビ'},
+             'y': {'a': {'': 'ッビャ'}, 'u': {'': 'ッビュ'}, 'o': {'': 'ッビョ'}},
+             'u': {'': 'ッブ'},
+             'e': {'': 'ッベ'},
+             'o': {'': 'ッボ'}},
+       'a': {'': 'バ'},
+       'i': {'': 'ビ'},
+       'y': {'a': {'': 'ビャ'}, 'u': {'': 'ビュ'}, 'o': {'': 'ビョ'}},
+       'u': {'': 'ブ'},
+       'e': {'': 'ベ'},
+       'o': {'': 'ボ'}},
+ 'p': {'p': {'a': {'': 'ッパ'},
+             'i': {'': 'ッピ'},
+             'y': {'a': {'': 'ッピャ'}, 'u': {'': 'ッピュ'}, 'o': {'': 'ッピョ'}},
+             'u': {'': 'ップ'},
+             'e': {'': 'ッペ'},
+             'o': {'': 'ッポ'}},
+       'a': {'': 'パ'},
+       'i': {'': 'ピ'},
+       'y': {'a': {'': 'ピャ'}, 'u': {'': 'ピュ'}, 'o': {'': 'ピョ'}},
+       'u': {'': 'プ'},
+       'e': {'': 'ペ'},
+       'o': {'': 'ポ'}},
+ 'f': {'f': {'u': {'': 'ッフュ'}, 'a': {'': 'ッファ'}, 'i': {'': 'ッフィ'}, 'e': {'': 'ッフェ'}, 'o': {'': 'ッフォ'}},
+       'a': {'': 'ファ'},
+       'i': {'': 'フィ'},
+       'e': {'': 'フェ'},
+       'o': {'': 'フォ'},
+       'u': {'': 'フ'}},
+ 'y': {'y': {'a': {'': 'ッヤ'}, 'u': {'': 'ッユ'}, 'o': {'': 'ッヨ'}}, 'a': {'': 'ヤ'}, 'u': {'': 'ユ'}, 'o': {'': 'ヨ'}},
+ 'r': {'r': {'a': {'': 'ッラ'},
+             'i': {'': 'ッリ'},
+             'y': {'a': {'': 'ッリャ'}, 'u': {'': 'ッリュ'}, 'o': {'': 'ッリョ'}},
+             'u': {'': 'ッル'},
+             'e': {'': 'ッレ'},
+             'o': {'': 'ッロ'}},
+       'a': {'': 'ラ'},
+       'i': {'': 'リ'},
+       'y': {'a': {'': 'リャ'}, 'u': {'': 'リュ'}, 'o': {'': 'リョ'}},
+       'u': {'': 'ル'},
+       'e': {'': 'レ'},
+       'o': {'': 'ロ'}},
+ 'n': {'a': {'': 'ナ'},
+       'i': {'': 'ニ'},
+       'y': {'a': {'': 'ニャ'}, 'u': {'': 'ニュ'}, 'o': {'': 'ニョ'}},
+       'u': {'': 'ヌ'},
+       'e': {'': 'ネ'},
+       'o': {'': 'ノ'},
+       '': 'ン',
+       "'": {'': 'ン'}},
+ 'm': {'a': {'': 'マ'},
+       'i': {'': 'ミ'},
+       'y': {'a': {'': 'ミャ'}, 'u': {'': 'ミュ'}, 'o': {'': 'ミョ'}},
+       'u': {'': 'ム'},
+       'e': {'': 'メ'},
+       'o': {'': 'モ'}},
+ 'w': {'a': {'': 'ワ'}, 'i': {'': 'ウィ'}, 'e': {'': 'ウェ'}, 'o': {'': 'ヲ'}},
+ '-': {'': 'ー'},
+ 'j': {'i': {'': 'ジ'},
+       'a': {'': 'ジャ'},
+       'u': {'': 'ジュ'},
+       'o': {'': 'ジョ'},
+       'j': {'i': {'': 'ッジ'}, 'a': {'': 'ッジャ'}, 'u': {'': 'ッジュ'}, 'o': {'': 'ッジョ'}},
+       'e': {'': 'ジェ'}},
+ 'c': {'h': {'i': {'': 'チ'}, 'a': {'': 'チャ'}, 'u': {'': 'チュ'}, 'o': {'': 'チョ'}, 'e': {'': 'チェ'}},
+       'c': {'h': {'i': {'': 'ッチ'}, 'a': {'': 'ッチャ'}, 'u': {'': 'ッチュ'}, 'o': {'': 'ッチョ'}, 'e': {'': 'ッチェ'}}}}}
+
+KANROM_H = {'ぁ': 'xa',
+ 'あ': 'a',
+ 'ぃ': 'xi',
+ 'い': 'i',
+ 'ぅ': 'xu',
+ 'う': 'u',
+ 'う゛': 'vu',
+ 'う゛ぁ': 'va',
+ 'う゛ぃ': 'vi',
+ 'う゛ぇ': 've',
+ 'う゛ぉ': 'vo',
+ 'ぇ': 'xe',
+ 'え': 'e',
+ 'ぉ': 'xo',
+ 'お': 'o',
+ 'か': 'ka',
+ 'が': 'ga',
+ 'き': 'ki',
+ 'きゃ': 'kya',
+ 'きゅ': 'kyu',
+ 'きょ': 'kyo',
+ 'ぎ': 'gi',
+ 'ぎゃ': 'gya',
+ 'ぎゅ': 'gyu',
+ 'ぎょ': 'gyo',
+ 'く': 'ku',
+ 'ぐ': 'gu',
+ 'け': 'ke',
+ 'げ': 'ge',
+ 'こ': 'ko',
+ 'ご': 'go',
+ 'さ': 'sa',
+ 'ざ': 'za',
+ 'し': 'shi',
+ 'しゃ': 'sha',
+ 'しゅ': 'shu',
+ 'しょ': 'sho',
+ 'じ': 'ji',
+ 'じゃ': 'ja',
+ 'じゅ': 'ju',
+ 'じょ': 'jo',
+ 'す': 'su',
+ 'ず': 'zu',
+ 'せ': 'se',
+ 'ぜ': 'ze',
+ 'そ': 'so',
+ 'ぞ': 'zo',
+ 'た': 'ta',
+ 'だ': 'da',
+ 'ち': 'chi',
+ 'ちゃ': 'cha',
+ 'ちゅ': 'chu',
+ 'ちょ': 'cho',
+ 'ぢ': 'di',
+ 'ぢゃ': 'dya',
+ 'ぢゅ': 'dyu',
+ 'ぢょ': 'dyo',
+ 'っ': 'xtsu',
+ 'っう゛': 'vvu',
+ 'っう゛ぁ': 'vva',
+ 'っう゛ぃ': 'vvi',
+ 'っう゛ぇ': 'vve',
+ 'っう゛ぉ': 'vvo',
+ 'っか': 'kka',
+ 'っが': 'gga',
+ 'っき': 'kki',
+ 'っきゃ': 'kkya',
+ 'っきゅ': 'kkyu',
+ 'っきょ': 'kkyo',
+ 'っぎ': 'ggi',
+ 'っぎゃ': 'ggya',
+ 'っぎゅ': 'ggyu',
+ 'っぎょ': 'ggyo',
+ 'っく': 'kku',
+ 'っぐ': 'ggu',
+ 'っけ': 'kke',
+ 'っげ': 'gge',
+ 'っこ': 'kko',
+ 'っご': 'ggo',
+ 'っさ': 'ssa',
+ 'っざ': 'zza',
+ 'っし': 'sshi',
+ 'っしゃ': 'ssha',
+ 'っしゅ': 'sshu',
+ 'っしょ': 'ssho',
+ 'っじ': 'jji',
+ 'っじゃ': 'jja',
+ 'っじゅ': 'jju',
+ 'っじょ': 'jjo',
+ 'っす': 'ssu',
+ 'っず': 'zzu',
+ 'っせ': 'sse',
+ 'っぜ': 'zze',
+ 'っそ': 'sso',
+ 'っぞ': 'zzo',
+ 'った': 'tta',
+ 'っだ': 'dda',
+ 'っち': 'cchi',
+ 'っちゃ': 'ccha',
+ 'っちゅ': 'cchu',
+ 'っちょ': 'ccho',
+ 'っぢ': 'ddi',
+ 'っぢゃ': 'ddya',
+ 'っぢゅ': 'ddyu',
+ 'っぢょ': 'ddyo',
+ 'っつ': 'ttsu',
+ 'っづ': 'ddu',
+ 'って': 'tte',
+ 'っで': 'dde',
+ 'っと': 'tto',
+ 'っど': 'ddo',
+ 'っは': 'hha',
+ 'っば': 'bba',
+ 'っぱ': 'ppa',
+ 'っひ': 'hhi',
+ 'っひゃ': 'hhya',
+ 'っひゅ': 'hhyu',
+ 'っひょ': 'hhyo',
+ 'っび': 'bbi',
+ 'っびゃ': 'bbya',
+ 'っびゅ': 'bbyu',
+ 'っびょ': 'bbyo',
+ 'っぴ': 'ppi',
+ 'っぴゃ': 'ppya',
+ 'っぴゅ': 'ppyu',
+ 'っぴょ': 'ppyo',
+ 'っふ': 'ffu',
+ 'っふぁ': 'ffa',
+ 'っふぃ': 'ffi',
+ 'っふぇ': 'ffe',
+ 'っふぉ': 'ffo',
+ 'っぶ': 'bbu',
+ 'っぷ': 'ppu',
+ 'っへ': 'hhe',
+ 'っべ': 'bbe',
+ 'っぺ': 'ppe',
+ 'っほ': 'hho',
+ 'っぼ': 'bbo',
+ 'っぽ': 'ppo',
+ 'っや': 'yya',
+ 'っゆ': 'yyu',
+ 'っよ': 'yyo',
+ 'っら': 'rra',
+ 'っり': 'rri',
+ 'っりゃ': 'rrya',
+ 'っりゅ': 'rryu',
+ 'っりょ': 'rryo',
+ 'っる': 'rru',
+ 'っれ': 'rre',
+ 'っろ': 'rro',
+ 'つ': 'tsu',
+ 'づ': 'du',
+ 'て': 'te',
+ 'で': 'de',
+ 'と': 'to',
+ 'ど': 'do',
+ 'な': 'na',
+ 'に': 'ni',
+ 'にゃ': 'nya',
+ 'にゅ': 'nyu',
+ 'にょ': 'nyo',
+ 'ぬ': 'nu',
+ 'ね': 'ne',
+ 'の': 'no',
+ 'は': 'ha',
+ 'ば': 'ba',
+ 'ぱ': 'pa',
+ 'ひ': 'hi',
+ 'ひゃ': 'hya',
+ 'ひゅ': 'hyu',
+ 'ひょ': 'hyo',
+ 'び': 'bi',
+ 'びゃ': 'bya',
+ 'びゅ': 'byu',
+ 'びょ': 'byo',
+ 'ぴ': 'pi',
+ 'ぴゃ': 'pya',
+ 'ぴゅ': 'pyu',
+ 'ぴょ': 'pyo',
+ 'ふ': 'fu',
+ 'ふぁ': 'fa',
+ 'ふぃ': 'fi',
+ 'ふぇ': 'fe',
+ 'ふぉ': 'fo',
+ 'ぶ': 'bu',
+ 'ぷ': 'pu',
+ 'へ': 'he',
+ 'べ': 'be',
+ 'ぺ': 'pe',
+ 'ほ': 'ho',
+ 'ぼ': 'bo',
+ 'ぽ': 'po',
+ 'ま': 'ma',
+ 'み': 'mi',
+ 'みゃ': 'mya',
+ 'みゅ': 'myu',
+ 'みょ': 'myo',
+ 'む': 'mu',
+ 'め': 'me',
+ 'も': 'mo',
+ 'ゃ': 'xya',
+ 'や': 'ya',
+ 'ゅ': 'xyu',
+ 'ゆ': 'yu',
+ 'ょ': 'xyo',
+ 'よ': 'yo',
+ 'ら': 'ra',
+ 'り': 'ri',
+ 'りゃ': 'rya',
+ 'りゅ': 'ryu',
+ 'りょ': 'ryo',
+ 'る': 'ru',
+ 'れ': 're',
+ 'ろ': 'ro',
+ 'ゎ': 'xwa',
+ 'わ': 'wa',
+ 'ゐ': 'wi',
+ 'ゑ': 'we',
+ 'を': 'wo',
+ 'ん': "n'",
+ 'でぃ': 'dyi',
+ 'ー': '-',
+ 'ちぇ': 'che',
+ 'っちぇ': 'cche',
+ 'じぇ': 'je'}
+
+ROMKAN_H = {'xa': 'ぁ',
+ 'a': 'あ',
+ 'xi': 'ぃ',
+ 'i': 'い',
+ 'xu': 'ぅ',
+ 'u': 'う',
+ 'vu': 'う゛',
+ 'va': 'う゛ぁ',
+ 'vi': 'う゛ぃ',
+ 've': 'う゛ぇ',
+ 'vo': 'う゛ぉ',
+ 'xe': 'ぇ',
+ 'e': 'え',
+ 'xo': 'ぉ',
+ 'o': 'お',
+ 'ka': 'か',
+ 'ga': 'が',
+ 'ki': 'き',
+ 'kya': 'きゃ',
+ 'kyu': 'きゅ',
+ 'kyo': 'きょ',
+ 'gi': 'ぎ',
+ 'gya': 'ぎゃ',
+ 'gyu': 'ぎゅ',
+ 'gyo': 'ぎょ',
+ 'ku': 'く',
+ 'gu': 'ぐ',
+ 'ke': 'け',
+ 'ge': 'げ',
+ 'ko': 'こ',
+ 'go': 'ご',
+ 'sa': 'さ',
+ 'za': 'ざ',
+ 'si': 'し',
+ 'sya': 'しゃ',
+ 'syu': 'しゅ',
+ 'syo': 'しょ',
+ 'zi': 'じ',
+ 'zya': 'じゃ',
+ 'zyu': 'じゅ',
+ 'zyo': 'じょ',
+ 'su': 'す',
+ 'zu': 'ず',
+ 'se': 'せ',
+ 'ze': 'ぜ',
+ 'so': 'そ',
+ 'zo': 'ぞ',
+ 'ta': 'た',
+ 'da': 'だ',
+ 'ti': 'ち',
+ 'tya': 'ちゃ',
+ 'tyu': 'ちゅ',
+ 'tyo': 'ちょ',
+ 'di': 'ぢ',
+ 'dya': 'ぢゃ',
+ 'dyu': 'ぢゅ',
+ 'dyo': 'ぢょ',
+ 'xtu': 'っ',
+ 'vvu': 'っう゛',
+ 'vva': 'っう゛ぁ',
+ 'vvi': 'っう゛ぃ',
+ 'vve': 'っう゛ぇ',
+ 'vvo': 'っう゛ぉ',
+ 'kka': 'っか',
+ 'gga': 'っが',
+ 'kki': 'っき',
+ 'kkya': 'っきゃ',
+ 'kkyu': 'っきゅ',
+ 'kkyo': 'っきょ',
+ 'ggi': 'っぎ',
+ 'ggya': 'っぎゃ',
+ 'ggyu': 'っぎゅ',
+ 'ggyo': 'っぎょ',
+ 'kku': 'っく',
+ 'ggu': 'っぐ',
+ 'kke': 'っけ',
+ 'gge': 'っげ',
+ 'kko': 'っこ',
+ 'ggo': 'っご',
+ 'ssa': 'っさ',
+ 'zza': 'っざ',
+ 'ssi': 'っし',
+ 'ssya': 'っしゃ',
+ 'ssyu': 'っしゅ',
+ 'ssyo': 'っしょ',
+ 'zzi': 'っじ',
+ 'zzya': 'っじゃ',
+ 'zzyu': 'っじゅ',
+ 'zzyo': 'っじょ',
+ 'ssu': 'っす',
+ 'zzu': 'っず',
+ 'sse': 'っせ',
+ 'zze': 'っぜ',
+ 'sso': 'っそ',
+ 'zzo': 'っぞ',
+ 'tta': 'った',
+ 'dda': 'っだ',
+ 'tti': 'っち',
+ 'ttya': 'っちゃ',
+ 'ttyu': 'っちゅ',
+ 'ttyo': 'っちょ',
+ 'ddi': 'っぢ',
+ 'ddya': 'っぢゃ',
+ 'ddyu': 'っぢゅ',
+ 'ddyo': 'っぢょ',
+ 'ttu': 'っつ',
+ 'ddu': 'っづ',
+ 'tte': 'って',
+ 'dde': 'っで',
+ 'tto': 'っと',
+ 'ddo': 'っど',
+ 'hha': 'っは',
+ 'bba': 'っば',
+ 'ppa': 'っぱ',
+ 'hhi': 'っひ',
+ 'hhya': 'っひゃ',
+ 'hhyu': 'っひゅ',
+ 'hhyo': 'っひょ',
+ 'bbi': 'っび',
+ 'bbya': 'っびゃ',
+ 'bbyu': 'っびゅ',
+ 'bbyo': 'っびょ',
+ 'ppi': 'っぴ',
+ 'ppya': 'っぴゃ',
+ 'ppyu': 'っぴゅ',
+ 'ppyo': 'っぴょ',
+ 'hhu': 'っふ',
+ 'ffa': 'っふぁ',
+ 'ffi': 'っふぃ',
+ 'ffe': 'っふぇ',
+ 'ffo': 'っふぉ',
+ 'bbu': 'っぶ',
+ 'ppu': 'っぷ',
+ 'hhe': 'っへ',
+ 'bbe': 'っべ',
+ 'ppe': 'っぺ',
+ 'hho': 'っほ',
+ 'bbo': 'っぼ',
+ 'ppo': 'っぽ',
+ 'yya': 'っや',
+ 'yyu': 'っゆ',
+ 'yyo': 'っよ',
+ 'rra': 'っら',
+ 'rri': 'っり',
+ 'rrya': 'っりゃ',
+ 'rryu': 'っりゅ',
+ 'rryo': 'っりょ',
+ 'rru': 'っる',
+ 'rre': 'っれ',
+ 'rro': 'っろ',
+ 'tu': 'つ',
+ 'du': 'づ',
+ 'te': 'て',
+ 'de': 'で',
+ 'to': 'と',
+ 'do': 'ど',
+ 'na': 'な',
+ 'ni': 'に',
+ 'nya': 'にゃ',
+ 'nyu': 'にゅ',
+ 'nyo': 'にょ',
+ 'nu': 'ぬ',
+ 'ne': 'ね',
+ 'no': 'の',
+ 'ha': 'は',
+ 'ba': 'ば',
+ 'pa': 'ぱ',
+ 'hi': 'ひ',
+ 'hya': 'ひゃ',
+ 'hyu': 'ひゅ',
+ 'hyo': 'ひょ',
+ 'bi': 'び',
+ 'bya': 'びゃ',
+ 'byu': 'びゅ',
+ 'byo': 'びょ',
+ 'pi': 'ぴ',
+ 'pya': 'ぴゃ',
+ 'pyu': 'ぴゅ',
+ 'pyo': 'ぴょ',
+ 'hu': 'ふ',
+ 'fa': 'ふぁ',
+ 'fi': 'ふぃ',
+ 'fe': 'ふぇ',
+ 'fo': 'ふぉ',
+ 'bu': 'ぶ',
+ 'pu': 'ぷ',
+ 'he': 'へ',
+ 'be': 'べ',
+ 'pe': 'ぺ',
+ 'ho': 'ほ',
+ 'bo': 'ぼ',
+ 'po': 'ぽ',
+ 'ma': 'ま',
+ 'mi': 'み',
+ 'mya': 'みゃ',
+ 'myu': 'みゅ',
+ 'myo': 'みょ',
+ 'mu': 'む',
+ 'me': 'め',
+ 'mo': 'も',
+ 'xya': 'ゃ',
+ 'ya': 'や',
+ 'xyu': 'ゅ',
+ 'yu': 'ゆ',
+ 'xyo': 'ょ',
+ 'yo': 'よ',
+ 'ra': 'ら',
+ 'ri': 'り',
+ 'rya': 'りゃ',
+ 'ryu': 'りゅ',
+ 'ryo': 'りょ',
+ 'ru': 'る',
+ 're': 'れ',
+ 'ro': 'ろ',
+ 'xwa': 'ゎ',
+ 'wa': 'わ',
+ 'wi': 'うぃ',
+ 'we': 'うぇ',
+ 'wo': 'を',
+ 'n': 'ん',
+ "n'": 'ん',
+ 'dyi': 'でぃ',
+ '-': 'ー',
+ 'tye': 'ちぇ',
+ 'ttye': 'っちぇ',
+ 'zye': 'じぇ',
+ 'shi': 'し',
+ 'sha': 'しゃ',
+ 'shu': 'しゅ',
+ 'sho': 'しょ',
+ 'ji': 'じ',
+ 'ja': 'じゃ',
+ 'ju': 'じゅ',
+ 'jo': 'じょ',
+ 'chi': 'ち',
+ 'cha': 'ちゃ',
+ 'chu': 'ちゅ',
+ 'cho': 'ちょ',
+ 'xtsu': 'っ',
+ 'sshi': 'っし',
+ 'ssha': 'っしゃ',
+ 'sshu': 'っしゅ',
+ 'ssho': 'っしょ',
+ 'jji': 'っじ',
+ 'jja': 'っじゃ',
+ 'jju': 'っじゅ',
+ 'jjo': 'っじょ',
+ 'cchi': 'っち',
+ 'ccha': 'っちゃ',
+ 'cchu': 'っちゅ',
+ 'ccho': 'っちょ',
+ 'ttsu': 'っつ',
+ 'ffu': 'っふ',
+ 'tsu': 'つ',
+ 'fu': 'ふ',
+ 'che': 'ちぇ',
+ 'cche': 'っちぇ',
+ 'je': 'じぇ'}
+
+KUNREI_H = ['xa',
+ 'a',
+ 'xi',
+ 'i',
+ 'xu',
+ 'u',
+ 'vu',
+ 'va',
+ 'vi',
+ 've',
+ 'vo',
+ 'xe',
+ 'e',
+ 'xo',
+ 'o',
+ 'ka',
+ 'ga',
+ 'ki',
+ 'kya',
+ 'kyu',
+ 'kyo',
+ 'gi',
+ 'gya',
+ 'gyu',
+ 'gyo',
+ 'ku',
+ 'gu',
+ 'ke',
+ 'ge',
+ 'ko',
+ 'go',
+ 'sa',
+ 'za',
+ 'si',
+ 'sya',
+ 'syu',
+ 'syo',
+ 'zi',
+ 'zya',
+ 'zyu',
+ 'zyo',
+ 'su',
+ 'zu',
+ 'se',
+ 'ze',
+ 'so',
+ 'zo',
+ 'ta',
+ 'da',
+ 'ti',
+ 'tya',
+ 'tyu',
+ 'tyo',
+ 'di',
+ 'dya',
+ 'dyu',
+ 'dyo',
+ 'xtu',
+ 'vvu',
+ 'vva',
+ 'vvi',
+ 'vve',
+ 'vvo',
+ 'kka',
+ 'gga',
+ 'kki',
+ 'kkya',
+ 'kkyu',
+ 'kkyo',
+ 'ggi',
+ 'ggya',
+ 'ggyu',
+ 'ggyo',
+ 'kku',
+ 'ggu',
+ 'kke',
+ 'gge',
+ 'kko',
+ 'ggo',
+ 'ssa',
+ 'zza',
+ 'ssi',
+ 'ssya',
+ 'ssyu',
+ 'ssyo',
+ 'zzi',
+ 'zzya',
+ 'zzyu',
+ 'zzyo',
+ 'ssu',
+ 'zzu',
+ 'sse',
+ 'zze',
+ 'sso',
+ 'zzo',
+ 'tta',
+ 'dda',
+ 'tti',
+ 'ttya',
+ 'ttyu',
+ 'ttyo',
+ 'ddi',
+ 'ddya',
+ 'ddyu',
+ 'ddyo',
+ 'ttu',
+ 'ddu',
+ 'tte',
+ 'dde',
+ 'tto',
+ 'ddo',
+ 'hha',
+ 'bba',
+ 'ppa',
+ 'hhi',
+ 'hhya',
+ 'hhyu',
+ 'hhyo',
+ 'bbi',
+ 'bbya',
+ 'bbyu',
+ 'bbyo',
+ 'ppi',
+ 'ppya',
+ 'ppyu',
+ 'ppyo',
+ 'hhu',
+ 'ffa',
+ 'ffi',
+ 'ffe',
+ 'ffo',
+ 'bbu',
+ 'ppu',
+ 'hhe',
+ 'bbe',
+ 'ppe',
+ 'hho',
+ 'bbo',
+ 'ppo',
+ 'yya',
+ 'yyu',
+ 'yyo',
+ 'rra',
+ 'rri',
+ 'rrya',
+ 'rryu',
+ 'rryo',
+ 'rru',
+ 'rre',
+ 'rro',
+ 'tu',
+ 'du',
+ 'te',
+ 'de',
+ 'to',
+ 'do',
+ 'na',
+ 'ni',
+ 'nya',
+ 'nyu',
+ 'nyo',
+ 'nu',
+ 'ne',
+ 'no',
+ 'ha',
+ 'ba',
+ 'pa',
+ 'hi',
+ 'hya',
+ 'hyu',
+ 'hyo',
+ 'bi',
+ 'bya',
+ 'byu',
+ 'byo',
+ 'pi',
+ 'pya',
+ 'pyu',
+ 'pyo',
+ 'hu',
+ 'fa',
+ 'fi',
+ 'fe',
+ 'fo',
+ 'bu',
+ 'pu',
+ 'he',
+ 'be',
+ 'pe',
+ 'ho',
+ 'bo',
+ 'po',
+ 'ma',
+ 'mi',
+ 'mya',
+ 'myu',
+ 'myo',
+ 'mu',
+ 'me',
+ 'mo',
+ 'xya',
+ 'ya',
+ 'xyu',
+ 'yu',
+ 'xyo',
+ 'yo',
+ 'ra',
+ 'ri',
+ 'rya',
+ 'ryu',
+ 'ryo',
+ 'ru',
+ 're',
+ 'ro',
+ 'xwa',
+ 'wa',
+ 'wi',
+ 'we',
+ 'wo',
+ 'n',
+ "n'",
+ 'dyi',
+ '-',
+ 'tye',
+ 'ttye',
+ 'zye']
+
+HEPBURN_H = ['xa',
+ 'a',
+ 'xi',
+ 'i',
+ 'xu',
+ 'u',
+ 'vu',
+ 'va',
+ 'vi',
+ 've',
+ 'vo',
+ 'xe',
+ 'e',
+ 'xo',
+ 'o',
+ 'ka',
+ 'ga',
+ 'ki',
+ 'kya',
+ 'kyu',
+ 'kyo',
+ 'gi',
+ 'gya',
+ 'gyu',
+ 'gyo',
+ 'ku',
+ 'gu',
+ 'ke',
+ 'ge',
+ 'ko',
+ 'go',
+ 'sa',
+ 'za',
+ 'shi',
+ 'sha',
+ 'shu',
+ 'sho',
+ 'ji',
+ 'ja',
+ 'ju',
+ 'jo',
+ 'su',
+ 'zu',
+ 'se',
+ 'ze',
+ 'so',
+ 'zo',
+ 'ta',
+ 'da',
+ 'chi',
+ 'cha',
+ 'chu',
+ 'cho',
+ 'di',
+ 'dya',
+ 'dyu',
+ 'dyo',
+ 'xtsu',
+ 'vvu',
+ 'vva',
+ 'vvi',
+ 'vve',
+ 'vvo',
+ 'kka',
+ 'gga',
+ 'kki',
+ 'kkya',
+ 'kkyu',
+ 'kkyo',
+ 'ggi',
+ 'ggya',
+ 'ggyu',
+ 'ggyo',
+ 'kku',
+ 'ggu',
+ 'kke',
+ 'gge',
+ 'kko',
+ 'ggo',
+ 'ssa',
+ 'zza',
+ 'sshi',
+ 'ssha',
+ 'sshu',
+ 'ssho',
+ 'jji',
+ 'jja',
+ 'jju',
+ 'jjo',
+ 'ssu',
+ 'zzu',
+ 'sse',
+ 'zze',
+ 'sso',
+ 'zzo',
+ 'tta',
+ 'dda',
+ 'cchi',
+ 'ccha',
+ 'cchu',
+ 'ccho',
+ 'ddi',
+ 'ddya',
+ 'ddyu',
+ 'ddyo',
+ 'ttsu',
+ 'ddu',
+ 'tte',
+ 'dde',
+ 'tto',
+ 'ddo',
+ 'hha',
+ 'bba',
+ 'ppa',
+ 'hhi',
+ 'hhya',
+ 'hhyu',
+ 'hhyo',
+ 'bbi',
+ 'bbya',
+ 'bbyu',
+ 'bbyo',
+ 'ppi',
+ 'ppya',
+ 'ppyu',
+ 'ppyo',
+ 'ffu',
+ 'ffa',
+ 'ffi',
+ 'ffe',
+ 'ffo',
+ 'bbu',
+ 'ppu',
+ 'hhe',
+ 'bbe',
+ 'ppe',
+ 'hho',
+ 'bbo',
+ 'ppo',
+ 'yya',
+ 'yyu',
+ 'yyo',
+ 'rra',
+ 'rri',
+ 'rrya',
+ 'rryu',
+ 'rryo',
+ 'rru',
+ 'rre',
+ 'rro',
+ 'tsu',
+ 'du',
+ 'te',
+ 'de',
+ 'to',
+ 'do',
+ 'na',
+ 'ni',
+ 'nya',
+ 'nyu',
+ 'nyo',
+ 'nu',
+ 'ne',
+ 'no',
+ 'ha',
+ 'ba',
+ 'pa',
+ 'hi',
+ 'hya',
+ 'hyu',
+ 'hyo',
+ 'bi',
+ 'bya',
+ 'byu',
+ 'byo',
+ 'pi',
+ 'pya',
+ 'pyu',
+ 'pyo',
+ 'fu',
+ 'fa',
+ 'fi',
+ 'fe',
+ 'fo',
+ 'bu',
+ 'pu',
+ 'he',
+ 'be',
+ 'pe',
+ 'ho',
+ 'bo',
+ 'po',
+ 'ma',
+ 'mi',
+ 'mya',
+ 'myu',
+ 'myo',
+ 'mu',
+ 'me',
+ 'mo',
+ 'xya',
+ 'ya',
+ 'xyu',
+ 'yu',
+ 'xyo',
+ 'yo',
+ 'ra',
+ 'ri',
+ 'rya',
+ 'ryu',
+ 'ryo',
+ 'ru',
+ 're',
+ 'ro',
+ 'xwa',
+ 'wa',
+ 'wi',
+ 'we',
+ 'wo',
+ 'n',
+ "n'",
+ 'dyi',
+ '-',
+ 'che',
+ 'cche',
+ 'je']
+
+TO_HEPBURN_H = {'xa': 'xa',
+ 'a': 'a',
+ 'xi': 'xi',
+ 'i': 'i',
+ 'xu': 'xu',
+ 'u': 'u',
+ 'vu': 'vu',
+ 'va': 'va',
+ 'vi': 'vi',
+ 've': 've',
+ 'vo': 'vo',
+ 'xe': 'xe',
+ 'e': 'e',
+ 'xo': 'xo',
+ 'o': 'o',
+ 'ka': 'ka',
+ 'ga': 'ga',
+ 'ki': 'ki',
+ 'kya': 'kya',
+ 'kyu': 'kyu',
+ 'kyo': 'kyo',
+ 'gi': 'gi',
+ 'gya': 'gya',
+ 'gyu': 'gyu',
+ 'gyo': 'gyo',
+ 'ku': 'ku',
+ 'gu': 'gu',
+ 'ke': 'ke',
+ 'ge': 'ge',
+ 'ko': 'ko',
+ 'go': 'go',
+ 'sa': 'sa',
+ 'za': 'za',
+ 'si': 'shi',
+ 'sya': 'sha',
+ 'syu': 'shu',
+ 'syo': 'sho',
+ 'zi': 'ji',
+ 'zya': 'ja',
+ 'zyu': 'ju',
+ 'zyo': 'jo',
+ 'su': 'su',
+ 'zu': 'zu',
+ 'se': 'se',
+ 'ze': 'ze',
+ 'so': 'so',
+ 'zo': 'zo',
+ 'ta': 'ta',
+ 'da': 'da',
+ 'ti': 'chi',
+ 'tya': 'cha',
+ 'tyu': 'chu',
+ 'tyo': 'cho',
+ 'di': 'di',
+ 'dya': 'dya',
+ 'dyu': 'dyu',
+ 'dyo': 'dyo',
+ 'xtu': 'xtsu',
+ 'vvu': 'vvu',
+ 'vva': 'vva',
+ 'vvi': 'vvi',
+ 'vve': 'vve',
+ 'vvo': 'vvo',
+ 'kka': 'kka',
+ 'gga': 'gga',
+ 'kki': 'kki',
+ 'kkya': 'kkya',
+ 'kkyu': 'kkyu',
+ 'kkyo': 'kkyo',
+ 'ggi': 'ggi',
+ 'ggya': 'ggya',
+ 'ggyu': 'ggyu',
+ 'ggyo': 'ggyo',
+ 'kku': 'kku',
+ 'ggu': 'ggu',
+ 'kke': 'kke',
+ 'gge': 'gge',
+ 'kko': 'kko',
+ 'ggo': 'ggo',
+ 'ssa': 'ssa',
+ 'zza': 'zza',
+ 'ssi': 'sshi',
+ 'ssya': 'ssha',
+ 'ssyu': 'sshu',
+ 'ssyo': 'ssho',
+ 'zzi': 'jji',
+ 'zzya': 'jja',
+ 'zzyu': 'jju',
+ 'zzyo': 'jjo',
+ 'ssu': 'ssu',
+ 'zzu': 'zzu',
+ 'sse': 'sse',
+ 'zze': 'zze',
+ 'sso': 'sso',
+ 'zzo': 'zzo',
+ 'tta': 'tta',
+ 'dda': 'dda',
+ 'tti': 'cchi',
+ 'ttya': 'ccha',
+ 'ttyu': 'cchu',
+ 'ttyo': 'ccho',
+ 'ddi': 'ddi',
+ 'ddya': 'ddya',
+ 'ddyu': 'ddyu',
+ 'ddyo': 'ddyo',
+ 'ttu': 'ttsu',
+ 'ddu': 'ddu',
+ 'tte': 'tte',
+ 'dde': 'dde',
+ 'tto': 'tto',
+ 'ddo': 'ddo',
+ 'hha': 'hha',
+ 'bba': 'bba',
+ 'ppa': 'ppa',
+ 'hhi': 'hhi',
+ 'hhya': 'hhya',
+ 'hhyu': 'hhyu',
+ 'hhyo': 'hhyo',
+ 'bbi': 'bbi',
+ 'bbya': 'bbya',
+ 'bbyu': 'bbyu',
+ 'bbyo': 'bbyo',
+ 'ppi': 'ppi',
+ 'ppya': 'ppya',
+ 'ppyu': 'ppyu',
+ 'ppyo': 'ppyo',
+ 'hhu': 'ffu',
+ 'ffa': 'ffa',
+ 'ffi': 'ffi',
+ 'ffe': 'ffe',
+ 'ffo': 'ffo',
+ 'bbu': 'bbu',
+ 'ppu': 'ppu',
+ 'hhe': 'hhe',
+ 'bbe': 'bbe',
+ 'ppe': 'ppe',
+ 'hho': 'hho',
+ 'bbo': 'bbo',
+ 'ppo': 'ppo',
+ 'yya': 'yya',
+ 'yyu': 'yyu',
+ 'yyo': 'yyo',
+ 'rra': 'rra',
+ 'rri': 'rri',
+ 'rrya': 'rrya',
+ 'rryu': 'rryu',
+ 'rryo': 'rryo',
+ 'rru': 'rru',
+ 'rre': 'rre',
+ 'rro': 'rro',
+ 'tu': 'tsu',
+ 'du': 'du',
+ 'te': 'te',
+ 'de': 'de',
+ 'to': 'to',
+ 'do': 'do',
+ 'na': 'na',
+ 'ni': 'ni',
+ 'nya': 'nya',
+ 'nyu': 'nyu',
+ 'nyo': 'nyo',
+ 'nu': 'nu',
+ 'ne': 'ne',
+ 'no': 'no',
+ 'ha': 'ha',
+ 'ba': 'ba',
+ 'pa': 'pa',
+ 'hi': 'hi',
+ 'hya': 'hya',
+ 'hyu': 'hyu',
+ 'hyo': 'hyo',
+ 'bi': 'bi',
+ 'bya': 'bya',
+ 'byu': 'byu',
+ 'byo': 'byo',
+ 'pi': 'pi',
+ 'pya': 'pya',
+ 'pyu': 'pyu',
+ 'pyo': 'pyo',
+ 'hu': 'fu',
+ 'fa': 'fa',
+ 'fi': 'fi',
+ 'fe': 'fe',
+ 'fo': 'fo',
+ 'bu': 'bu',
+ 'pu': 'pu',
+ 'he': 'he',
+ 'be': 'be',
+ 'pe': 'pe',
+ 'ho': 'ho',
+ 'bo': 'bo',
+ 'po': 'po',
+ 'ma': 'ma',
+ 'mi': 'mi',
+ 'mya': 'mya',
+ 'myu': 'myu',
+ 'myo': 'myo',
+ 'mu': 'mu',
+ 'me': 'me',
+ 'mo': 'mo',
+ 'xya': 'xya',
+ 'ya': 'ya',
+ 'xyu': 'xyu',
+ 'yu': 'yu',
+ 'xyo': 'xyo',
+ 'yo': 'yo',
+ 'ra': 'ra',
+ 'ri': 'ri',
+ 'rya': 'rya',
+ 'ryu': 'ryu',
+ 'ryo': 'ryo',
+ 'ru': 'ru',
+ 're': 're',
+ 'ro': 'ro',
+ 'xwa': 'xwa',
+ 'wa': 'wa',
+ 'wi': 'wi',
+ 'we': 'we',
+ 'wo': 'wo',
+ 'n': 'n',
+ "n'": "n'",
+ 'dyi': 'dyi',
+ '-': '-',
+ 'tye': 'che',
+ 'ttye': 'cche',
+ 'zye': 'je'}
+
+TO_KUNREI_H = {'xa': 'xa',
+ 'a': 'a',
+ 'xi': 'xi',
+ 'i': 'i',
+ 'xu': 'xu',
+ 'u': 'u',
+ 'vu': 'vu',
+ 'va': 'va',
+ 'vi': 'vi',
+ 've': 've',
+ 'vo': 'vo',
+ 'xe': 'xe',
+ 'e': 'e',
+ 'xo': 'xo',
+ 'o': 'o',
+ 'ka': 'ka',
+ 'ga': 'ga',
+ 'ki': 'ki',
+ 'kya': 'kya',
+ 'kyu': 'kyu',
+ 'kyo': 'kyo',
+ 'gi': 'gi',
+ 'gya': 'gya',
+ 'gyu': 'gyu',
+ 'gyo': 'gyo',
+ 'ku': 'ku',
+ 'gu': 'gu',
+ 'ke': 'ke',
+ 'ge': 'ge',
+ 'ko': 'ko',
+ 'go': 'go',
+ 'sa': 'sa',
+ 'za': 'za',
+ 'shi': 'si',
+ 'sha': 'sya',
+ 'shu': 'syu',
+ 'sho': 'syo',
+ 'ji': 'zi',
+ 'ja': 'zya',
+ 'ju': 'zyu',
+ 'jo': 'zyo',
+ 'su': 'su',
+ 'zu': 'zu',
+ 'se': 'se',
+ 'ze': 'ze',
+ 'so': 'so',
+ 'zo': 'zo',
+ 'ta': 'ta',
+ 'da': 'da',
+ 'chi': 'ti',
+ 'cha': 'tya',
+ 'chu': 'tyu',
+ 'cho': 'tyo',
+ 'di': 'di',
+ 'dya': 'dya',
+ 'dyu': 'dyu',
+ 'dyo': 'dyo',
+ 'xtsu': 'xtu',
+ 'vvu': 'vvu',
+ 'vva': 'vva',
+ 'vvi': 'vvi',
+ 'vve': 'vve',
+ 'vvo': 'vvo',
+ 'kka': 'kka',
+ 'gga': 'gga',
+ 'kki': 'kki',
+ 'kkya': 'kkya',
+ 'kkyu': 'kkyu',
+ 'kkyo': 'kkyo',
+ 'ggi': 'ggi',
+ 'ggya': 'ggya',
+ 'ggyu': 'ggyu',
+ 'ggyo': 'ggyo',
+ 'kku': 'kku',
+ 'ggu': 'ggu',
+ 'kke': 'kke',
+ 'gge': 'gge',
+ 'kko': 'kko',
+ 'ggo': 'ggo',
+ 'ssa': 'ssa',
+ 'zza': 'zza',
+ 'sshi': 'ssi',
+ 'ssha': 'ssya',
+ 'sshu': 'ssyu',
+ 'ssho': 'ssyo',
+ 'jji': 'zzi',
+ 'jja': 'zzya',
+ 'jju': 'zzyu',
+ 'jjo': 'zzyo',
+ 'ssu': 'ssu',
+ 'zzu': 'zzu',
+ 'sse': 'sse',
+ 'zze': 'zze',
+ 'sso': 'sso',
+ 'zzo': 'zzo',
+ 'tta': 'tta',
+ 'dda': 'dda',
+ 'cchi': 'tti',
+ 'ccha': 'ttya',
+ 'cchu': 'ttyu',
+ 'ccho': 'ttyo',
+ 'ddi': 'ddi',
+ 'ddya': 'ddya',
+ 'ddyu': 'ddyu',
+ 'ddyo': 'ddyo',
+ 'ttsu': 'ttu',
+ 'ddu': 'ddu',
+ 'tte': 'tte',
+ 'dde': 'dde',
+ 'tto': 'tto',
+ 'ddo': 'ddo',
+ 'hha': 'hha',
+ 'bba': 'bba',
+ 'ppa': 'ppa',
+ 'hhi': 'hhi',
+ 'hhya': 'hhya',
+ 'hhyu': 'hhyu',
+ 'hhyo': 'hhyo',
+ 'bbi': 'bbi',
+ 'bbya': 'bbya',
+ 'bbyu': 'bbyu',
+ 'bbyo': 'bbyo',
+ 'ppi': 'ppi',
+ 'ppya': 'ppya',
+ 'ppyu': 'ppyu',
+ 'ppyo': 'ppyo',
+ 'ffu': 'hhu',
+ 'ffa': 'ffa',
+ 'ffi': 'ffi',
+ 'ffe': 'ffe',
+ 'ffo': 'ffo',
+ 'bbu': 'bbu',
+ 'ppu': 'ppu',
+ 'hhe': 'hhe',
+ 'bbe': 'bbe',
+ 'ppe': 'ppe',
+ 'hho': 'hho',
+ 'bbo': 'bbo',
+ 'ppo': 'ppo',
+ 'yya': 'yya',
+ 'yyu': 'yyu',
+ 'yyo': 'yyo',
+ 'rra': 'rra',
+ 'rri': 'rri',
+ 'rrya': 'rrya',
+ 'rryu': 'rryu',
+ 'rryo': 'rryo',
+ 'rru': 'rru',
+ 'rre': 'rre',
+ 'rro': 'rro',
+ 'tsu': 'tu',
+ 'du': 'du',
+ 'te': 'te',
+ 'de': 'de',
+ 'to': 'to',
+ 'do': 'do',
+ 'na': 'na',
+ 'ni': 'ni',
+ 'nya': 'nya',
+ 'nyu': 'nyu',
+ 'nyo': 'nyo',
+ 'nu': 'nu',
+ 'ne': 'ne',
+ 'no': 'no',
+ 'ha': 'ha',
+ 'ba': 'ba',
+ 'pa': 'pa',
+ 'hi': 'hi',
+ 'hya': 'hya',
+ 'hyu': 'hyu',
+ 'hyo': 'hyo',
+ 'bi': 'bi',
+ 'bya': 'bya',
+ 'byu': 'byu',
+ 'byo': 'byo',
+ 'pi': 'pi',
+ 'pya': 'pya',
+ 'pyu': 'pyu',
+ 'pyo': 'pyo',
+ 'fu': 'hu',
+ 'fa': 'fa',
+ 'fi': 'fi',
+ 'fe': 'fe',
+ 'fo': 'fo',
+ 'bu': 'bu',
+ 'pu': 'pu',
+ 'he': 'he',
+ 'be': 'be',
+ 'pe': 'pe',
+ 'ho': 'ho',
+ 'bo': 'bo',
+ 'po': 'po',
+ 'ma': 'ma',
+ 'mi': 'mi',
+ 'mya': 'mya',
+ 'myu': 'myu',
+ 'myo': 'myo',
+ 'mu': 'mu',
+ 'me': 'me',
+ 'mo': 'mo',
+ 'xya': 'xya',
+ 'ya': 'ya',
+ 'xyu': 'xyu',
+ 'yu': 'yu',
+ 'xyo': 'xyo',
+ 'yo': 'yo',
+ 'ra': 'ra',
+ 'ri': 'ri',
+ 'rya': 'rya',
+ 'ryu': 'ryu',
+ 'ryo': 'ryo',
+ 'ru': 'ru',
+ 're': 're',
+ 'ro': 'ro',
+ 'xwa': 'xwa',
+ 'wa': 'wa',
+ 'wi': 'wi',
+ 'we': 'we',
+ 'wo': 'wo',
+ 'n': 'n',
+ "n'": "n'",
+ 'dyi': 'dyi',
+ '-': '-',
+ 'che': 'tye',
+ 'cche': 'ttye',
+ 'je': 'zye'}
+
+ROMTRIE_NODES_H = {'x': {'a': {'': 'ぁ'},
+       'i': {'': 'ぃ'},
+       'u': {'': 'ぅ'},
+       'e': {'': 'ぇ'},
+       'o': {'': 'ぉ'},
+       't': {'u': {'': 'っ'}, 's': {'u': {'': 'っ'}}},
+       'y': {'a': {'': 'ゃ'}, 'u': {'': 'ゅ'}, 'o': {'': 'ょ'}},
+       'w': {'a': {'': 'ゎ'}}},
+ 'a': {'': 'あ'},
+ 'i': {'': 'い'},
+ 'u': {'': 'う'},
+ 'v': {'u': {'': 'う゛'},
+       'a': {'': 'う゛ぁ'},
+       'i': {'': 'う゛ぃ'},
+       'e': {'': 'う゛ぇ'},
+       'o': {'': 'う゛ぉ'},
+       'v': {'u': {'': 'っう゛'}, 'a': {'': 'っう゛ぁ'}, 'i': {'': 'っう゛ぃ'}, 'e': {'': 'っう゛ぇ'}, 'o': {'': 'っう゛ぉ'}}},
+ 'e': {'': 'え'},
+ 'o': {'': 'お'},
+ 'k': {'a': {'': 'か'},
+       'i': {'': 'き'},
+       'y': {'a': {'': 'きゃ'}, 'u': {'': 'きゅ'}, 'o': {'': 'きょ'}},
+       'u': {'': 'く'},
+       'e': {'': 'け'},
+       'o': {'': 'こ'},
+       'k': {'a': {'': 'っか'},
+             'i': {'': 'っき'},
+             'y': {'a': {'': 'っきゃ'}, 'u': {'': 'っきゅ'}, 'o': {'': 'っきょ'}},
+             'u': {'': 'っく'},
+             'e': {'': 'っけ'},
+             'o': {'': 'っこ'}}},
+ 'g': {'a': {'': 'が'},
+       'i': {'': 'ぎ'},
+       'y': {'a': {'': 'ぎゃ'}, 'u': {'': 'ぎゅ'}, 'o': {'': 'ぎょ'}},
+       'u': {'': 'ぐ'},
+       'e': {'': 'げ'},
+       'o': {'': 'ご'},
+       'g': {'a': {'': 'っが'},
+             'i': {'': 'っぎ'},
+             'y': {'a': {'': 'っぎゃ'}, 'u': {'': 'っぎゅ'}, 'o': {'': 'っぎょ'}},
+             'u': {'': 'っぐ'},
+             'e': {'': 'っげ'},
+             'o': {'': 'っご'}}},
+ 's': {'a': {'': 'さ'},
+       'i': {'': 'し'},
+       'y': {'a': {'': 'しゃ'}, 'u': {'': 'しゅ'}, 'o': {'': 'しょ'}},
+       'u': {'': 'す'},
+       'e': {'': 'せ'},
+       'o': {'': 'そ'},
+       's': {'a': {'': 'っさ'},
+             'i': {'': 'っし'},
+             'y': {'a': {'': 'っしゃ'}, 'u': {'': 'っしゅ'}, 'o': {'': 'っしょ'}},
+             'u': {'': 'っす'},
+             'e': {'': 'っせ'},
+             'o': {'': 'っそ'},
+             'h': {'i': {'': 'っし'}, 'a': {'': 'っしゃ'}, 'u': {'': 'っしゅ'}, 'o': {'': 'っしょ'}}},
+       'h': {'i': {'': 'し'}, 'a': {'': 'しゃ'}, 'u': {'': 'しゅ'}, 'o': {'': 'しょ'}}},
+ 'z': {'a': {'': 'ざ'},
+       'i': {'': 'じ'},
+       'y': {'a': {'': 'じゃ'}, 'u': {'': 'じゅ'}, 'o': {'': 'じょ'}, 'e': {'': 'じぇ'}},
+       'u': {'': 'ず'},
+       'e': {'': 'ぜ'},
+       'o': {'': 'ぞ'},
+       'z': {'a': {'': 'っざ'},
+             'i': {'': 'っじ'},
+             'y': {'a': {'': 'っじゃ'}, 'u': {'': 'っじゅ'}, 'o': {'': 'っじょ'}},
+             'u': {'': 'っず'},
+             'e': {'': 'っぜ'},
+             'o': {'': 'っぞ'}}},
+ 't': {'a': {'': 'た'},
+       'i': {'': 'ち'},
+       'y': {'a': {'': 'ちゃ'}, 'u': {'': 'ちゅ'}, 'o': {'': 'ちょ'}, 'e': {'': 'ちぇ'}},
+       't': {'a': {'': 'った'},
+             'i': {'': 'っち'},
+             'y': {'a': {'': 'っちゃ'}, 'u': {'': 'っちゅ'}, 'o': {'': 'っちょ'}, 'e': {'': 'っちぇ'}},
+             'u': {'': 'っつ'},
+             'e': {'': 'って'},
+             'o': {'': 'っと'},
+             's': {'u': {'': 'っつ'}}},
+       'u': {'': 'つ'},
+       'e': {'': 'て'},
+       'o': {'': 'と'},
+       's': {'u': {'': 'つ'}}},
+ 'd': {'a': {'': 'だ'},
+       'i': {'': 'ぢ'},
+       'y': {'a': {'': 'ぢゃ'}, 'u': {'': 'ぢゅ'}, 'o': {'': 'ぢょ'}, 'i': {'': 'でぃ'}},
+       'd': {'a': {'': 'っだ'},
+             'i': {'': 'っぢ'},
+             'y': {'a': {'': 'っぢゃ'}, 'u': {'': 'っぢゅ'}, 'o': {'': 'っぢょ'}},
+             'u': {'': 'っづ'},
+             'e': {'': 'っで'},
+             'o': {'': 'っど'}},
+       'u': {'': 'づ'},
+       'e': {'': 'で'},
+       'o': {'': 'ど'}},
+ 'h': {'h': {'a': {'': 'っは'},
+             'i': {'': 'っひ'},
+             'y': {'a': {'': 'っひゃ'}, 'u': {'': 'っひゅ'}, 'o': {'': 'っひょ'}},
+             'u': {'': 'っふ'},
+             'e': {'': 'っへ'},
+             'o': {'': 'っほ'}},
+       'a': {'': 'は'},
+       'i': {'': 'ひ'},
+       'y': {'a': {'': 'ひゃ'}, 'u': {'': 'ひゅ'}, 'o': {'': 'ひょ'}},
+       'u': {'': 'ふ'},
+       'e': {'': 'へ'},
+       'o': {'': 'ほ'}},
+ 'b': {'b': {'a': {'': 'っば'},
+             'i': {'': 'っび'},
+             'y': {'a': {'': 'っびゃ'}, 'u': {'': 'っびゅ'}, 'o': {'': 'っびょ'}},
+             'u': {'': 'っぶ'},
+             'e': {'': 'っべ'},
+             'o': {'': 'っぼ'}},
+       'a': {'': 'ば'},
+       'i': {'': 'び'},
+       'y': {'a': {'': 'びゃ'}, 'u': {'': 'びゅ'}, 'o': {'': 'びょ'}},
+       'u': {'': 'ぶ'},
+       'e': {'': 'べ'},
+       'o': {'': 'ぼ'}},
+ 'p': {'p': {'a': {'': 'っぱ'},
+             'i': {'': 'っぴ'},
+             'y': {'a': {'': 'っぴゃ'}, 'u': {'': 'っぴゅ'}, 'o': {'': 'っぴょ'}},
+             'u': {'': 'っぷ'},
+             'e': {'': 'っぺ'},
+             'o': {'': 'っぽ'}},
+       'a': {'': 'ぱ'},
+       'i': {'': 'ぴ'},
+       'y': {'a': {'': 'ぴゃ'}, 'u': {'': 'ぴゅ'}, 'o': {'': 'ぴょ'}},
+       'u': {'': 'ぷ'},
+       'e': {'': 'ぺ'},
+       'o': {'': 'ぽ'}},
+ 'f': {'f': {'a': {'': 'っふぁ'}, 'i': {'': 'っふぃ'}, 'e': {'': 'っふぇ'}, 'o': {'': 'っふぉ'}, 'u': {'': 'っふ'}},
+       'a': {'': 'ふぁ'},
+       'i': {'': 'ふぃ'},
+       'e': {'': 'ふぇ'},
+       'o': {'': 'ふぉ'},
+       'u': {'': 'ふ'}},
+ 'y': {'y': {'a': {'': 'っや'}, 'u': {'': 'っゆ'}, 'o': {'': 'っよ'}}, 'a': {'': 'や'}, 'u': {'': 'ゆ'}, 'o': {'': 'よ'}},
+ 'r': {'r': {'a': {'': 'っら'},
+             'i': {'': 'っり'},
+             'y': {'a': {'': 'っりゃ'}, 'u': {'': 'っりゅ'}, 'o': {'': 'っりょ'}},
+             'u': {'': 'っる'},
+             'e': {'': 'っれ'},
+             'o': {'': 'っろ'}},
+       'a': {'': 'ら'},
+       'i': {'': 'り'},
+       'y': {'a': {'': 'りゃ'}, 'u': {'': 'りゅ'}, 'o': {'': 'りょ'}},
+       'u': {'': 'る'},
+       'e': {'': 'れ'},
+       'o': {'': 'ろ'}},
+ 'n': {'a': {'': 'な'},
+       'i': {'': 'に'},
+       'y': {'a': {'': 'にゃ'}, 'u': {'': 'にゅ'}, 'o': {'': 'にょ'}},
+       'u': {'': 'ぬ'},
+       'e': {'': 'ね'},
+       'o': {'': 'の'},
+       '': 'ん',
+       "'": {'': 'ん'}},
+ 'm': {'a': {'': 'ま'},
+       'i': {'': 'み'},
+       'y': {'a': {'': 'みゃ'}, 'u': {'': 'みゅ'}, 'o': {'': 'みょ'}},
+       'u': {'': 'む'},
+       'e': {'': 'め'},
+       'o': {'': 'も'}},
+ 'w': {'a': {'': 'わ'}, 'i': {'': 'うぃ'}, 'e': {'': 'うぇ'}, 'o': {'': 'を'}},
+ '-': {'': 'ー'},
+ 'j': {'i': {'': 'じ'},
+       'a': {'': 'じゃ'},
+       'u': {'': 'じゅ'},
+       'o': {'': 'じょ'},
+       'j': {'i': {'': 'っじ'}, 'a': {'': 'っじゃ'}, 'u': {'': 'っじゅ'}, 'o': {'': 'っじょ'}},
+       'e': {'': 'じぇ'}},
+ 'c': {'h': {'i': {'': 'ち'}, 'a': {'': 'ちゃ'}, 'u': {'': 'ちゅ'}, 'o': {'': 'ちょ'}, 'e': {'': 'ちぇ'}},
+       'c': {'h': {'i': {'': 'っち'}, 'a': {'': 'っちゃ'}, 'u': {'': 'っちゅ'}, 'o': {'': 'っちょ'}, 'e': {'': 'っちぇ'}}}}}
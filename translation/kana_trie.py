@@ -0,0 +1,136 @@
+import re
+
+# Key under which a trie node stores the kana for the romaji spelled by its path.
+# No romaji key contains the empty string as a character, so it cannot clash.
+_VALUE = ""
+_REDUNDANT_APOSTROPHE = re.compile("n'(?=[^aiueoyn]|$)")
+
+
+class KanaTrie:
+    """Convert romaji to kana in one left-to-right pass.
+
+    At each position the longest romaji key that matches is replaced by its kana and
+    characters that start no key are copied through, which is exactly what a regex
+    alternation of all keys sorted longest-first does, without trying every
+    alternative at every position.
+    """
+
+    def __init__(self, table: dict[str, str]):
+        self._root: dict = {}
+        for roma, kana in table.items():
+            node = self._root
+            for char in roma:
+                node = node.setdefault(char, {})
+            node[_VALUE] = kana
+
+    @classmethod
+    def from_nodes(cls, nodes: dict) -> "KanaTrie":
+        """A trie over nodes built before, such as the generated ``kana_tables``."""
+        trie = cls({})
+        trie._root = nodes
+        return trie
+
+    @property
+    def nodes(self) -> dict:
+        """The root node: nested dicts keyed by character, kana under the empty string."""
+        return self._root
+
+    def convert(self, text: str) -> str:
+        """Convert romaji to kana exactly like ``to_hiragana``/``to_katakana`` used to.
+
+        The double n normalization of ``normalize_double_n`` is applied with a plain
+        string replace; its apostrophe clean-up only runs when there is an ``n'`` left.
+        """
+        return "".join(self.scan(self.normalize(text))[0])
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lower-case text and normalize its double n, as ``convert`` does first."""
+        text = text.lower().replace("nn", "n'")
+        if "n'" in text:
+            text = _REDUNDANT_APOSTROPHE.sub("n", text)
+        return text
+
+    def replace(self, text: str) -> str:
+        """Convert normalized text like ``scan``, without tracking which pieces are settled."""
+        root = self._root
+        parts = []
+        append = parts.append
+        length = len(text)
+        i = 0
+        while i < length:
+            node = root.get(text[i])
+            if node is None:
+                append(text[i])
+                i += 1
+                continue
+            value = node.get(_VALUE)
+            end = i + 1
+            j = end
+            while j < length:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if _VALUE in node:
+                    value = node[_VALUE]
+                    end = j
+            if value is None:
+                append(text[i])
+                i += 1
+            else:
+                append(value)
+                i = end
+        return "".join(parts)
+
+    def scan(self, text: str) -> tuple[list[str], int, int]:
+        """Convert text that is already lower-cased and double-n normalized.
+
+        Returns the kana pieces, how many leading pieces no further input appended to
+        ``text`` could change, and how many characters of ``text`` those pieces cover.
+        A piece is settled once the trie walk for it stopped on a character that
+        continues no key, or reached a key that is not the start of a longer one.
+        """
+        root = self._root
+        parts = []
+        append = parts.append
+        length = len(text)
+        settled_parts = 0
+        settled_length = 0
+        all_settled = True
+        i = 0
+        while i < length:
+            node = root.get(text[i])
+            if node is None:
+                append(text[i])
+                i += 1
+            else:
+                value = node.get(_VALUE)
+                end = i + 1
+                j = end
+                while True:
+                    if j == length:
+                        complete = len(node) - (_VALUE in node) == 0
+                        break
+                    child = node.get(text[j])
+                    if child is None:
+                        complete = True
+                        break
+                    node = child
+                    j += 1
+                    if _VALUE in node:
+                        value = node[_VALUE]
+                        end = j
+                all_settled = all_settled and complete
+
+                if value is None:
+                    append(text[i])
+                    i += 1
+                else:
+                    append(value)
+                    i = end
+
+            if all_settled:
+                settled_parts = len(parts)
+                settled_length = i
+        return parts, settled_parts, settled_length
@@ -0,0 +1,124 @@
+import re
+from typing import Sequence
+
+import numpy as np
+
+from spaced_repetition.card_data import CardData
+import translation.romaji_to_kana as romkan
+
+# Katakana (ァ..ヶ) to the hiragana at the same position of the hiragana block.
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(ord("ァ"), ord("ヶ") + 1)}
+
+# Every card is one line of the haystack made of its fields, each preceded by a marker:
+# _PLAIN fields are searched with the query as typed, _KANA fields with its kana forms.
+_PLAIN = "\x01"
+_KANA = "\x02"
+
+
+def normalize_kana(text: str) -> str:
+    """Lower-case text with katakana folded onto hiragana."""
+    return text.lower().translate(_KATAKANA_TO_HIRAGANA)
+
+
+def _subsequence_pattern(query: str) -> str:
+    """Regex matching a field that contains the characters of ``query`` in order.
+
+    Each character is reached by skipping everything that is not that character, so the
+    earliest occurrence is taken and a failed field is rejected without backtracking
+    into other choices. This is ``fuzzy_match`` on one field.
+    """
+    return "".join(f"[^{_PLAIN}{_KANA}\\n{re.escape(char)}]*{re.escape(char)}" for char in query)
+
+
+class SearchIndex:
+    """Fuzzy search over the japanese, reading and english of a deck's cards.
+
+    A card matches when ``fuzzy_match`` accepts the query for its japanese, reading or
+    english, or the query's kana conversion for its reading, where kana is compared
+    with katakana and hiragana treated alike. The fields are lower-cased and
+    normalized once, the query is converted once per search, and a query that only
+    extends the previous one is looked up among the previous matches.
+    """
+
+    def __init__(self, cards: Sequence[CardData]):
+        self._card_texts: list[str] = []
+        # Cards indexed together share a haystack, one line per card:
+        # (index of the first card, haystack, offset of each line in it).
+        self._chunks: list[tuple[int, str, np.ndarray]] = []
+        self._last_terms: tuple[str, ...] = ("",)
+        self._last_pattern: re.Pattern | None = None
+        self._last_matches: list[int] = []
+        self.add_cards(cards)
+
+    def __len__(self) -> int:
+        return len(self._card_texts)
+
+    def add_cards(self, cards: Sequence[CardData]) -> list[int]:
+        """Index more cards, numbered after the ones already indexed.
+
+        Only the new cards are processed. Returns the indices of those that match the
+        last query searched, which also keeps that query's matches complete for the
+        next narrowing search.
+        """
+        first = len(self._card_texts)
+        texts = [
+            "".join((
+                _PLAIN + card_data.japanese.lower(),
+                _PLAIN + card_data.reading.lower(),
+                _PLAIN + card_data.english.lower(),
+                _KANA + normalize_kana(card_data.reading),
+            ))
+            for card_data in cards
+        ]
+        if not texts:
+            return []
+        self._card_texts.extend(texts)
+        chunk = (first, "\n".join(texts), np.cumsum([0] + [len(text) + 1 for text in texts[:-1]]))
+        self._chunks.append(chunk)
+
+        if self._last_pattern is None:
+            matches = list(range(first, len(self._card_texts)))
+        else:
+            matches = self._scan_chunk(self._last_pattern, chunk)
+        self._last_matches = self._last_matches + matches
+        return matches
+
+    def search(self, query: str) -> list[int]:
+        """Indices of the cards matching ``query``, in deck order."""
+        plain = query.lower()
+        if not plain:
+            terms = ("",)
+            pattern = None
+            matches = list(range(len(self)))
+        else:
+            kana = tuple(dict.fromkeys(normalize_kana(convert(query)) for convert in (romkan.to_hiragana, romkan.to_katakana)))
+            terms = (plain,) + kana
+            # The trailing [^\n]* consumes the rest of the card, so each card matches once.
+            pattern = re.compile(
+                f"(?:{_PLAIN}{_subsequence_pattern(plain)}|{_KANA}(?:{'|'.join(map(_subsequence_pattern, kana))}))[^\\n]*"
+            )
+            if self._extends_last(terms):
+                matches = [i for i in self._last_matches if pattern.search(self._card_texts[i])]
+            else:
+                matches = [i for chunk in self._chunks for i in self._scan_chunk(pattern, chunk)]
+
+        self._last_terms = terms
+        self._last_pattern = pattern
+        self._last_matches = matches
+        return matches
+
+    def _extends_last(self, terms: tuple[str, ...]) -> bool:
+        """Whether every term extends a term of the last search, so its matches are a subset."""
+        last_plain, *last_kana = self._last_terms
+        if not last_plain:
+            return False # Narrowing down from every card is no faster than a scan
+        plain, *kana = terms
+        return plain.startswith(last_plain) and all(
+            any(term.startswith(last) for last in last_kana) for term in kana
+        )
+
+    @staticmethod
+    def _scan_chunk(pattern: re.Pattern, chunk: tuple[int, str, np.ndarray]) -> list[int]:
+        first, haystack, line_starts = chunk
+        starts = np.fromiter((match.start() for match in pattern.finditer(haystack)), dtype=np.int64)
+        return (np.searchsorted(line_starts, starts, side="right") - 1 + first).tolist()